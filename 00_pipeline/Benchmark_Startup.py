@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Benchmark Worker Startup
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.7+ or Anaconda Python 3.8+ installation. Run in each interpreter used by the pipeline.
+# Description: "Benchmark Worker Startup" measures the time to import the repository functions needed by typical worker processes in fresh interpreters and lists the heavy dependencies (e.g., arcpy, sklearn, matplotlib) that each import loads, so that regressions in the lazy package initialization are visible.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import statistics
+import subprocess
+import sys
+
+# Define number of fresh interpreters per worker type
+repeats = 5
+
+# Define the import statements of each worker type
+worker_imports = {'pipeline runner': 'from package_Pipeline import run_pipeline',
+                  'geoprocessing job': 'from package_GeospatialProcessing import execute_geoprocessing_job',
+                  'raster statistics': 'from package_GeospatialProcessing import describe_raster',
+                  'prediction worker': 'from package_Statistics import predict_habitat_selection, read_text_value',
+                  'all functions': 'from package_GeospatialProcessing import *; from package_Statistics import *'}
+
+# Define heavy dependencies to report
+heavy_modules = ['arcpy', 'matplotlib', 'numpy', 'pandas', 'rasterio', 'scipy', 'sklearn']
+
+#### RUN BENCHMARK
+
+# Define the repository folder so that the interpreters can import the repository packages
+repository_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+environment = dict(os.environ)
+environment['PYTHONPATH'] = os.pathsep.join(
+    [repository_folder] + [path for path in [os.environ.get('PYTHONPATH')] if path])
+
+# Import each worker type in fresh interpreters and read the import times
+print(f'Benchmarking worker startup in {sys.executable} ({repeats} interpreters per worker type)...')
+print('----------')
+for worker_type, import_statement in worker_imports.items():
+    repository_times = []
+    loaded_modules = set()
+    for repeat in range(repeats):
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', import_statement],
+                                 cwd=repository_folder,
+                                 env=environment,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE,
+                                 universal_newlines=True)
+        if process.returncode != 0:
+            print(f'Import for {worker_type} failed:')
+            print(process.stderr.strip().splitlines()[-1])
+            break
+        # Sum the cumulative times of repository modules imported directly by the statement
+        repository_time = 0
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            self_time, cumulative_time, module_name = line[len('import time:'):].split('|')
+            top_module = module_name.strip().split('.')[0]
+            if top_module in heavy_modules:
+                loaded_modules.add(top_module)
+            is_top_level = len(module_name) - len(module_name.lstrip()) == 1
+            if is_top_level and top_module.startswith('package_'):
+                repository_time += int(cumulative_time)
+        repository_times.append(repository_time / 1000)
+    if len(repository_times) < repeats:
+        print('----------')
+        continue
+    # Report median import time and loaded dependencies
+    loaded_text = ', '.join(sorted(loaded_modules)) if len(loaded_modules) > 0 else 'none'
+    print(f'{worker_type}: {statistics.median(repository_times):.1f} ms median import time')
+    print(f'\tStatement: {import_statement}')
+    print(f'\tHeavy dependencies loaded: {loaded_text}')
+    print('----------')
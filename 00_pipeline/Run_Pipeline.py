@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Run Processing Pipeline
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with ArcGIS Pro installed on the same machine. Add '--dry-run' to print the plan without running any stage. Add '--force' followed by stage names to rerun stages regardless of their state.
+# Description: "Run Processing Pipeline" declares the inputs, outputs, and parameters of the numbered Python scripts and runs the scripts for which the script, a parameter, or the content of an input has changed or an output is missing. Independent stages run concurrently. Selection is predicted tile by tile from the covariate cube into the predicted raster tiles that the merge R script mosaics. The R scripts that prepare the path distributions and merged rasters and the Python script that creates the home range hulls are not included as stages; their outputs are treated as external inputs so that changes to them still cause the dependent stages to rerun. The path stages write to the local path project folders, so the path covariate table used for model training is also an external input.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+from package_Pipeline import define_pipeline_stage
+from package_Pipeline import run_pipeline
+
+# Define pipeline parameters
+drive = 'N:/'
+round_date = 'round_20210820'
+version = 'version_1.2_20210820'
+
+# Define maximum number of concurrent stages
+max_workers = 2
+
+# Define interpreters
+arcgis_python = 'C:/Program Files/ArcGIS/Pro/bin/Python/envs/arcgispro-py3/python.exe'
+anaconda_python = sys.executable
+
+#### SET UP DIRECTORIES, FILES, AND FIELDS
+
+# Set root directory
+root_folder = 'ACCS_Work'
+
+# Define repository folder
+repository_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Define data folders
+data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
+topography_folder = os.path.join(drive, root_folder, 'Data/topography/Composite_10m_Beringia/integer/gridded_select')
+vegetation_folder = os.path.join(drive, root_folder,
+                                 'Projects/VegetationEcology/AKVEG_QuantitativeMap/Data/Data_Output/rasters_final/round_20210402')
+model_folder = os.path.join(data_folder, 'Data_Output/model_results', round_date)
+store_folder = os.path.join(model_folder, 'result_store')
+raster_folder = os.path.join(data_folder, 'Data_Output/predicted_rasters', round_date)
+merged_folder = os.path.join(data_folder, 'Data_Output/rasters_merged', round_date)
+package_folder = os.path.join(data_folder, 'Data_Output/data_package', version)
+analysis_folder = os.path.join(data_folder, 'Data_Output/analysis_rasters', round_date)
+cube_folder = os.path.join(data_folder, 'Data_Input/covariate_cube')
+work_geodatabase = os.path.join(data_folder, 'Moose_SouthwestAlaska.gdb')
+
+# Define the local folders of the path scripts
+paths_folder = 'C:/ACCS_Work/Projects/Moose_SouthwestAlaska'
+paths_geodatabase = 'C:/ACCS_Work/GMU_17_Moose/GIS/Moose_SouthwestAlaska.gdb'
+
+# Define pipeline state and logs
+state_file = os.path.join(data_folder, 'Data_Output/pipeline', round_date, 'pipeline_state.json')
+log_folder = os.path.join(data_folder, 'Data_Output/pipeline', round_date, 'logs')
+
+# Define shared inputs
+study_area = os.path.join(data_folder, 'Data_Input/southwestAlaska_StudyArea.tif')
+raster_nlcd = os.path.join(drive, root_folder,
+                           'Data/biota/vegetation/Alaska_NationalLandCoverDatabase/Alaska_NationalLandCoverDatabase_2016_20200213.img')
+
+# Define major grids
+grids_major = ['C5', 'C6', 'D5', 'D6', 'E5']
+
+# Define map groups
+map_groups = ['alnus', 'betshr', 'dectre', 'dryas', 'empnig', 'erivag', 'picgla', 'picmar', 'rhoshr', 'salshr', 'sphagn', 'vaculi',
+              'vacvit', 'wetsed']
+
+# Define parameters for each set of stages
+drive_parameters = {'drive': drive}
+round_parameters = {'drive': drive, 'round_date': round_date}
+version_parameters = {'drive': drive, 'round_date': round_date, 'version': version}
+
+# Define a function to list the iteration folders of a model
+def list_iteration_folders(response_folder):
+    return [os.path.join(response_folder, str(iteration).zfill(2)) for iteration in range(1, 51)]
+
+# Define a function to estimate the peak memory of a stage that holds whole study area grids in memory
+def estimate_grid_memory(bytes_per_cell):
+    if not os.path.exists(study_area):
+        return None
+    import rasterio
+    with rasterio.open(study_area) as study_raster:
+        return int(study_raster.width * study_raster.height * bytes_per_cell / 1024 ** 2)
+
+# Define the peak bytes per cell of the whole grid edge distance and distance to habitat stages
+edge_memory = estimate_grid_memory(28)
+distance_memory = estimate_grid_memory(40)
+
+#### DEFINE COVARIATE STAGES
+
+# Define topography stages
+topography_stages = []
+for covariate, script in [('elevation', '01_Covariate_Elevation.py'), ('roughness', '02_Covariate_Roughness.py')]:
+    covariate_tiles = [os.path.join(topography_folder,
+                                    f'Grid_{grid}/{covariate.capitalize()}_Composite_10m_Beringia_AKALB_Grid_{grid}.tif')
+                       for grid in grids_major]
+    topography_stages.append(define_pipeline_stage(f'topography_{covariate}',
+                                                   os.path.join(repository_folder, '02_data_topography', script),
+                                                   [study_area] + covariate_tiles,
+                                                   [os.path.join(data_folder, f'Data_Input/topography/{covariate}.tif')],
+                                                   parameters=drive_parameters,
+                                                   interpreter=arcgis_python))
+
+# Define hydrography stages
+hydrography_stages = [
+    define_pipeline_stage('hydrography_waterbody',
+                          os.path.join(repository_folder, '03_data_hydrography/01_Covariate_Waterbody.py'),
+                          [study_area,
+                           os.path.join(drive, root_folder, 'Data/inlandwaters/NHD_H_02_GDB.gdb/Hydrography/NHDWaterbody')],
+                          [os.path.join(data_folder, 'Data_Input/hydrography/lake.tif')],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python,
+                          intermediates=[os.path.join(data_folder, 'Data_Input/hydrography/lake_intermediate.tif*')]),
+    define_pipeline_stage('hydrography_mask',
+                          os.path.join(repository_folder, '03_data_hydrography/02_Mask_WaterIce.py'),
+                          [study_area, raster_nlcd],
+                          [os.path.join(data_folder, 'Data_Input/waterice_mask.tif')],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python)
+]
+
+# Define vegetation stages
+vegetation_tiles = [os.path.join(vegetation_folder, group, f'NorthAmericanBeringia_{group}_{grid}.tif')
+                    for group in map_groups for grid in grids_major]
+vegetation_stages = [
+    define_pipeline_stage('vegetation_cover',
+                          os.path.join(repository_folder, '04_data_vegetation/01_Covariate_Vegetation.py'),
+                          [study_area] + vegetation_tiles,
+                          [os.path.join(data_folder, 'Data_Input/vegetation', group + '.tif') for group in map_groups],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python),
+    define_pipeline_stage('vegetation_barren',
+                          os.path.join(repository_folder, '04_data_vegetation/02_Covariate_Barren.py'),
+                          [os.path.join(data_folder, 'Data_Input/southwestAlaska_ElevationMask_300.tif'), raster_nlcd],
+                          [os.path.join(data_folder, 'Data_Input/vegetation/barren.tif')],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python),
+    define_pipeline_stage('vegetation_forest_edge',
+                          os.path.join(repository_folder, '04_data_vegetation/03_Covariate_ForestEdge.py'),
+                          [study_area] + [os.path.join(data_folder, 'Data_Input/vegetation', group + '.tif')
+                                          for group in ['picgla', 'picmar', 'dectre']],
+                          [os.path.join(data_folder, 'Data_Input/vegetation/TreeCover.tif'),
+                           os.path.join(data_folder, 'Data_Input/edge_distance/southwestAlaska_ForestEdge.tif')],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python,
+                          memory_mb=edge_memory),
+    define_pipeline_stage('vegetation_tundra_edge',
+                          os.path.join(repository_folder, '04_data_vegetation/04_Covariate_TundraEdge.py'),
+                          [study_area] + [os.path.join(data_folder, 'Data_Input/vegetation', group + '.tif')
+                                          for group in ['erivag', 'dryas', 'barren']],
+                          [os.path.join(data_folder, 'Data_Input/vegetation/TundraCover.tif'),
+                           os.path.join(data_folder, 'Data_Input/edge_distance/southwestAlaska_TundraEdge.tif')],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python,
+                          memory_mb=edge_memory),
+    define_pipeline_stage('vegetation_edge_validation',
+                          os.path.join(repository_folder, '04_data_vegetation/05_Validate_EdgeDistance.py'),
+                          [study_area,
+                           os.path.join(data_folder, 'Data_Input/vegetation/TreeCover.tif'),
+                           os.path.join(data_folder, 'Data_Input/vegetation/TundraCover.tif'),
+                           os.path.join(data_folder, 'Data_Input/edge_distance/southwestAlaska_ForestEdge.tif'),
+                           os.path.join(data_folder, 'Data_Input/edge_distance/southwestAlaska_TundraEdge.tif')],
+                          [os.path.join(data_folder, 'Data_Input/edge_distance/validation/edge_distance_validation.csv')],
+                          parameters=drive_parameters,
+                          interpreter=arcgis_python)
+]
+
+#### DEFINE PATH AND GRID STAGES
+
+# Define path stages
+path_stages = [
+    define_pipeline_stage('paths_start_points',
+                          os.path.join(repository_folder, '06_data_paths/03-createRandomStartPoints.py'),
+                          [os.path.join(paths_geodatabase, 'convexHulls')],
+                          [os.path.join(paths_folder, 'Data_02_Pipeline/03-createRandomStartPoints/randomStartPts.csv')],
+                          interpreter=arcgis_python),
+    define_pipeline_stage('paths_random_paths',
+                          os.path.join(repository_folder, '06_data_paths/04-createRandomPaths.py'),
+                          [os.path.join(paths_folder, 'Data_03_Output/animalData/cleanedGPSCalvingSeason.csv'),
+                           os.path.join(paths_folder, 'Data_02_Pipeline/01-generateDistributions/randomRadians.csv'),
+                           os.path.join(paths_folder, 'Data_02_Pipeline/01-generateDistributions/randomDistances_calf0.csv'),
+                           os.path.join(paths_folder, 'Data_02_Pipeline/01-generateDistributions/randomDistances_calf1.csv'),
+                           os.path.join(paths_folder, 'Data_02_Pipeline/03-createRandomStartPoints/randomStartPts.csv')],
+                          [os.path.join(paths_folder, 'Data_02_Pipeline/04-createRandomPaths/allPaths.csv')],
+                          interpreter=anaconda_python),
+    define_pipeline_stage('paths_summarize',
+                          os.path.join(repository_folder, '06_data_paths/07-summarizeByPath.py'),
+                          [os.path.join(paths_folder, 'Data_02_Pipeline/04-createRandomPaths/allPaths.csv'),
+                           os.path.join(paths_folder, 'Data_01_Input/hydrography/lake.tif')]
+                          + [os.path.join(paths_folder, 'Data_01_Input', folder)
+                             for folder in ['topography', 'edge_distance', 'vegetation']],
+                          [os.path.join(paths_folder, 'Data_02_Pipeline/07-summarizeByPath/paths_meanCovariates.csv')],
+                          interpreter=anaconda_python)
+]
+
+# Define covariate cube stage
+cube_covariates = ([os.path.join(data_folder, 'Data_Input/topography', covariate + '.tif')
+                    for covariate in ['elevation', 'roughness']]
+                   + [os.path.join(data_folder, 'Data_Input/edge_distance', edge_raster)
+                      for edge_raster in ['southwestAlaska_ForestEdge.tif', 'southwestAlaska_TundraEdge.tif']]
+                   + [os.path.join(data_folder, 'Data_Input/vegetation', group + '.tif')
+                      for group in ['alnus', 'betshr', 'dectre', 'empnig', 'erivag', 'picgla', 'picmar', 'rhoshr',
+                                    'salshr', 'sphagn', 'vaculi', 'vacvit', 'wetsed']])
+grid_stages = [
+    define_pipeline_stage('grids_covariate_cube',
+                          os.path.join(repository_folder, '08_data_grids/02_Build_Covariate_Cube.py'),
+                          [study_area] + cube_covariates,
+                          [os.path.join(cube_folder, 'values.npy'), os.path.join(cube_folder, 'cube.json')],
+                          parameters=drive_parameters,
+                          interpreter=anaconda_python)
+]
+
+#### DEFINE STATISTICS STAGES
+
+# Define model stages for each calf status
+statistics_stages = []
+for calf_status, response_name in [(1, 'Calf'), (0, 'NoCalf')]:
+    response_folder = os.path.join(model_folder, response_name)
+    iteration_folders = list_iteration_folders(response_folder)
+    store_partitions = [os.path.join(store_folder, table_name, f'calf_status={calf_status}')
+                        for table_name in ['outer_results', 'importances']]
+    status_parameters = dict(round_parameters, calf_status=calf_status)
+    statistics_stages = statistics_stages + [
+        define_pipeline_stage(f'selection_train_{response_name.lower()}',
+                              os.path.join(repository_folder, '09_statistics_selection/02_Selection_TrainTest.py'),
+                              [os.path.join(data_folder, 'Data_Input/paths/paths_meanCovariates.csv')],
+                              iteration_folders + store_partitions + [
+                                  os.path.join(response_folder, f'report-moose-{response_name.lower()}.html'),
+                                  os.path.join(response_folder, 'importance_classifier_mdi.csv'),
+                                  os.path.join(response_folder, 'plots/importance_classifier_mdi.png')],
+                              parameters=status_parameters,
+                              interpreter=anaconda_python),
+        define_pipeline_stage(f'selection_predict_{response_name.lower()}',
+                              os.path.join(repository_folder, '09_statistics_selection/03_Selection_Predict_Tiles.py'),
+                              [os.path.join(cube_folder, 'values.npy'), os.path.join(cube_folder, 'cube.json')]
+                              + iteration_folders,
+                              [os.path.join(raster_folder, response_name)],
+                              parameters=status_parameters,
+                              interpreter=anaconda_python),
+        define_pipeline_stage(f'tree_sensitivity_{response_name.lower()}',
+                              os.path.join(repository_folder, '09_statistics_selection/08_Evaluate_TreeSensitivity.py'),
+                              iteration_folders + store_partitions,
+                              [os.path.join(response_folder, 'tree_sensitivity.csv'),
+                               os.path.join(response_folder, 'tree_sensitivity_summary.csv'),
+                               os.path.join(response_folder, 'plots/tree_sensitivity.png')],
+                              parameters=status_parameters,
+                              interpreter=anaconda_python)
+    ]
+
+# Define point prediction stage for both calf statuses
+statistics_stages.append(
+    define_pipeline_stage('difference_predict_points',
+                          os.path.join(repository_folder, '10_statistics_difference/01_Selection_Predict_Points.py'),
+                          [os.path.join(data_folder, 'Data_Output/analysis_tables/allPoints_Observed_Selection.csv')]
+                          + list_iteration_folders(os.path.join(model_folder, 'Calf'))
+                          + list_iteration_folders(os.path.join(model_folder, 'NoCalf')),
+                          [os.path.join(data_folder, f'Data_Output/analysis_tables/allPoints_Observed_Predicted_{status}.csv')
+                           for status in [0, 1]],
+                          parameters=round_parameters,
+                          interpreter=anaconda_python))
+
+#### DEFINE POSTPROCESSING STAGES
+
+# Define raster names
+raster_names = [(response_name, f'SouthwestAlaska_Moose_Calving_{response_name}_{raster_type}.tif')
+                for response_name in ['Calf', 'NoCalf']
+                for raster_type in ['SelectionMean', 'CI95Width', 'Significance']]
+
+# Define postprocessing stages
+postprocess_stages = [
+    define_pipeline_stage('postprocess_mask',
+                          os.path.join(repository_folder, '11_postprocess_rasters/03_Apply_Mask.py'),
+                          [os.path.join(merged_folder, response_name, raster_name) for response_name, raster_name in raster_names]
+                          + [os.path.join(data_folder, 'Data_Input/waterice_mask.tif'), study_area],
+                          [os.path.join(package_folder, response_name, 'rasters', raster_name)
+                           for response_name, raster_name in raster_names],
+                          parameters=version_parameters,
+                          interpreter=arcgis_python),
+    define_pipeline_stage('postprocess_distance',
+                          os.path.join(repository_folder, '11_postprocess_rasters/04_Distance_To_Selected.py'),
+                          [study_area] + [os.path.join(package_folder, response_name, 'rasters',
+                                                       f'SouthwestAlaska_Moose_Calving_{response_name}_{raster_type}.tif')
+                                          for response_name in ['Calf', 'NoCalf']
+                                          for raster_type in ['Selection', 'Significance']],
+                          [os.path.join(analysis_folder, f'SouthwestAlaska_Moose_Calving_{response_name}_{raster_type}.tif')
+                           for response_name in ['Calf', 'NoCalf']
+                           for raster_type in ['Discrete', 'Distance']],
+                          parameters=version_parameters,
+                          interpreter=arcgis_python,
+                          memory_mb=distance_memory),
+    define_pipeline_stage('postprocess_validation',
+                          os.path.join(repository_folder, '11_postprocess_rasters/05_Prepare_Validation.py'),
+                          [study_area,
+                           os.path.join(analysis_folder, 'SouthwestAlaska_Moose_Calving_Calf_Distance.tif'),
+                           os.path.join(analysis_folder, 'SouthwestAlaska_Moose_Calving_NoCalf_Distance.tif'),
+                           os.path.join(work_geodatabase, 'cleanedVHFdata_Togiak'),
+                           os.path.join(work_geodatabase, 'cleanedVHFdata_Nushagak')],
+                          [os.path.join(analysis_folder, f'SouthwestAlaska_Moose_{area}_{response_name}_MeanDistance.tif')
+                           for area in ['Togiak', 'Nushagak']
+                           for response_name in ['Calf', 'NoCalf']]
+                          + [os.path.join(analysis_folder, f'cleanedVHFdata_{area}_Extracted.csv')
+                             for area in ['Togiak', 'Nushagak']],
+                          parameters=version_parameters,
+                          interpreter=arcgis_python),
+    define_pipeline_stage('postprocess_threshold_sweep',
+                          os.path.join(repository_folder, '11_postprocess_rasters/07_Sweep_Selection_Threshold.py'),
+                          [study_area]
+                          + [os.path.join(package_folder, response_name, 'rasters',
+                                          f'SouthwestAlaska_Moose_Calving_{response_name}_{raster_type}.tif')
+                             for response_name in ['Calf', 'NoCalf']
+                             for raster_type in ['Selection', 'Significance']]
+                          + [os.path.join(work_geodatabase, 'cleanedVHFdata_Togiak'),
+                             os.path.join(work_geodatabase, 'cleanedVHFdata_Nushagak')],
+                          [os.path.join(analysis_folder, 'threshold_sweep'),
+                           os.path.join(analysis_folder, 'cleanedVHFdata_ThresholdSweep_Extracted.csv'),
+                           os.path.join(analysis_folder, 'cleanedVHFdata_ThresholdSweep_Accuracy.csv')],
+                          parameters=version_parameters,
+                          interpreter=arcgis_python,
+                          memory_mb=distance_memory)
+]
+
+#### RUN PIPELINE
+
+if __name__ == '__main__':
+    # Read command line options
+    dry_run = '--dry-run' in sys.argv
+    force_stages = []
+    if '--force' in sys.argv:
+        force_stages = [argument for argument in sys.argv[sys.argv.index('--force') + 1:]
+                        if not argument.startswith('--')]
+
+    # Create state folder if it does not already exist
+    if not os.path.exists(os.path.dirname(state_file)):
+        os.makedirs(os.path.dirname(state_file))
+
+    # Run all stages that are out of date
+    run_pipeline(topography_stages + hydrography_stages + vegetation_stages + path_stages + grid_stages
+                 + statistics_stages + postprocess_stages,
+                 state_file,
+                 log_folder,
+                 max_workers=max_workers,
+                 dry_run=dry_run,
+                 force_stages=force_stages)
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Prepare elevation covariate
 # Author: Timm Nawrocki
-# Last Updated: 2021-05-25
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed.
 # Description: "Prepare elevation covariate" merges and extracts raster tiles into a single raster.
 # ---------------------------------------------------------------------------
 
@@ -11,9 +11,10 @@
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import create_minimum_raster
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folder
@@ -50,6 +51,7 @@ combine_kwargs = {'cell_size': 10,
                   'value_type': '16_BIT_SIGNED',
                   'no_data': '-32768',
                   'work_geodatabase': work_geodatabase,
+                  'backend': 'numpy',
                   'input_array': combine_inputs,
                   'output_array': combine_outputs
                   }
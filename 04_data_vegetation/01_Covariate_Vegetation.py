@@ -2,19 +2,20 @@
 # ---------------------------------------------------------------------------
 # Prepare vegetation cover covariates
 # Author: Timm Nawrocki
-# Last Updated: 2021-05-26
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed.
 # Description: "Prepare vegetation cover covariates" extracts foliar cover maps to the study area boundary to ensure matching extents.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import arcpy
 import os
-from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import create_minimum_raster
+from package_GeospatialProcessing import run_geoprocessing_batch
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folder
@@ -22,6 +23,7 @@ data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_S
 vegetation_folder = os.path.join(drive, root_folder,
                                  'Projects/VegetationEcology/AKVEG_QuantitativeMap/Data/Data_Output/rasters_final/round_20210402')
 work_geodatabase = os.path.join(data_folder, 'Moose_SouthwestAlaska.gdb')
+batch_folder = os.path.join(data_folder, 'Scratch/vegetation_batch')
 
 # Define study area
 study_area = os.path.join(data_folder, 'Data_Input/southwestAlaska_StudyArea.tif')
@@ -35,7 +37,8 @@ grids_major = ['C5', 'C6',
 map_groups = ['alnus', 'betshr', 'dectre', 'dryas', 'empnig', 'erivag', 'picgla', 'picmar', 'rhoshr', 'salshr', 'sphagn', 'vaculi',
               'vacvit', 'wetsed']
 
-# Iterate through all inputs to create all outputs
+# Iterate through all inputs to define a job for each missing output
+combine_jobs = []
 for group in map_groups:
     # Define input rasters
     raster_C5 = os.path.join(vegetation_folder, group, 'NorthAmericanBeringia_' + group + '_C5.tif')
@@ -47,7 +50,7 @@ for group in map_groups:
     # Define output raster
     raster_output = os.path.join(data_folder, 'Data_Input/vegetation', group + '.tif')
 
-    # If output raster does not already exist, create output raster
+    # If output raster does not already exist, define a job to create output raster
     if arcpy.Exists(raster_output) == 0:
         # Define input and output arrays
         combine_inputs = [study_area, raster_C5, raster_C6, raster_D5, raster_D6, raster_E5]
@@ -59,15 +62,24 @@ for group in map_groups:
                           'value_type': '16_BIT_SIGNED',
                           'no_data': '-32768',
                           'work_geodatabase': work_geodatabase,
+                          'backend': 'numpy',
                           'input_array': combine_inputs,
                           'output_array': combine_outputs
                           }
-
-        # Combine raster tiles
-        print(f'Combining raster tiles for {group}...')
-        arcpy_geoprocessing(create_minimum_raster, **combine_kwargs)
-        print('----------')
+        combine_jobs.append((create_minimum_raster, combine_kwargs))
 
     else:
         print(f'Output raster for {group} already exists.')
         print('----------')
+
+# Combine raster tiles for all missing outputs in separate processes
+if len(combine_jobs) > 0:
+    print(f'Combining raster tiles for {len(combine_jobs)} groups...')
+    batch_summary = run_geoprocessing_batch(combine_jobs,
+                                            batch_folder,
+                                            max_workers=2,
+                                            summary_file=os.path.join(batch_folder, 'vegetation_batch_summary.csv'))
+    print('----------')
+    failed_jobs = batch_summary.loc[batch_summary['status'] != 'completed', 'job'].tolist()
+    if len(failed_jobs) > 0:
+        raise RuntimeError(f'Raster tiles could not be combined for {", ".join(failed_jobs)}.')
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Prepare barren covariate
 # Author: Timm Nawrocki
-# Last Updated: 2021-06-21
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
 # Description: "Prepare barren covariate" extracts the barren class from the NLCD 2016 and extracts it to the study area boundary.
 # ---------------------------------------------------------------------------
@@ -12,9 +12,10 @@ import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import combine_raster_classes
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folder
@@ -2,21 +2,21 @@
 # ---------------------------------------------------------------------------
 # Prepare forest edge covariate
 # Author: Timm Nawrocki
-# Last Updated: 2021-05-27
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
-# Description: "Prepare forest edge covariate" calculates the minimum inverse density-weighted distance from the summed cover of white spruce, black spruce, and deciduous trees.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with scipy and rasterio installed.
+# Description: "Prepare forest edge covariate" calculates the minimum inverse density-weighted distance in a single pass over the summed cover of white spruce, black spruce, and deciduous trees.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
-from package_GeospatialProcessing import calculate_idw_distance
-from package_GeospatialProcessing import create_minimum_raster
+from package_GeospatialProcessing import calculate_weighted_edge_distance
 from package_GeospatialProcessing import sum_rasters
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folder
@@ -41,6 +41,7 @@ if arcpy.Exists(raster_treecover) == 0:
 
     # Create key word arguments
     sum_kwargs = {'work_geodatabase': work_geodatabase,
+                  'backend': 'numpy',
                   'input_array': sum_inputs,
                   'output_array': sum_outputs
                   }
@@ -53,67 +54,18 @@ else:
     print('Tree cover raster already exists.')
     print('----------')
 
-# Define a maximum foliar cover value from the tree cover raster
-maximum_cover = int(arcpy.GetRasterProperties_management(raster_treecover, 'MAXIMUM').getOutput(0))
-
-# Iterate through all possible cover values greater than or equal to 10% and calculate the inverse density-weighted distance for that value
-n = 10
-edge_rasters = []
-while n <= maximum_cover:
-    # Define output raster
-    if n < 10:
-        edge_raster = os.path.join(data_folder, 'Data_Input/edge_distance', 'forest_edge_0' + str(n) + '.tif')
-    else:
-        edge_raster = os.path.join(data_folder, 'Data_Input/edge_distance', 'forest_edge_' + str(n) + '.tif')
-
-    # Calculate edge raster if it does not already exist
-    if arcpy.Exists(edge_raster) == 0:
-        try:
-            # Define input and output arrays
-            edge_inputs = [raster_treecover]
-            edge_outputs = [edge_raster]
-
-            # Create key word arguments
-            edge_kwargs = {'work_geodatabase': work_geodatabase,
-                           'target_value': n,
-                           'input_array': edge_inputs,
-                           'output_array': edge_outputs
-                           }
-
-            # Calculate the inverse density-weighted distance for n% cover
-            print(f'Calculating inverse density weighted distance where foliar cover = {n}%...')
-            arcpy_geoprocessing(calculate_idw_distance, **edge_kwargs)
-            print('----------')
-        except:
-            print(f'Foliar cover never equals {n}% cover.')
-            print('----------')
-    else:
-        print(f'Inverse density weighted distance for {n}% foliar cover already exists.')
-        print('----------')
-
-    # Append raster to list if it exists
-    if arcpy.Exists(edge_raster) == 1:
-        # Append output raster path to list
-        edge_rasters = edge_rasters + [edge_raster]
-
-    # Increase the iterator by one
-    n += 1
-
 # Define input and output arrays
-minimum_inputs = [study_area] + edge_rasters
-minimum_outputs = [forest_edge]
+edge_inputs = [study_area, raster_treecover]
+edge_outputs = [forest_edge]
 
 # Create key word arguments
-minimum_kwargs = {'cell_size': 10,
-                  'output_projection': 3338,
-                  'value_type': '32_BIT_SIGNED',
-                  'no_data': '-999',
-                  'work_geodatabase': work_geodatabase,
-                  'input_array': minimum_inputs,
-                  'output_array': minimum_outputs
-                  }
-
-# Calculate minimum inverse density-weighted distance
-print('Creating minimum value raster...')
-arcpy_geoprocessing(create_minimum_raster, **minimum_kwargs)
+edge_kwargs = {'minimum_cover': 10,
+               'no_data': -999,
+               'input_array': edge_inputs,
+               'output_array': edge_outputs
+               }
+
+# Calculate minimum inverse density-weighted distance for all cover values greater than or equal to 10%
+print('Calculating minimum inverse density weighted distance...')
+arcpy_geoprocessing(calculate_weighted_edge_distance, **edge_kwargs)
 print('----------')
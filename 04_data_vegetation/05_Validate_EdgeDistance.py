@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Validate edge distance covariates
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with scipy and rasterio installed.
+# Description: "Validate edge distance covariates" recreates the forest and tundra edge covariates with the original method of one inverse density-weighted distance raster per cover value combined with a minimum mosaic and compares them cell by cell to the single-pass edge covariates.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import arcpy
+import numpy as np
+import os
+import pandas as pd
+from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import calculate_idw_distance
+from package_GeospatialProcessing import create_minimum_raster
+from package_GeospatialProcessing import describe_raster
+from package_GeospatialProcessing import read_raster_array
+from package_GeospatialProcessing import run_geoprocessing_batch
+from package_Pipeline import read_pipeline_parameter
+
+# Set root directory
+drive = read_pipeline_parameter('drive', 'N:/')
+root_folder = 'ACCS_Work'
+
+# Define data folder
+data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
+work_geodatabase = os.path.join(data_folder, 'Moose_SouthwestAlaska.gdb')
+validation_folder = os.path.join(data_folder, 'Data_Input/edge_distance/validation')
+if os.path.exists(validation_folder) == 0:
+    os.makedirs(validation_folder)
+
+# Define input rasters
+study_area = os.path.join(data_folder, 'Data_Input/southwestAlaska_StudyArea.tif')
+raster_treecover = os.path.join(data_folder, 'Data_Input/vegetation/TreeCover.tif')
+raster_tundracover = os.path.join(data_folder, 'Data_Input/vegetation/TundraCover.tif')
+forest_edge = os.path.join(data_folder, 'Data_Input/edge_distance/southwestAlaska_ForestEdge.tif')
+tundra_edge = os.path.join(data_folder, 'Data_Input/edge_distance/southwestAlaska_TundraEdge.tif')
+
+# Define output report
+validation_csv = os.path.join(validation_folder, 'edge_distance_validation.csv')
+
+# Define edge sets of name, cover raster, single-pass raster, and no data value
+edge_sets = [['forest_edge', raster_treecover, forest_edge, '-999'],
+             ['tundra_edge', raster_tundracover, tundra_edge, '-32768']]
+
+# Compare each single-pass edge raster to the original method
+validation_results = []
+for edge_name, cover_raster, single_raster, no_data in edge_sets:
+    reference_raster = os.path.join(validation_folder, f'{edge_name}_reference.tif')
+
+    # Create the reference raster with the original method if it does not already exist
+    if arcpy.Exists(reference_raster) == 0:
+        # Identify the cover values that occur in the cover raster from the raster statistics
+        cover_histogram = describe_raster(cover_raster)['histogram']
+        if cover_histogram is not None:
+            cover_values = sorted(value for value, count in cover_histogram.items() if value >= 10 and count > 0)
+        else:
+            # Read the cover values directly when the statistics do not store a histogram
+            cover_array, cover_mask, cover_profile = read_raster_array(cover_raster)
+            cover_values = [int(value) for value in np.unique(cover_array[cover_mask & (cover_array >= 10)])]
+            del cover_array, cover_mask
+
+        # Calculate the inverse density-weighted distance for each cover value in separate processes
+        level_rasters = []
+        level_jobs = []
+        for n in cover_values:
+            level_raster = os.path.join(validation_folder, f'{edge_name}_{str(n).zfill(2)}.tif')
+            if arcpy.Exists(level_raster) == 0:
+                level_kwargs = {'work_geodatabase': work_geodatabase,
+                                'target_value': int(n),
+                                'input_array': [study_area, cover_raster],
+                                'output_array': [level_raster]
+                                }
+                level_jobs.append((calculate_idw_distance, level_kwargs))
+            level_rasters.append(level_raster)
+        if len(level_jobs) > 0:
+            print(f'Calculating reference inverse density weighted distance for {len(level_jobs)} cover values...')
+            batch_summary = run_geoprocessing_batch(level_jobs,
+                                                    os.path.join(validation_folder, 'batch'),
+                                                    max_workers=3,
+                                                    summary_file=os.path.join(validation_folder,
+                                                                              f'{edge_name}_batch_summary.csv'))
+            print('----------')
+            if (batch_summary['status'] != 'completed').any():
+                raise RuntimeError(f'Reference distance rasters could not be calculated for {edge_name}.')
+
+        # Calculate minimum inverse density-weighted distance
+        minimum_kwargs = {'cell_size': 10,
+                          'output_projection': 3338,
+                          'value_type': '32_BIT_SIGNED',
+                          'no_data': no_data,
+                          'work_geodatabase': work_geodatabase,
+                          'input_array': [study_area] + level_rasters,
+                          'output_array': [reference_raster]
+                          }
+        print(f'Creating reference minimum value raster for {edge_name}...')
+        arcpy_geoprocessing(create_minimum_raster, **minimum_kwargs)
+        print('----------')
+
+    # Compare the single-pass raster to the reference raster
+    print(f'Comparing single-pass and reference rasters for {edge_name}...')
+    single_array, single_mask, single_profile = read_raster_array(single_raster)
+    reference_array, reference_mask, reference_profile = read_raster_array(reference_raster)
+    shared_mask = single_mask & reference_mask
+    difference = np.abs(single_array[shared_mask].astype('int64') - reference_array[shared_mask].astype('int64'))
+    validation_results.append({'edge': edge_name,
+                               'cells_compared': int(shared_mask.sum()),
+                               'cells_no_data_mismatch': int((single_mask != reference_mask).sum()),
+                               'cells_equal': int((difference == 0).sum()),
+                               'cells_differ_by_one': int((difference == 1).sum()),
+                               'cells_differ_by_more': int((difference > 1).sum()),
+                               'maximum_difference': int(difference.max()) if difference.size > 0 else 0})
+    print(f'\t{validation_results[-1]}')
+    print('----------')
+
+# Export validation report
+validation_data = pd.DataFrame(validation_results)
+validation_data.to_csv(validation_csv, header=True, index=False, sep=',', encoding='utf-8')
@@ -5,6 +5,10 @@
 # Load modules
 import arcpy
 import os
+import pandas as pd
+from package_GeospatialProcessing import buffer_convex_polygon
+from package_GeospatialProcessing import calculate_group_hulls
+from package_GeospatialProcessing import clip_polygon_to_convex
 
 # Set root directory
 drive = 'C:\\'
@@ -15,7 +19,7 @@ arcpy.env.overwriteOutput = True
 
 # Define working geodatabase
 geodatabase = os.path.join(drive, root_folder, 'GIS\\Moose_SouthwestAlaska.gdb')
-arcpy.env.workspace = geodatabase # Needs to be set for Minimum Bounding Geometry code to run
+arcpy.env.workspace = geodatabase
 
 # Define inputs
 input_projection = 3338
@@ -26,39 +30,54 @@ y_coords = "Northing"
 unique_id = "deployment_id"
 
 # Define outputs
-output_layer = "telemetry_layer"
-output_shapefile = "cleanedGPSdata"
-temp_convex = os.path.join(geodatabase,"convexHulls_temp")
-temp_convex_buffer = os.path.join(geodatabase, "convexHulls_buffer")
 output_convex = os.path.join(geodatabase, "convexHulls")
-buffer_dist = "2 Kilometers"
+buffer_dist = 2000 # meters
 
 # Define the initial projection
 initial_projection = arcpy.SpatialReference(input_projection)
 
-# Convert CSV to ESRI Shapefile
-print("Converting csv to shapefile...")
-
-arcpy.MakeXYEventLayer_management(input_csv, x_coords, y_coords, output_layer, spatial_reference=initial_projection)
-arcpy.conversion.FeatureClassToFeatureClass(in_features = output_layer, out_path = geodatabase, out_name = output_shapefile)
+# Read telemetry fixes and number deployments so that fixes can be grouped quickly
+print("Reading telemetry fixes...")
+gps_data = pd.read_csv(input_csv, usecols=[unique_id, x_coords, y_coords])
+deployment_codes, deployment_ids = pd.factorize(gps_data[unique_id])
 
 # Create convex hull polygon for each moose
 print("Creating convex hull...")
-arcpy.MinimumBoundingGeometry_management(output_shapefile,
-                                         temp_convex, "CONVEX_HULL", group_option = "LIST", group_field = unique_id)
-
-# Buffer by 2 kilometers
-arcpy.analysis.Buffer(temp_convex, temp_convex_buffer, buffer_distance_or_field = buffer_dist)
-
-# Clip to study area boundary
-print("Clipping to study area...")
-arcpy.analysis.Clip(temp_convex_buffer, study_area, output_convex)
-
-# Remove temporary files
-files_Delete = [temp_convex,temp_convex_buffer]
-
-for i in files_Delete:
-    if arcpy.Exists(i):
-        arcpy.Delete_management(i)
-
-print("Creating convex hulls complete...")
\ No newline at end of file
+convex_hulls = calculate_group_hulls(gps_data[x_coords].to_numpy(),
+                                     gps_data[y_coords].to_numpy(),
+                                     deployment_codes)
+
+# Read the rings of the study area boundary; a None point separates the rings of a part
+study_rings = []
+with arcpy.da.SearchCursor(study_area, ["SHAPE@"]) as cursor:
+    for row in cursor:
+        for part in row[0]:
+            ring = []
+            for point in part:
+                if point is None:
+                    study_rings.append(ring)
+                    ring = []
+                else:
+                    ring.append((point.X, point.Y))
+            study_rings.append(ring)
+
+# Create output feature class
+arcpy.management.CreateFeatureclass(geodatabase, "convexHulls", "POLYGON", spatial_reference=initial_projection)
+arcpy.management.AddField(output_convex, unique_id, "TEXT", field_length=50)
+
+# Buffer by 2 kilometers and clip to study area boundary
+print("Buffering and clipping to study area...")
+with arcpy.da.InsertCursor(output_convex, ["SHAPE@", unique_id]) as cursor:
+    for deployment_code, hull_vertices in convex_hulls.items():
+        buffered_hull = buffer_convex_polygon(hull_vertices, buffer_dist)
+        clipped_rings = clip_polygon_to_convex(study_rings, buffered_hull)
+        if len(clipped_rings) == 0:
+            print(f"Convex hull of {deployment_ids[deployment_code]} does not overlap the study area.")
+            continue
+        # Rings are combined under the even-odd rule and simplified when the polygon is created
+        hull_polygon = arcpy.Polygon(arcpy.Array([arcpy.Array([arcpy.Point(x, y) for x, y in ring])
+                                                  for ring in clipped_rings]),
+                                     initial_projection)
+        cursor.insertRow([hull_polygon, str(deployment_ids[deployment_code])])
+
+print("Creating convex hulls complete...")
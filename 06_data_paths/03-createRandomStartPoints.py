@@ -8,6 +8,8 @@
 # Import packages
 import arcpy
 import os
+import pandas as pd
+from package_GeospatialProcessing import sample_polygon_points
 
 # Set root directory
 drive = 'C:\\'
@@ -24,24 +26,55 @@ arcpy.env.workspace = geodatabase
 input_projection = 3338
 boundaries = "convexHulls"
 number_of_pts = 10000
-pts_join_field = "CID" # default name created by CreateRandomPoints function
-boundaries_join_field = "OBJECTID"
+random_seed = 314
 field_list = ["deployment_id"]
 
 #  Define outputs
 output_name = "randomStartPts"
+output_csv = os.path.join(drive, 'ACCS_Work\\Projects\\Moose_SouthwestAlaska',
+                          'Data_02_Pipeline\\03-createRandomStartPoints\\randomStartPts.csv')
 
 # Set projection
 initial_projection = arcpy.SpatialReference(input_projection)
 
+# Read the rings of the convex hull polygons that represent moose home ranges; a None point separates the rings of a part
+hull_polygons = {}
+with arcpy.da.SearchCursor(boundaries, ["SHAPE@"] + field_list) as cursor:
+    for row in cursor:
+        rings = []
+        for part in row[0]:
+            ring = []
+            for point in part:
+                if point is None:
+                    rings.append(ring)
+                    ring = []
+                else:
+                    ring.append((point.X, point.Y))
+            rings.append(ring)
+        hull_polygons[row[1]] = rings
+
 print("Generating random points")
-# Create random points within the boundaries of the convex hull polygons that represent moose home ranges
-arcpy.CreateRandomPoints_management(out_path=geodatabase, out_name=output_name, constraining_feature_class=boundaries, number_of_points_or_field=number_of_pts)
+# Create random points within the boundaries of the convex hull polygons with the deployment id and coordinates of each point
+point_x, point_y, deployment_id = sample_polygon_points(hull_polygons, number_of_pts, seed=random_seed)
+random_points = pd.DataFrame({'CID': pd.factorize(deployment_id)[0] + 1,
+                              'deployment_id': deployment_id,
+                              'POINT_X': point_x,
+                              'POINT_Y': point_y})
 
-# Join random points to convex hull polygons by the ID field so we can associate individual moose with points
-arcpy.JoinField_management(in_data=output_name, in_field=pts_join_field, join_table=boundaries, join_field=boundaries_join_field, fields=field_list)
+# Store points in a csv table
+output_folder = os.path.dirname(output_csv)
+if not os.path.exists(output_folder):
+    os.makedirs(output_folder)
+random_points.to_csv(output_csv, header=True, index=False, sep=',', encoding='utf-8')
 
-# Add coordinate fields
-arcpy.AddXY_management(output_name)
+# Store points in a feature class with the fields created by the previous join and AddXY steps
+arcpy.management.CreateFeatureclass(geodatabase, output_name, "POINT", spatial_reference=initial_projection)
+arcpy.management.AddField(output_name, "CID", "LONG")
+arcpy.management.AddField(output_name, "deployment_id", "TEXT", field_length=50)
+arcpy.management.AddField(output_name, "POINT_X", "DOUBLE")
+arcpy.management.AddField(output_name, "POINT_Y", "DOUBLE")
+with arcpy.da.InsertCursor(output_name, ["SHAPE@XY", "CID", "deployment_id", "POINT_X", "POINT_Y"]) as cursor:
+    for point in random_points.itertuples(index=False):
+        cursor.insertRow([(point.POINT_X, point.POINT_Y), point.CID, point.deployment_id, point.POINT_X, point.POINT_Y])
 
-print("Complete")
\ No newline at end of file
+print("Complete")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Create Random Paths
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution.
+# Description: "Create Random Paths" generates 1200 random paths for every moose-year in Python as an alternative to 04-createRandomPaths.R. Each random path has the same number of points as the observed path on which it is based and starts at a random start point of the same moose that is not used by any other path. Step lengths and turning angles are sampled from the random numbers generated from the theoretical distributions in 01-generateDistributions.R. The observed and random paths are written to allPaths.csv with the same fields as the R script.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import datetime
+import os
+import pandas as pd
+import time
+from package_Paths import simulate_random_paths
+from package_Pipeline import read_compute_budget
+
+# Set root directory
+drive = 'C:/'
+root_folder = 'ACCS_Work/Projects/Moose_SouthwestAlaska'
+
+# Define data folders
+pipeline_folder = os.path.join(drive, root_folder, 'Data_02_Pipeline')
+output_folder = os.path.join(drive, root_folder, 'Data_03_Output')
+
+# Define input files
+observed_csv = os.path.join(output_folder, 'animalData/cleanedGPSCalvingSeason.csv')
+angles_csv = os.path.join(pipeline_folder, '01-generateDistributions/randomRadians.csv')
+calf0_csv = os.path.join(pipeline_folder, '01-generateDistributions/randomDistances_calf0.csv')
+calf1_csv = os.path.join(pipeline_folder, '01-generateDistributions/randomDistances_calf1.csv')
+start_csv = os.path.join(pipeline_folder, '03-createRandomStartPoints/randomStartPts.csv')
+
+# Define output file
+output_csv = os.path.join(pipeline_folder, '04-createRandomPaths/allPaths.csv')
+
+# Define number of paths per moose-year and random seed
+number_paths = 1200
+random_seed = 121190
+
+# Run the simulation only in the main process so that simulation processes do not rerun the script
+if __name__ == '__main__':
+    #### LOAD DATA
+
+    # Read observed paths, random start points, and random numbers from the theoretical distributions
+    print('Loading observed paths, start points, and distributions...')
+    segment_start = time.time()
+    calving_season = pd.read_csv(observed_csv)
+    start_points = pd.read_csv(start_csv)
+    distributions = {'angles': pd.read_csv(angles_csv, header=None)[0].to_numpy(),
+                     'distCalf0': pd.read_csv(calf0_csv, header=None)[0].to_numpy(),
+                     'distCalf1': pd.read_csv(calf1_csv, header=None)[0].to_numpy()}
+    # Report success
+    segment_elapsed = int(time.time() - segment_start)
+    segment_success_time = datetime.datetime.now()
+    print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+    print('----------')
+
+    #### GENERATE RANDOM PATHS
+
+    # Summarize the deployment, calf status, and number of points of every observed path
+    path_info = (calving_season.sort_values(['mooseYear_id', 'RowID'])
+                 .groupby('mooseYear_id', sort=False)
+                 .agg(deployment_id=('deployment_id', 'first'),
+                      calfStatus=('calfStatus', 'first'),
+                      length=('RowID', 'size'))
+                 .reset_index())
+    path_info['numberOfPaths'] = number_paths
+
+    # Rename fields of the observed paths to match the random paths
+    observed_paths = (calving_season[['mooseYear_id', 'RowID', 'Easting', 'Northing', 'calfStatus', 'deployment_id']]
+                      .rename(columns={'RowID': 'pointID', 'Easting': 'x', 'Northing': 'y'}))
+    observed_paths['response'] = 1
+    observed_paths['pathID'] = 'observed'
+    observed_paths['fullPath_id'] = observed_paths['mooseYear_id'] + '-observed'
+    observed_paths['fullPoint_id'] = observed_paths['fullPath_id'] + '-' + observed_paths['pointID'].astype(str)
+
+    # Simulate random paths and write them with the observed paths
+    compute_budget = read_compute_budget()
+    print(f'Generating {number_paths} random paths for {len(path_info)} moose-years on {compute_budget["cores"]} core(s)...')
+    segment_start = time.time()
+    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+    point_count = simulate_random_paths(start_points,
+                                        path_info,
+                                        distributions,
+                                        output_csv,
+                                        observed_paths=observed_paths,
+                                        seed=random_seed,
+                                        workers=compute_budget['cores'])
+    # Report success
+    segment_elapsed = int(time.time() - segment_start)
+    segment_success_time = datetime.datetime.now()
+    print(f'Wrote {len(observed_paths)} observed and {point_count} random path points.')
+    print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+    print('----------')
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Summarize Covariates by Path
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with rasterio installed.
+# Description: "Summarize Covariates by Path" samples all covariate rasters at the points of the observed and random paths and summarizes the covariates as the mean of each path in one pass as an alternative to 06-extractCovariates.R and 07-summarizeByPath.R. Paths with points outside the study area or with no data and random paths with more than 7 points in a lake are excluded, points in a lake are excluded from the remaining paths, and 500 random paths are selected for each moose-year. The output is written to paths_meanCovariates.csv with the fields of the R script.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import datetime
+import glob
+import os
+import pandas as pd
+import time
+from package_Paths import select_random_paths
+from package_Paths import summarize_path_covariates
+from package_Pipeline import read_compute_budget
+
+# Set root directory
+drive = 'C:/'
+root_folder = 'ACCS_Work/Projects/Moose_SouthwestAlaska'
+
+# Define data folders
+input_folder = os.path.join(drive, root_folder, 'Data_01_Input')
+pipeline_folder = os.path.join(drive, root_folder, 'Data_02_Pipeline')
+
+# Define input files
+path_csv = os.path.join(pipeline_folder, '04-createRandomPaths/allPaths.csv')
+lake_raster = os.path.join(input_folder, 'hydrography/lake.tif')
+
+# Define covariate rasters in the order of the R raster stack and rename edge rasters to standard names
+covariate_folders = ['topography', 'edge_distance', 'vegetation']
+covariate_names = {'southwestAlaska_ForestEdge': 'forest_edge',
+                   'southwestAlaska_TundraEdge': 'tundra_edge'}
+
+# Define output file
+output_csv = os.path.join(pipeline_folder, '07-summarizeByPath/paths_meanCovariates.csv')
+
+# Define number of random paths per moose-year, number of paths per iteration, and random seed
+number_paths = 500
+group_size = 10
+random_seed = 21
+
+#### LOAD DATA
+
+# Create a dictionary of all covariate rasters
+covariate_rasters = {}
+for folder in covariate_folders:
+    for raster in sorted(glob.glob(os.path.join(input_folder, folder, '*.tif'))):
+        raster_name = os.path.splitext(os.path.basename(raster))[0]
+        covariate_rasters[covariate_names.get(raster_name, raster_name)] = raster
+print(f'Number of covariate rasters: {len(covariate_rasters)}')
+
+# Read path points
+print('Loading path points...')
+segment_start = time.time()
+path_table = pd.read_csv(path_csv,
+                         usecols=['mooseYear_id', 'fullPath_id', 'x', 'y', 'calfStatus', 'response'],
+                         engine='pyarrow')
+# Report success
+segment_elapsed = int(time.time() - segment_start)
+segment_success_time = datetime.datetime.now()
+print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+print('----------')
+
+#### SUMMARIZE COVARIATES
+
+# Sample covariates at path points and calculate the mean of each path
+compute_budget = read_compute_budget()
+print(f'Summarizing {len(covariate_rasters)} covariates for {len(path_table)} points on {compute_budget["cores"]} core(s)...')
+segment_start = time.time()
+path_means = summarize_path_covariates(path_table,
+                                       covariate_rasters,
+                                       lake_raster,
+                                       threads=compute_budget['cores'])
+# Report success
+segment_elapsed = int(time.time() - segment_start)
+segment_success_time = datetime.datetime.now()
+print(f'Retained {len(path_means)} of {path_table["fullPath_id"].nunique()} paths.')
+print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+print('----------')
+
+#### SELECT RANDOM PATHS
+
+# Select random paths for each moose-year and export the training table
+print(f'Selecting {number_paths} random paths for each moose-year...')
+segment_start = time.time()
+all_paths = select_random_paths(path_means, number_paths=number_paths, group_size=group_size, seed=random_seed)
+os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+all_paths.to_csv(output_csv, header=True, index=False, sep=',', encoding='utf-8')
+# Report success
+segment_elapsed = int(time.time() - segment_start)
+segment_success_time = datetime.datetime.now()
+print(f'Wrote {len(all_paths)} paths.')
+print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+print('----------')
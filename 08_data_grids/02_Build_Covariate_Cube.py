@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Build Covariate Cube
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with rasterio installed.
+# Description: "Build Covariate Cube" snaps the topography, edge distance, and vegetation covariates to the grid of the study area raster and stores them as one memory-mapped cube of tiles in which cells without data hold a no data value. Bands follow the order of predictor_all, with picgla and picmar stored in place of picea so that consumers can sum them as in the prediction scripts.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import datetime
+import os
+import time
+from package_GeospatialProcessing import build_covariate_cube
+from package_Pipeline import read_compute_budget
+from package_Pipeline import read_pipeline_parameter
+
+# Set root directory
+drive = read_pipeline_parameter('drive', 'N:/')
+root_folder = 'ACCS_Work'
+
+# Define data folder
+data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
+
+# Define input rasters
+study_area = os.path.join(data_folder, 'Data_Input/southwestAlaska_StudyArea.tif')
+topography_folder = os.path.join(data_folder, 'Data_Input/topography')
+edge_folder = os.path.join(data_folder, 'Data_Input/edge_distance')
+vegetation_folder = os.path.join(data_folder, 'Data_Input/vegetation')
+
+# Define covariate rasters in band order
+covariate_rasters = {'elevation': os.path.join(topography_folder, 'elevation.tif'),
+                     'roughness': os.path.join(topography_folder, 'roughness.tif'),
+                     'forest_edge': os.path.join(edge_folder, 'southwestAlaska_ForestEdge.tif'),
+                     'tundra_edge': os.path.join(edge_folder, 'southwestAlaska_TundraEdge.tif')}
+for group in ['alnus', 'betshr', 'dectre', 'empnig', 'erivag', 'picgla', 'picmar', 'rhoshr', 'salshr', 'sphagn',
+              'vaculi', 'vacvit', 'wetsed']:
+    covariate_rasters[group] = os.path.join(vegetation_folder, group + '.tif')
+
+# Define output folder
+cube_folder = os.path.join(data_folder, 'Data_Input/covariate_cube')
+
+# Build covariate cube
+compute_budget = read_compute_budget()
+print(f'Building covariate cube of {len(covariate_rasters)} covariates on {compute_budget["cores"]} core(s)...')
+iteration_start = time.time()
+cube_index = build_covariate_cube(study_area, covariate_rasters, cube_folder, threads=compute_budget['cores'])
+# Report success
+iteration_end = time.time()
+iteration_elapsed = int(iteration_end - iteration_start)
+iteration_success_time = datetime.datetime.now()
+print(f'Stored {cube_index["shape"][0]} bands of {cube_index["shape"][1]} rows and {cube_index["shape"][2]} columns as {cube_index["value_type"]} in tiles of {cube_index["tile_size"]} cells.')
+print(f'Completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+print('----------')
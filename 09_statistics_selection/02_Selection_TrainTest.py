@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Train and Test Habitat Selection Function
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-20
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.8+ distribution.
-# Description: "Train and Test Habitat Selection Function" trains a random forest model (i.e., path selection function) to predict habitat from path covariate means. A threshold for avoidance/selection conversion is selected empirically. All model performance metrics are calculated on independent test partitions where independence of groups is maintained. This script runs the model train and test steps to output a model performance and variable importance report, trained classifier file, and threshold file that can be transferred to the prediction script. The train-test classifier is set to use 4 cores. The script must be run on a machine that can support 4 cores.
+# Description: "Train and Test Habitat Selection Function" trains a random forest model (i.e., path selection function) to predict habitat from path covariate means. A threshold for avoidance/selection conversion is selected empirically. All model performance metrics are calculated on independent test partitions where independence of groups is maintained. This script runs the model train and test steps to output a model performance and variable importance report, trained classifier file, and threshold file that can be transferred to the prediction script. The train-test classifier uses the cores of the compute budget allocated by the pipeline runner or all cores of the machine when the script is run by hand.
 # ---------------------------------------------------------------------------
 
 # Import packages
@@ -16,20 +16,26 @@ import time
 import datetime
 
 # Import functions from repository statistics package
+from package_Statistics import combine_random_forests
 from package_Statistics import model_train_test
 from package_Statistics import plot_importances_mdi
+from package_Statistics import read_result_store
+from package_Statistics import write_result_partition
+from package_Statistics import write_meta_forest
 from package_Statistics import write_model_report
+from package_Pipeline import read_compute_budget
+from package_Pipeline import read_pipeline_parameter
 
 # Define calf status
-calf_status = 1
+calf_status = read_pipeline_parameter('calf_status', 1)
 
 # Define round
-round_date = 'round_20210820'
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
 
 #### SET UP DIRECTORIES, FILES, AND FIELDS
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folders
@@ -60,6 +66,9 @@ output_variables = all_variables + outer_cv_split_n + absence + presence + predi
 # Define random state
 rstate = 21
 
+# Define tree counts for which nested subsets of trees are scored in the outer cross validation
+tree_counts = [10, 50, 100, 250, 500, 750, 1000]
+
 # Define response names
 if calf_status == 0:
     output_folder = os.path.join(data_output, 'NoCalf')
@@ -70,11 +79,11 @@ else:
     output_html = os.path.join(output_folder, 'report-moose-calf.html')
     taxon_name = 'Moose with Calves'
 
-# Define output test data
-output_csv = os.path.join(output_folder, 'prediction.csv')
+# Define result store for outer test results and importances of all iterations and calf statuses
+store_folder = os.path.join(data_output, 'result_store')
 
 # Define output meta model
-output_metamodel = os.path.join(output_folder, 'meta_classifier.joblib')
+output_metamodel = os.path.join(output_folder, 'meta_classifier.json')
 
 # Create a plots folder if it does not exist
 plots_folder = os.path.join(output_folder, 'plots')
@@ -90,6 +99,10 @@ importance_mdi_csv = os.path.join(output_folder, 'importance_classifier_mdi.csv'
 
 #### CONDUCT MODEL TRAIN AND TEST ITERATIONS
 
+# Read compute budget
+compute_budget = read_compute_budget()
+print(f'Training classifiers on {compute_budget["cores"]} core(s) ({compute_budget["source"]} budget).')
+
 # Create a standardized parameter set for a random forest classifier
 classifier_params = {'n_estimators': 1000,
                      'criterion': 'gini',
@@ -102,7 +115,7 @@ classifier_params = {'n_estimators': 1000,
                      'oob_score': False,
                      'warm_start': False,
                      'class_weight': 'balanced',
-                     'n_jobs': 4,
+                     'n_jobs': compute_budget['cores'],
                      'random_state': rstate}
 
 # Create data frame of input data
@@ -139,14 +152,11 @@ input_data['iteration_id'] = input_data['iteration_id'] + 1
 outer_cv_splits = LeaveOneGroupOut()
 inner_cv_splits = GroupKFold(n_splits=5)
 
-# Create empty data frames to store the results across all iterations
-output_results = pd.DataFrame(columns=output_variables)
-importances_all = pd.DataFrame(columns=['iteration', 'covariate', 'importance'])
-
 # Create empty lists to store threshold and performance metrics
 auc_list = []
 accuracy_list = []
 classifier_list = []
+classifier_files = []
 
 # Loop through each iteration and train and test a classification model
 iteration = 1
@@ -179,7 +189,8 @@ while iteration <= 50:
                                                                                             inner_cv_splits,
                                                                                             rstate,
                                                                                             threshold_file,
-                                                                                            output_classifier)
+                                                                                            output_classifier,
+                                                                                            tree_counts)
 
     # Print results of model train and test
     print(f'Outer results for iteration {iteration} contain {len(outer_results)} rows.')
@@ -187,29 +198,33 @@ while iteration <= 50:
     print(f'Accuracy for iteration {iteration} = {accuracy}.')
     print('----------')
 
-    # Add the outer results for the iteration to the output data frame
-    output_results = output_results.append(outer_results, ignore_index=True, sort=True)
+    # Write the outer results for the iteration to the result store
+    write_result_partition(store_folder, 'outer_results', outer_results, calf_status, iteration)
 
     # Append the AUC and Accuracy to the lists
     auc_list.append(auc)
     accuracy_list.append(accuracy)
 
-    # Add model to the list
+    # Add model and its file to the lists
     classifier_list.append(iteration_classifier)
+    classifier_files.append(output_classifier)
 
-    # Add the importances to the importance table
-    importance_table['iteration'] = iteration
-    importances_all = importances_all.append(importance_table, ignore_index=True, sort=True)
+    # Write the importances for the iteration to the result store
+    write_result_partition(store_folder, 'importances', importance_table, calf_status, iteration)
 
     # Increase the iteration
     iteration += 1
 
 #### CALCULATE PERFORMANCE AND STORE RESULTS
 
-# Store output results in csv file
-print('Saving combined results to csv file...')
+# Export a variable importance plot for the meta model based on MDI
+print('Creating a plot of MDI importances from all models...')
 iteration_start = time.time()
-output_results.to_csv(output_csv, header=True, index=False, sep=',', encoding='utf-8')
+importances_all = read_result_store(store_folder,
+                                    'importances',
+                                    calf_status=calf_status,
+                                    columns=['iteration', 'covariate', 'importance'])
+plot_importances_mdi(importances_all, 6, 3, importance_mdi_plot, importance_mdi_csv)
 iteration_end = time.time()
 iteration_elapsed = int(iteration_end - iteration_start)
 iteration_success_time = datetime.datetime.now()
@@ -217,10 +232,11 @@ print(
     f'Completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
 print('----------')
 
-# Export a variable importance plot for the meta model based on MDI
-print('Creating a plot of MDI importances from all models...')
+# Write a meta model manifest that references the classifier files of all iterations
+print('Writing meta model manifest for all classifiers...')
 iteration_start = time.time()
-plot_importances_mdi(importances_all, 6, 3, importance_mdi_plot, importance_mdi_csv)
+meta_forest = combine_random_forests(classifier_list, classifier_files)
+write_meta_forest(meta_forest, output_metamodel)
 iteration_end = time.time()
 iteration_elapsed = int(iteration_end - iteration_start)
 iteration_success_time = datetime.datetime.now()
@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Predict Habitat Selection Function to Spatial Grids
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-29
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.8+ distribution.
-# Description: "Predict Habitat Selection Function to Spatial Grids" predicts a random forest model (i.e., path selection function) to a set of grid csv files containing extracted covariate values to produce a set of output predictions with mean and standard deviation. The script must be run on a machine that can support 4 cores.
+# Description: "Predict Habitat Selection Function to Spatial Grids" predicts a random forest model (i.e., path selection function) to a set of grid csv files containing extracted covariate values to produce a set of output predictions with mean and standard deviation. Classifiers predict on the cores of the compute budget allocated by the pipeline runner or all cores of the machine when the script is run by hand.
 # ---------------------------------------------------------------------------
 
 # Import packages
@@ -19,17 +19,19 @@ import datetime
 from package_Statistics import compute_prediction_statistics
 from package_Statistics import predict_habitat_selection
 from package_Statistics import read_text_value
+from package_Pipeline import read_compute_budget
+from package_Pipeline import read_pipeline_parameter
 
 # Define calf status
-calf_status = 1
+calf_status = read_pipeline_parameter('calf_status', 1)
 
 # Define round
-round_date = 'round_20210820'
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
 
 #### SET UP DIRECTORIES, FILES, AND FIELDS
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folders
@@ -62,6 +64,8 @@ if calf_status == 0:
 else:
     input_folder = os.path.join(model_folder, 'Calf')
     output_folder = os.path.join(prediction_folder, 'Calf')
+if os.path.exists(output_folder) == 0:
+    os.mkdir(output_folder)
 
 # Create a list of input files for the prediction step
 os.chdir(grid_folder)
@@ -70,6 +74,10 @@ grid_length = len(grid_files)
 print(f'Prediction step will occur across {grid_length} grids...')
 print('----------')
 
+# Read compute budget
+compute_budget = read_compute_budget()
+print(f'Predicting classifiers on {compute_budget["cores"]} core(s) ({compute_budget["source"]} budget).')
+
 # Load model and threshold sets into memory
 print(f'Loading 50 classifiers and thresholds into memory...')
 segment_start = time.time()
@@ -88,6 +96,7 @@ while i <= 50:
         threshold_path = os.path.join(input_folder, str(i), 'threshold.txt')
     # Load and append classifier
     classifier = joblib.load(classifier_path)
+    classifier.n_jobs = compute_budget['cores']
     model_set.append(classifier)
     # Read and append threshold
     threshold = read_text_value(threshold_path)
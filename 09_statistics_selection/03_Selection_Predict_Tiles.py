@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Predict Habitat Selection Function to Raster Tiles
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with rasterio installed.
+# Description: "Predict Habitat Selection Function to Raster Tiles" predicts a random forest model (i.e., path selection function) directly from the covariate cube tile by tile to produce selection mean, 95% confidence interval width, and binary significance rasters for each tile. Covariates are read from the cube, picea is derived from picgla and picmar, and cells without data are dropped in memory, so no extracted grid tables or predicted tables are written. Every tile is predicted once to determine the presence range of each model over the whole study area and predicted again to be summarized, so each model is scaled to selection values with its range over all tiles while only the minimum and maximum presence of each model are stored between the passes. Classifiers predict on the cores of the compute budget allocated by the pipeline runner or all cores of the machine when the script is run by hand.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import joblib
+import os
+import time
+import datetime
+
+# Import functions from repository statistics package
+from package_Statistics import predict_selection_tiles
+from package_Statistics import read_text_value
+from package_Pipeline import read_compute_budget
+from package_Pipeline import read_pipeline_parameter
+
+# Define calf status
+calf_status = read_pipeline_parameter('calf_status', 1)
+
+# Define round
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
+
+#### SET UP DIRECTORIES, FILES, AND FIELDS
+
+# Set root directory
+drive = read_pipeline_parameter('drive', 'N:/')
+root_folder = 'ACCS_Work'
+
+# Define data folders
+data_folder = os.path.join(drive,
+                           root_folder,
+                           'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
+cube_folder = os.path.join(data_folder, 'Data_Input/covariate_cube')
+model_folder = os.path.join(data_folder, 'Data_Output/model_results', round_date)
+raster_folder = os.path.join(data_folder, 'Data_Output/predicted_rasters', round_date)
+
+# Define variable sets
+predictor_all = ['elevation', 'roughness', 'forest_edge', 'tundra_edge', 'alnus', 'betshr', 'dectre',
+                 'empnig', 'erivag', 'picea', 'rhoshr', 'salshr', 'sphagn', 'vaculi', 'vacvit', 'wetsed']
+derived_predictors = {'picea': ['picgla', 'picmar']}
+
+# Define response names
+if calf_status == 0:
+    input_folder = os.path.join(model_folder, 'NoCalf')
+    output_folder = os.path.join(raster_folder, 'NoCalf')
+else:
+    input_folder = os.path.join(model_folder, 'Calf')
+    output_folder = os.path.join(raster_folder, 'Calf')
+
+# Read compute budget
+compute_budget = read_compute_budget()
+print(f'Predicting classifiers on {compute_budget["cores"]} core(s) ({compute_budget["source"]} budget).')
+
+# Load model and threshold sets into memory
+print(f'Loading 50 classifiers and thresholds into memory...')
+segment_start = time.time()
+# Define empty lists to store classifiers and thresholds
+model_set = []
+threshold_set = []
+# Iterate through folders to add classifiers and thresholds to list
+i = 1
+while i <= 50:
+    # Define paths for classifier and threshold
+    classifier_path = os.path.join(input_folder, f'{i:02d}', 'classifier.joblib')
+    threshold_path = os.path.join(input_folder, f'{i:02d}', 'threshold.txt')
+    # Load and append classifier
+    classifier = joblib.load(classifier_path)
+    classifier.n_jobs = compute_budget['cores']
+    model_set.append(classifier)
+    # Read and append threshold
+    threshold = read_text_value(threshold_path)
+    threshold_set.append(threshold)
+    # Increase the counter
+    i += 1
+# Report success
+segment_end = time.time()
+segment_elapsed = int(segment_end - segment_start)
+segment_success_time = datetime.datetime.now()
+print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+print('----------')
+
+# Predict selection statistics for all tiles of the covariate cube
+print('Predicting selection statistics for all tiles...')
+total_start = time.time()
+tile_results = predict_selection_tiles(cube_folder,
+                                       model_set,
+                                       threshold_set,
+                                       predictor_all,
+                                       output_folder,
+                                       derived_predictors=derived_predictors)
+# Report success
+total_end = time.time()
+total_elapsed = int(total_end - total_start)
+total_success_time = datetime.datetime.now()
+print(f'Predicted {int((tile_results["status"] == "predicted").sum())} of {len(tile_results)} tiles.')
+print(f'Completed at {total_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=total_elapsed)})')
+print('----------')
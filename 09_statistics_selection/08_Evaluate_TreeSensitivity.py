@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Evaluate Tree Count Sensitivity
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution.
+# Description: "Evaluate Tree Count Sensitivity" calculates how AUC, accuracy, and the optimal threshold change with the number of trees in the random forest and the corresponding prediction time savings without retraining the models. Performance metrics are calculated from the outer cross validation probabilities of nested subsets of trees that the train and test script stores when tree counts are specified, and the tree counts are read from those stored columns. Because the exported classifiers are trained on all data for an iteration, they are only used to measure prediction time.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import joblib
+import os
+import pandas as pd
+import time
+import datetime
+
+# Import functions from repository statistics package
+from package_Statistics import evaluate_tree_sensitivity
+from package_Statistics import plot_tree_sensitivity
+from package_Statistics import read_result_store
+from package_Pipeline import read_pipeline_parameter
+
+# Define calf status
+calf_status = read_pipeline_parameter('calf_status', 1)
+
+# Define round
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
+
+#### SET UP DIRECTORIES, FILES, AND FIELDS
+
+# Set root directory
+drive = read_pipeline_parameter('drive', 'N:/')
+root_folder = 'ACCS_Work'
+
+# Define data folders
+data_folder = os.path.join(drive,
+                           root_folder,
+                           'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
+model_folder = os.path.join(data_folder, 'Data_Output/model_results', round_date)
+store_folder = os.path.join(model_folder, 'result_store')
+
+# Define variable sets
+predictor_all = ['elevation', 'roughness', 'forest_edge', 'tundra_edge', 'alnus', 'betshr', 'dectre',
+                 'empnig', 'erivag', 'picea', 'rhoshr', 'salshr', 'sphagn', 'vaculi', 'vacvit', 'wetsed']
+
+# Define response names
+if calf_status == 0:
+    input_folder = os.path.join(model_folder, 'NoCalf')
+else:
+    input_folder = os.path.join(model_folder, 'Calf')
+
+# Define output files
+sensitivity_csv = os.path.join(input_folder, 'tree_sensitivity.csv')
+summary_csv = os.path.join(input_folder, 'tree_sensitivity_summary.csv')
+sensitivity_plot = os.path.join(input_folder, 'plots', 'tree_sensitivity.png')
+
+#### EVALUATE TREE COUNT SENSITIVITY
+
+# Loop through each iteration and evaluate nested subsets of trees
+sensitivity_list = []
+iteration = 1
+while iteration <= 50:
+    print(f'Evaluating tree count sensitivity for iteration {iteration} of 50...')
+    segment_start = time.time()
+
+    # Define classifier path
+    if iteration < 10:
+        classifier_path = os.path.join(input_folder, f'0{str(iteration)}', 'classifier.joblib')
+    else:
+        classifier_path = os.path.join(input_folder, str(iteration), 'classifier.joblib')
+
+    # Read outer results and load classifier for iteration
+    outer_results = read_result_store(store_folder,
+                                      'outer_results',
+                                      calf_status=calf_status,
+                                      iterations=[iteration])
+    classifier = joblib.load(classifier_path)
+
+    # Read the tree counts that the train and test script stored as presence columns
+    tree_counts = sorted(int(column.split('_')[1]) for column in outer_results.columns
+                         if column.startswith('presence_') and column.split('_')[1].isdigit())
+    if len(tree_counts) == 0:
+        raise ValueError(f'Outer results for iteration {iteration} do not contain presence columns for tree counts.')
+
+    # Evaluate performance and prediction time by tree count
+    sensitivity_table = evaluate_tree_sensitivity(outer_results, classifier, tree_counts, predictor_all)
+    sensitivity_table['iteration'] = iteration
+    sensitivity_list.append(sensitivity_table)
+
+    # Report success
+    segment_end = time.time()
+    segment_elapsed = int(segment_end - segment_start)
+    segment_success_time = datetime.datetime.now()
+    print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+    print('----------')
+
+    # Increase the iteration
+    iteration += 1
+
+# Export results for all iterations
+sensitivity_all = pd.concat(sensitivity_list, ignore_index=True)
+sensitivity_all.to_csv(sensitivity_csv, header=True, index=False, sep=',', encoding='utf-8')
+
+# Export a plot and summary of performance and prediction time by tree count
+print('Creating a plot of tree count sensitivity...')
+segment_start = time.time()
+plot_tree_sensitivity(sensitivity_all, 10, 3, sensitivity_plot, summary_csv)
+segment_end = time.time()
+segment_elapsed = int(segment_end - segment_start)
+segment_success_time = datetime.datetime.now()
+print(f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+print('----------')
@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Predict Habitat Selection Function for Points in Observed Paths
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-29
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.8+ distribution.
-# Description: "Predict Habitat Selection Function for Points in Observed Paths" predicts a random forest model (i.e., path selection function) to a set of grid csv files containing extracted covariate values to produce a set of output predictions with mean and standard deviation. The script must be run on a machine that can support 4 cores.
+# Description: "Predict Habitat Selection Function for Points in Observed Paths" predicts a random forest model (i.e., path selection function) to a set of grid csv files containing extracted covariate values to produce a set of output predictions with mean and standard deviation. Classifiers predict on the cores of the compute budget allocated by the pipeline runner or all cores of the machine when the script is run by hand.
 # ---------------------------------------------------------------------------
 
 # Import packages
@@ -18,14 +18,16 @@ import datetime
 # Import functions from repository statistics package
 from package_Statistics import predict_habitat_selection
 from package_Statistics import read_text_value
+from package_Pipeline import read_compute_budget
+from package_Pipeline import read_pipeline_parameter
 
 # Define round date
-round_date = 'round_20210820'
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
 
 #### SET UP DIRECTORIES, FILES, AND FIELDS
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define data folders
@@ -52,6 +54,10 @@ output_columns = retain_columns + coordinates
 # Define random state
 rstate = 21
 
+# Read compute budget
+compute_budget = read_compute_budget()
+print(f'Predicting classifiers on {compute_budget["cores"]} core(s) ({compute_budget["source"]} budget).')
+
 # For each calf status, predict model results
 calf_status = [0, 1]
 for status in calf_status:
@@ -84,6 +90,7 @@ for status in calf_status:
             threshold_path = os.path.join(input_folder, str(i), 'threshold.txt')
         # Load and append classifier
         classifier = joblib.load(classifier_path)
+        classifier.n_jobs = compute_budget['cores']
         model_set.append(classifier)
         # Read and append threshold
         threshold = read_text_value(threshold_path)
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Apply mask to habitat prediction
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-20
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed.
 # Description: "Apply mask to habitat prediction" extracts the habitat prediction to a mask raster of the study area excluding areas mapped as water in the NLCD 2016.
 # ---------------------------------------------------------------------------
 
@@ -12,14 +12,15 @@ import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import extract_to_boundary
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define round
-round_date = 'round_20210820'
-version = 'version_1.2_20210820'
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
+version = read_pipeline_parameter('version', 'version_1.2_20210820')
 
 # Define data folder
 data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
@@ -68,6 +69,7 @@ for raster in input_rasters:
         # Create key word arguments
         extract_kwargs = {'no_data_replace': '',
                           'work_geodatabase': work_geodatabase,
+                          'backend': 'numpy',
                           'input_array': extract_inputs,
                           'output_array': extract_outputs
                           }
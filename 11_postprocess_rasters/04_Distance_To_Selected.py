@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate Euclidean distance to habitat
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-04
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed.
 # Description: "Calculate Euclidean distance to habitat" converts continuous habitat to discrete habitat with non-habitat represented by -1, neutral habitat (or non-significant) represented by 0, and habitat represented by 1 and then calculates the Euclidean distance raster to values of 1.
 # ---------------------------------------------------------------------------
 
@@ -12,14 +12,15 @@ import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import convert_to_discrete
 from package_GeospatialProcessing import calculate_raw_distance
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define round
-round_date = 'round_20210820'
-version = 'version_1.2_20210820'
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
+version = read_pipeline_parameter('version', 'version_1.2_20210820')
 
 # Define data folder
 data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
@@ -56,10 +57,12 @@ for input_list in input_lists:
     # Create key word arguments
     discrete_kwargs = {'threshold': 0,
                        'work_geodatabase': work_geodatabase,
+                       'backend': 'numpy',
                        'input_array': input_list,
                        'output_array': [discrete_list[count - 1]]
                        }
     distance_kwargs = {'value': 1,
+                       'backend': 'numpy',
                        'work_geodatabase': work_geodatabase,
                        'input_array': [study_area, discrete_list[count-1]],
                        'output_array': [distance_list[count-1]]}
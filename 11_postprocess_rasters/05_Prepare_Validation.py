@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Prepare VHF Validation Data
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-06
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed or in a Python 3.6+ installation with rasterio and pyogrio installed.
 # Description: "Prepare VHF Validation Data" extracts distance to calving habitat to VHF validation points and calculates a zonal mean distance from calving habitat within the bounds of the VHF points to provide a reference frame.
 # ---------------------------------------------------------------------------
 
@@ -11,14 +11,15 @@
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import prepare_validation_points
+from package_Pipeline import read_pipeline_parameter
 
 # Set root directory
-drive = 'N:/'
+drive = read_pipeline_parameter('drive', 'N:/')
 root_folder = 'ACCS_Work'
 
 # Define round
-round_date = 'round_20210820'
-version = 'version_1.2_20210820'
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
+version = read_pipeline_parameter('version', 'version_1.2_20210820')
 
 # Define data folder
 data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
@@ -58,6 +59,7 @@ for input_list in input_lists:
 
     # Create key word arguments
     validation_kwargs = {'work_geodatabase': work_geodatabase,
+                         'backend': 'numpy',
                          'input_array': input_list,
                          'output_array': output_list
                          }
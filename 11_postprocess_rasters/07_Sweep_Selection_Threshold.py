@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Sweep selection threshold for proximal accuracy
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed.
+# Description: "Sweep selection threshold for proximal accuracy" converts continuous habitat to discrete habitat and calculates the Euclidean distance to habitat for a list of selection thresholds, samples the distances and the zonal mean distances at the VHF validation points for every threshold, and summarizes the proximal accuracy of each point set and calf status by threshold. The selection rasters are read once per calf status and thresholds that select the same cells share one distance calculation.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import arcpy
+import datetime
+import os
+import pandas as pd
+import time
+from package_GeospatialProcessing import summarize_proximal_accuracy
+from package_GeospatialProcessing import sweep_selection_distance
+from package_Pipeline import read_compute_budget
+from package_Pipeline import read_pipeline_parameter
+
+# Set root directory
+drive = read_pipeline_parameter('drive', 'N:/')
+root_folder = 'ACCS_Work'
+
+# Define round
+round_date = read_pipeline_parameter('round_date', 'round_20210820')
+version = read_pipeline_parameter('version', 'version_1.2_20210820')
+
+# Define selection thresholds
+thresholds = read_pipeline_parameter('selection_thresholds', [-0.2, -0.1, 0, 0.1, 0.2, 0.3, 0.4, 0.5])
+
+# Define data folder
+data_folder = os.path.join(drive, root_folder, 'Projects/WildlifeEcology/Moose_SouthwestAlaska/Data')
+work_geodatabase = os.path.join(data_folder, 'Moose_SouthwestAlaska.gdb')
+input_folder = os.path.join(data_folder, 'Data_Output/data_package', version)
+output_folder = os.path.join(data_folder, 'Data_Output/analysis_rasters', round_date)
+sweep_folder = os.path.join(output_folder, 'threshold_sweep')
+
+# Define input rasters
+study_area = os.path.join(data_folder, 'Data_Input/southwestAlaska_StudyArea.tif')
+calf_selection = os.path.join(input_folder,
+                              'Calf/rasters/SouthwestAlaska_Moose_Calving_Calf_Selection.tif')
+calf_significance = os.path.join(input_folder,
+                                 'Calf/rasters/SouthwestAlaska_Moose_Calving_Calf_Significance.tif')
+nocalf_selection = os.path.join(input_folder,
+                                'NoCalf/rasters/SouthwestAlaska_Moose_Calving_NoCalf_Selection.tif')
+nocalf_significance = os.path.join(input_folder,
+                                   'NoCalf/rasters/SouthwestAlaska_Moose_Calving_NoCalf_Significance.tif')
+
+# Define input VHF data
+validation_inputs = {'Togiak': os.path.join(work_geodatabase, 'cleanedVHFdata_Togiak'),
+                     'Nushagak': os.path.join(work_geodatabase, 'cleanedVHFdata_Nushagak')}
+
+# Define output tables
+validation_export = os.path.join(output_folder, 'cleanedVHFdata_ThresholdSweep_Extracted.csv')
+accuracy_export = os.path.join(output_folder, 'cleanedVHFdata_ThresholdSweep_Accuracy.csv')
+
+# Define input and output datasets
+input_lists = [[study_area, calf_selection, calf_significance],
+               [study_area, nocalf_selection, nocalf_significance]]
+output_names = ['SouthwestAlaska_Moose_Calving_Calf', 'SouthwestAlaska_Moose_Calving_NoCalf']
+status_names = ['calf', 'nocalf']
+
+# Read the attributes and coordinates of the validation points
+print('Reading validation points...')
+iteration_start = time.time()
+validation_points = {}
+point_attributes = []
+for point_set, point_feature in validation_inputs.items():
+    point_fields = [field.name for field in arcpy.ListFields(point_feature)
+                    if field.name != arcpy.Describe(point_feature).shapeFieldName]
+    point_array = arcpy.da.FeatureClassToNumPyArray(point_feature,
+                                                    point_fields + ['SHAPE@X', 'SHAPE@Y'],
+                                                    '',
+                                                    False,
+                                                    False,
+                                                    -99999)
+    validation_points[point_set] = (point_array['SHAPE@X'], point_array['SHAPE@Y'])
+    attribute_data = pd.DataFrame({field: point_array[field] for field in point_fields})
+    attribute_data.insert(0, 'point', range(len(attribute_data)))
+    attribute_data.insert(0, 'points', point_set)
+    point_attributes.append(attribute_data)
+point_attributes = pd.concat(point_attributes, ignore_index=True)
+# End timing
+iteration_end = time.time()
+iteration_elapsed = int(iteration_end - iteration_start)
+iteration_success_time = datetime.datetime.now()
+# Report success
+print(f'Completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+print('----------')
+
+# Sweep thresholds for each calf status
+compute_budget = read_compute_budget()
+validation_table = point_attributes
+count = 1
+for input_list in input_lists:
+    # Calculate discrete habitat and distance to habitat for all thresholds
+    print(f'Sweeping {len(thresholds)} thresholds for set {count} of {len(input_lists)}...')
+    threshold_table, point_table = sweep_selection_distance(input_list[0],
+                                                            input_list[1],
+                                                            input_list[2],
+                                                            thresholds,
+                                                            validation_points=validation_points,
+                                                            output_folder=sweep_folder,
+                                                            output_name=output_names[count - 1],
+                                                            threads=compute_budget['cores'])
+    print(threshold_table.to_string(index=False))
+    print('----------')
+
+    # Join the distances of the calf status to the validation points
+    status_name = status_names[count - 1]
+    point_table = point_table.rename(columns={'distance': f'distance_{status_name}', 'mean': f'mean_{status_name}'})
+    if 'threshold' in validation_table.columns:
+        validation_table = validation_table.merge(point_table, on=['points', 'point', 'threshold'], how='left')
+    else:
+        validation_table = validation_table.merge(point_table, on=['points', 'point'], how='left')
+    count += 1
+
+# Export the validation points and the proximal accuracy of each threshold
+print('Summarizing proximal accuracy by threshold...')
+iteration_start = time.time()
+validation_table.to_csv(validation_export, header=True, index=False, sep=',', encoding='utf-8')
+accuracy_table = summarize_proximal_accuracy(validation_table)
+accuracy_table.to_csv(accuracy_export, header=True, index=False, sep=',', encoding='utf-8')
+print(accuracy_table.to_string(index=False))
+# End timing
+iteration_end = time.time()
+iteration_elapsed = int(iteration_end - iteration_start)
+iteration_success_time = datetime.datetime.now()
+# Report success
+print(f'Completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+print('----------')
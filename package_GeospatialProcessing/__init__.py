@@ -2,20 +2,80 @@
 # ---------------------------------------------------------------------------
 # Initialization for Geospatial Processing Module
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-04
+# Last Updated: 2026-10-19
 # Usage: Individual functions have varying requirements. All functions that use arcpy must be executed in an ArcGIS Pro Python 3.6 distribution.
-# Description: This initialization file imports modules in the package so that the contents are accessible.
+# Description: This initialization file imports each module in the package the first time one of its functions is accessed so that the contents are accessible without loading unused modules and their dependencies.
 # ---------------------------------------------------------------------------
 
-# Import functions from modules
-from package_GeospatialProcessing.arcpyGeoprocessing import arcpy_geoprocessing
-from package_GeospatialProcessing.inverseDensityWeightedDistance import calculate_idw_distance
-from package_GeospatialProcessing.calculateRawDistance import calculate_raw_distance
-from package_GeospatialProcessing.combineRasterClasses import combine_raster_classes
-from package_GeospatialProcessing.convertToDiscrete import convert_to_discrete
-from package_GeospatialProcessing.createMinimumRaster import create_minimum_raster
-from package_GeospatialProcessing.extractFeaturesToRaster import extract_features_to_raster
-from package_GeospatialProcessing.extractToBoundary import extract_to_boundary
-from package_GeospatialProcessing.prepareValidationPoints import prepare_validation_points
-from package_GeospatialProcessing.projectXYTable import project_xy_table
-from package_GeospatialProcessing.sumRasters import sum_rasters
+# Import packages
+import importlib
+import sys
+
+# Define the module that contains each function
+function_modules = {'define_albers_constants': 'albersProjection',
+                    'project_albers': 'albersProjection',
+                    'project_table_albers': 'albersProjection',
+                    'unproject_albers': 'albersProjection',
+                    'arcpy_geoprocessing': 'arcpyGeoprocessing',
+                    'calculate_idw_distance': 'inverseDensityWeightedDistance',
+                    'calculate_raw_distance': 'calculateRawDistance',
+                    'calculate_weighted_edge_distance': 'calculateWeightedEdgeDistance',
+                    'combine_raster_classes': 'combineRasterClasses',
+                    'convert_to_discrete': 'convertToDiscrete',
+                    'buffer_convex_polygon': 'convexHullPolygons',
+                    'calculate_convex_hull': 'convexHullPolygons',
+                    'calculate_group_hulls': 'convexHullPolygons',
+                    'clip_polygon_to_convex': 'convexHullPolygons',
+                    'build_covariate_cube': 'covariateCube',
+                    'define_cube_bands': 'covariateCube',
+                    'mask_cube_values': 'covariateCube',
+                    'open_covariate_cube': 'covariateCube',
+                    'read_cube_window': 'covariateCube',
+                    'sample_cube_points': 'covariateCube',
+                    'create_minimum_raster': 'createMinimumRaster',
+                    'describe_raster': 'describeRaster',
+                    'euclidean_distance_transform': 'euclideanDistanceTransform',
+                    'execute_geoprocessing_job': 'executeGeoprocessingJob',
+                    'extract_features_to_raster': 'extractFeaturesToRaster',
+                    'extract_to_boundary': 'extractToBoundary',
+                    'hash_dataset': 'hashDataset',
+                    'convert_value_type': 'processRasterBlocks',
+                    'process_raster_blocks': 'processRasterBlocks',
+                    'calculate_zonal_means': 'prepareValidationPoints',
+                    'define_zone_window': 'prepareValidationPoints',
+                    'prepare_validation_points': 'prepareValidationPoints',
+                    'project_xy_table': 'projectXYTable',
+                    'read_raster_array': 'rasterArrayIO',
+                    'write_raster_array': 'rasterArrayIO',
+                    'define_polygon_edges': 'rasterizePolygons',
+                    'rasterize_polygon_block': 'rasterizePolygons',
+                    'rasterize_polygons': 'rasterizePolygons',
+                    'run_geoprocessing_batch': 'runGeoprocessingBatch',
+                    'define_edge_index': 'samplePolygonPoints',
+                    'sample_polygon_points': 'samplePolygonPoints',
+                    'test_points_in_polygon': 'samplePolygonPoints',
+                    'define_point_cells': 'sampleRasterPoints',
+                    'sample_raster_points': 'sampleRasterPoints',
+                    'scratch_workspace': 'scratchWorkspace',
+                    'sum_rasters': 'sumRasters',
+                    'define_selection_levels': 'sweepSelectionThresholds',
+                    'summarize_proximal_accuracy': 'sweepSelectionThresholds',
+                    'sweep_selection_distance': 'sweepSelectionThresholds'}
+__all__ = list(function_modules)
+
+# Import the module of a function when the function is first accessed
+def __getattr__(name):
+    if name not in function_modules:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    function = getattr(importlib.import_module(f'{__name__}.{function_modules[name]}'), name)
+    globals()[name] = function
+    return function
+
+# List all functions, including functions whose modules have not been imported
+def __dir__():
+    return sorted(set(globals()).union(function_modules))
+
+# Import all modules in Python 3.6, which does not support module attribute functions
+if sys.version_info < (3, 7):
+    for function_name in function_modules:
+        __getattr__(function_name)
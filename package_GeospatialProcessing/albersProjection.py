@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Albers projection
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy installed. Projection of data frames requires pandas.
+# Description: "Albers projection" is a set of functions that project geographic coordinates to and from NAD 1983 Alaska Albers (EPSG:3338) with the closed form equations of the ellipsoidal Albers equal area conic projection (Snyder 1987, USGS Professional Paper 1395, pp. 98-103). The functions operate on whole arrays so that millions of telemetry fixes can be projected without creating feature classes.
+# ---------------------------------------------------------------------------
+
+# Define the parameters of NAD 1983 Alaska Albers (EPSG:3338) on the GRS 1980 ellipsoid
+albers_parameters = {'semi_major_axis': 6378137.0,
+                     'inverse_flattening': 298.257222101,
+                     'standard_parallel_1': 55.0,
+                     'standard_parallel_2': 65.0,
+                     'latitude_of_origin': 50.0,
+                     'central_meridian': -154.0,
+                     'false_easting': 0.0,
+                     'false_northing': 0.0}
+
+# Define a function to calculate the constants of the projection
+def define_albers_constants(parameters=None):
+    """
+    Description: calculates the constants of an ellipsoidal Albers equal area conic projection
+    Inputs: 'parameters' -- an optional dictionary of projection parameters; defaults to NAD 1983 Alaska Albers
+    Returned Value: Returns a dictionary of the eccentricity, cone constant, and radius of the latitude of origin along with the projection parameters
+    Preconditions: standard parallels must not be symmetric about the equator
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Use Alaska Albers if no parameters are provided
+    if parameters is None:
+        parameters = albers_parameters
+
+    # Calculate the eccentricity of the ellipsoid
+    flattening = 1 / parameters['inverse_flattening']
+    eccentricity_squared = 2 * flattening - flattening ** 2
+    eccentricity = np.sqrt(eccentricity_squared)
+
+    # Define functions for the radius factor (m) and authalic factor (q) of a latitude
+    def calculate_m(latitude):
+        sine = np.sin(np.radians(latitude))
+        return np.cos(np.radians(latitude)) / np.sqrt(1 - eccentricity_squared * sine ** 2)
+
+    def calculate_q(latitude):
+        sine = np.sin(np.radians(latitude))
+        return (1 - eccentricity_squared) * (sine / (1 - eccentricity_squared * sine ** 2)
+                                             - np.log((1 - eccentricity * sine) / (1 + eccentricity * sine))
+                                             / (2 * eccentricity))
+
+    # Calculate the cone constant and the radius of the latitude of origin
+    m_1 = calculate_m(parameters['standard_parallel_1'])
+    m_2 = calculate_m(parameters['standard_parallel_2'])
+    q_0 = calculate_q(parameters['latitude_of_origin'])
+    q_1 = calculate_q(parameters['standard_parallel_1'])
+    q_2 = calculate_q(parameters['standard_parallel_2'])
+    cone = (m_1 ** 2 - m_2 ** 2) / (q_2 - q_1)
+    c_constant = m_1 ** 2 + cone * q_1
+    rho_0 = parameters['semi_major_axis'] * np.sqrt(c_constant - cone * q_0) / cone
+
+    # Store constants
+    constants = dict(parameters)
+    constants.update({'eccentricity': eccentricity,
+                      'eccentricity_squared': eccentricity_squared,
+                      'cone': cone,
+                      'c_constant': c_constant,
+                      'rho_0': rho_0,
+                      'q_pole': calculate_q(90.0)})
+
+    return constants
+
+# Define a function to project geographic coordinates to Albers
+def project_albers(longitude, latitude, parameters=None):
+    """
+    Description: projects longitude and latitude in decimal degrees to Albers equal area conic coordinates
+    Inputs: 'longitude' -- a number or array of longitudes in decimal degrees
+            'latitude' -- a number or array of latitudes in decimal degrees
+            'parameters' -- an optional dictionary of projection parameters; defaults to NAD 1983 Alaska Albers (EPSG:3338)
+    Returned Value: Returns arrays of x and y coordinates in meters
+    Preconditions: coordinates must be NAD 1983 (EPSG:4269); WGS 1984 (EPSG:4326) coordinates are treated as NAD 1983 without a datum transformation, which differs by less than 2 meters in Alaska
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate constants
+    constants = define_albers_constants(parameters)
+    eccentricity = constants['eccentricity']
+    cone = constants['cone']
+
+    # Calculate the authalic factor of each latitude
+    sine = np.sin(np.radians(np.asarray(latitude, dtype='float64')))
+    q = (1 - constants['eccentricity_squared']) * (sine / (1 - constants['eccentricity_squared'] * sine ** 2)
+                                                   - np.log((1 - eccentricity * sine) / (1 + eccentricity * sine))
+                                                   / (2 * eccentricity))
+
+    # Calculate the polar coordinates on the cone and convert them to plane coordinates
+    rho = constants['semi_major_axis'] * np.sqrt(constants['c_constant'] - cone * q) / cone
+    longitude_difference = (np.asarray(longitude, dtype='float64') - constants['central_meridian'] + 180) % 360 - 180
+    theta = cone * np.radians(longitude_difference)
+    x = constants['false_easting'] + rho * np.sin(theta)
+    y = constants['false_northing'] + constants['rho_0'] - rho * np.cos(theta)
+
+    return x, y
+
+# Define a function to project Albers coordinates to geographic coordinates
+def unproject_albers(x, y, parameters=None):
+    """
+    Description: projects Albers equal area conic coordinates to longitude and latitude in decimal degrees
+    Inputs: 'x' -- a number or array of x coordinates in meters
+            'y' -- a number or array of y coordinates in meters
+            'parameters' -- an optional dictionary of projection parameters; defaults to NAD 1983 Alaska Albers (EPSG:3338)
+    Returned Value: Returns arrays of longitude and latitude in decimal degrees on NAD 1983
+    Preconditions: latitude is calculated from the authalic latitude with the series of Snyder (1987, eq. 3-18), which is accurate to well below a millimeter
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate constants
+    constants = define_albers_constants(parameters)
+    eccentricity_squared = constants['eccentricity_squared']
+    cone = constants['cone']
+
+    # Calculate the polar coordinates on the cone
+    x_offset = np.asarray(x, dtype='float64') - constants['false_easting']
+    y_offset = constants['rho_0'] - (np.asarray(y, dtype='float64') - constants['false_northing'])
+    rho = np.hypot(x_offset, y_offset)
+    theta = np.arctan2(x_offset, y_offset)
+
+    # Calculate the authalic latitude and convert it to geodetic latitude
+    q = (constants['c_constant'] - (rho * cone / constants['semi_major_axis']) ** 2) / cone
+    authalic = np.arcsin(np.clip(q / constants['q_pole'], -1, 1))
+    latitude = (authalic
+                + (eccentricity_squared / 3 + 31 * eccentricity_squared ** 2 / 180
+                   + 517 * eccentricity_squared ** 3 / 5040) * np.sin(2 * authalic)
+                + (23 * eccentricity_squared ** 2 / 360 + 251 * eccentricity_squared ** 3 / 3780) * np.sin(4 * authalic)
+                + (761 * eccentricity_squared ** 3 / 45360) * np.sin(6 * authalic))
+    longitude = (constants['central_meridian'] + np.degrees(theta / cone) + 180) % 360 - 180
+
+    return longitude, np.degrees(latitude)
+
+# Define a function to project the coordinates of a data frame
+def project_table_albers(input_data, coordinate_fields, output_fields=('POINT_X', 'POINT_Y'), inverse=False,
+                         parameters=None):
+    """
+    Description: adds projected coordinates to a data frame of points
+    Inputs: 'input_data' -- a pandas data frame of points
+            'coordinate_fields' -- a list of the names of the fields for X and Y coordinates (in that order), which are longitude and latitude unless the projection is inverse
+            'output_fields' -- the names of the fields in which to store the projected X and Y coordinates
+            'inverse' -- boolean input to project Albers coordinates to longitude and latitude instead
+            'parameters' -- an optional dictionary of projection parameters; defaults to NAD 1983 Alaska Albers (EPSG:3338)
+    Returned Value: Returns a copy of the data frame with the projected coordinates
+    Preconditions: rows with missing coordinates receive missing projected coordinates
+    """
+
+    # Project coordinates
+    x_values = input_data[coordinate_fields[0]].to_numpy(dtype='float64')
+    y_values = input_data[coordinate_fields[1]].to_numpy(dtype='float64')
+    if inverse:
+        x_projected, y_projected = unproject_albers(x_values, y_values, parameters)
+    else:
+        x_projected, y_projected = project_albers(x_values, y_values, parameters)
+
+    # Add projected coordinates to a copy of the data frame
+    output_data = input_data.copy()
+    output_data[output_fields[0]] = x_projected
+    output_data[output_fields[1]] = y_projected
+
+    return output_data
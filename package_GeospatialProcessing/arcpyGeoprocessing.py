@@ -2,18 +2,116 @@
 # ---------------------------------------------------------------------------
 # Arcpy Geoprocessing Wrapper
 # Author: Timm Nawrocki
-# Last Updated: 2019-10-29
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
-# Description: "Arcpy Geoprocessing Wrapper" is a function that wraps other arcpy functions for standardization, input and output checks, and error reporting.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation for arcpy geoprocessing functions. Functions that do not use arcpy can be wrapped in any Python 3.6+ installation.
+# Description: "Arcpy Geoprocessing Wrapper" is a function that wraps other arcpy functions for standardization, input and output checks, output caching, and error reporting.
 # ---------------------------------------------------------------------------
 
+# Store cache hits and misses for the summary that is reported when the script exits
+cache_summary = {'hit': 0, 'miss': 0, 'registered': False}
+
+# Store file hashes so that inputs used by several steps are only read once
+hash_cache = {}
+
+# Define a function to report the cache summary
+def report_cache_summary():
+    """
+    Description: prints the number of geoprocessing steps that were skipped or executed based on the output cache
+    Inputs: None
+    Returned Value: Function prints the cache summary
+    Preconditions: registered to run when the script exits by the first call to arcpy_geoprocessing
+    """
+
+    # Report cache summary
+    total_steps = cache_summary['hit'] + cache_summary['miss']
+    if total_steps > 0:
+        print(f'Geoprocessing cache: {cache_summary["hit"]} of {total_steps} steps skipped (cache hits), '
+              f'{cache_summary["miss"]} executed (cache misses).')
+        print('----------')
+
+# Define a function to identify the cache record of an output
+def define_cache_file(output_data):
+    """
+    Description: identifies the sidecar file that stores the cache record of an output dataset
+    Inputs: 'output_data' -- path to an output dataset
+    Returned Value: Returns the path to the sidecar cache file
+    Preconditions: outputs in a file geodatabase have their cache records stored in a folder next to the geodatabase
+    """
+
+    # Import packages
+    import os
+
+    # Identify a geodatabase in the output path
+    output_data = os.path.abspath(output_data)
+    output_parts = output_data.split(os.sep)
+    for index, part in enumerate(output_parts[:-1]):
+        if part.lower().endswith('.gdb'):
+            geodatabase = os.sep.join(output_parts[:index + 1])
+            return os.path.join(geodatabase + '_cache', *output_parts[index + 1:]) + '.cache.json'
+
+    return output_data + '.cache.json'
+
+# Define a function to describe an output file so that outputs modified after caching are recomputed
+def define_output_signature(output_data):
+    """
+    Description: describes the size and modification time of an output file
+    Inputs: 'output_data' -- path to an output dataset
+    Returned Value: Returns a list of size and modification time or None if the output is not a single file
+    Preconditions: None
+    """
+
+    # Import packages
+    import os
+
+    # Describe output file
+    if os.path.isfile(output_data):
+        output_stat = os.stat(output_data)
+        return [output_stat.st_size, output_stat.st_mtime_ns]
+
+    return None
+
+# Define a function to list the source files whose changes invalidate the cached outputs of a function
+def define_function_sources(geoprocessing_function):
+    """
+    Description: lists the source file of a function and all Python source files of its package
+    Inputs: 'geoprocessing_function' -- the function whose outputs are cached
+    Returned Value: Returns a sorted list of absolute source file paths, which is empty if the source of the function cannot be found
+    Preconditions: functions in a package (e.g., the numpy backends of package_GeospatialProcessing) do most of their work in other modules of the package, so all of its modules are included
+    """
+
+    # Import packages
+    import glob
+    import inspect
+    import os
+
+    # Find the source file of the function
+    try:
+        function_file = inspect.getsourcefile(geoprocessing_function)
+    except TypeError:
+        function_file = None
+    if not function_file:
+        return []
+    function_file = os.path.abspath(function_file)
+
+    # Add the modules of the package that contains the function
+    function_folder = os.path.dirname(function_file)
+    source_files = {function_file}
+    if os.path.exists(os.path.join(function_folder, '__init__.py')):
+        source_files.update(os.path.abspath(file_path) for file_path in glob.glob(os.path.join(function_folder, '*.py')))
+
+    return sorted(source_files)
+
 # Define a wrapper function for arcpy geoprocessing tasks
-def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input = True, **kwargs):
+def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input = True, use_cache = True,
+                        cache_exclude = ('work_geodatabase',), raise_errors = False, **kwargs):
     """
-    Description: wraps arcpy geoprocessing and data access functions for file checks, message reporting, and errors.
+    Description: wraps arcpy geoprocessing and data access functions for file checks, output caching, message reporting, and errors.
     Inputs: geoprocessing function -- any arcpy geoprocessing or data access processing steps defined as a function that receive ** kwargs arguments.
             check_output -- boolean input to control if the function should check if the output already exists prior to executing geoprocessing function
             check_input -- boolean input to control if the function should check if the inputs already exist prior to executing geoprocessing function
+            use_cache -- boolean input to control if the function should skip the geoprocessing function when all outputs exist and their cache records match the function, key word arguments, and input contents
+            cache_exclude -- key word arguments that do not affect the outputs and are excluded from the cache key
+            raise_errors -- boolean input to control if missing inputs and arcpy errors should raise exceptions instead of exiting so that a batch executor can retry the function
             **kwargs -- key word arguments that are used in the wrapper and passed to the geoprocessing function
                 'input_array' -- if check_input == True, then the input datasets must be passed as an array
                 'output_array' -- if check_output == True, then the output datasets must be passed as an array
@@ -22,21 +120,90 @@ def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input
     """
 
     # Import packages
-    import arcpy
+    import atexit
+    import datetime
+    import hashlib
+    import json
+    import os
     import sys
+    from package_GeospatialProcessing import hash_dataset
+
+    # Use arcpy to check datasets if it is installed so that numpy backends can also be wrapped on machines without arcpy
+    try:
+        import arcpy
+        dataset_exists = arcpy.Exists
+        execute_error = arcpy.ExecuteError
+    except ImportError:
+        # Without arcpy, datasets in a file geodatabase are checked by the existence of the geodatabase
+        def dataset_exists(dataset):
+            return os.path.exists(dataset) or (os.path.dirname(dataset).lower().endswith('.gdb')
+                                               and os.path.isdir(os.path.dirname(dataset)))
+        execute_error = ()
+
+    # Register the cache summary to be reported when the script exits
+    if use_cache == True and cache_summary['registered'] == False:
+        atexit.register(report_cache_summary)
+        cache_summary['registered'] = True
 
     try:
-        # If check_output is True, then check if output exists and warn of overwrite if it does
-        if check_output == True:
-            for output_data in kwargs['output_array']:
-                if arcpy.Exists(output_data) == True:
-                    print(f"{output_data} already exists and will be overwritten.")
         # If check_input is True, then check if inputs exist and quit if any do not
         if check_input == True:
             for input_data in kwargs['input_array']:
-                if arcpy.Exists(input_data) != True:
+                if dataset_exists(input_data) != True:
+                    if raise_errors == True:
+                        raise FileNotFoundError(f'{input_data} does not exist.')
                     print(f'{input_data} does not exist. Check that environment workspace is correct.')
                     sys.exit()
+
+        # If use_cache is True, then compare the cache key with the cache records of the outputs
+        if use_cache == True:
+            input_array = list(kwargs.get('input_array', []))
+            output_array = list(kwargs.get('output_array', []))
+            cache_files = [define_cache_file(output_data) for output_data in output_array]
+
+            # Read existing cache records and reuse their file hashes
+            cache_records = []
+            for cache_file in cache_files:
+                if os.path.exists(cache_file):
+                    with open(cache_file, 'r', encoding='utf-8') as cache_reader:
+                        cache_record = json.load(cache_reader)
+                    for file_path, file_entry in cache_record.get('hash_cache', {}).items():
+                        hash_cache.setdefault(file_path, file_entry)
+                    cache_records.append(cache_record)
+                else:
+                    cache_records.append(None)
+
+            # Create the cache key from the function, the sources of its package, the key word arguments, and the input contents
+            function_sources = define_function_sources(geoprocessing_function)
+            cache_parameters = {key: value for key, value in kwargs.items()
+                                if key not in ('input_array', 'output_array') and key not in cache_exclude}
+            input_hashes = [hash_dataset(input_data, hash_cache) for input_data in input_array]
+            cache_content = {'function': f'{geoprocessing_function.__module__}.{geoprocessing_function.__name__}',
+                             'function_hashes': {os.path.basename(source_file): hash_dataset(source_file, hash_cache)
+                                                 for source_file in function_sources},
+                             'parameters': cache_parameters,
+                             'inputs': [os.path.abspath(input_data) for input_data in input_array],
+                             'input_hashes': input_hashes,
+                             'outputs': [os.path.abspath(output_data) for output_data in output_array]}
+            cache_key = hashlib.sha256(json.dumps(cache_content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+            # Skip the geoprocessing function if all outputs exist and match the cache key
+            if (len(output_array) > 0
+                    and all(dataset_exists(output_data) for output_data in output_array)
+                    and all(cache_record is not None
+                            and cache_record.get('cache_key') == cache_key
+                            and cache_record.get('output_signature') == define_output_signature(output_data)
+                            for cache_record, output_data in zip(cache_records, output_array))):
+                print(f'\tOutputs are up to date with inputs and parameters (cache hit); skipping {cache_content["function"]}.')
+                cache_summary['hit'] += 1
+                return None
+            cache_summary['miss'] += 1
+
+        # If check_output is True, then check if output exists and warn of overwrite if it does
+        if check_output == True:
+            for output_data in kwargs['output_array']:
+                if dataset_exists(output_data) == True:
+                    print(f"{output_data} already exists and will be overwritten.")
         # Execute geoprocessing function if all input data exists
         out_process = geoprocessing_function(**kwargs)
         # Provide results report
@@ -45,7 +212,25 @@ def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input
             print(out_process.getMessage(msg_count - 1))
         except:
             print(out_process)
+
+        # Write a cache record for each output that was created
+        if use_cache == True:
+            cached_files = [os.path.abspath(file_path) for file_path in input_array + function_sources]
+            for output_data, cache_file in zip(output_array, cache_files):
+                if dataset_exists(output_data) == True:
+                    if not os.path.exists(os.path.dirname(cache_file)):
+                        os.makedirs(os.path.dirname(cache_file))
+                    cache_record = {'cache_key': cache_key,
+                                    'created': datetime.datetime.now().strftime('%Y-%m-%d %H:%M'),
+                                    'output_signature': define_output_signature(output_data),
+                                    'content': cache_content,
+                                    'hash_cache': {file_path: hash_cache[file_path] for file_path in cached_files
+                                                   if file_path in hash_cache}}
+                    with open(cache_file, 'w', encoding='utf-8') as cache_writer:
+                        json.dump(cache_record, cache_writer, indent=2, default=str)
     # Provide arcpy errors for execution error
-    except arcpy.ExecuteError as err:
+    except execute_error as err:
+        if raise_errors == True:
+            raise RuntimeError(arcpy.GetMessages()) from err
         print(arcpy.GetMessages())
-        sys.exit()
\ No newline at end of file
+        sys.exit()
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate raw distance
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Calculate raw distance" is a function that calculates Euclidean distance to a single value
 # ---------------------------------------------------------------------------
 
@@ -13,36 +13,103 @@ def calculate_raw_distance(**kwargs):
     Description: calculates an accumulated distance to a target value in a raster
     Inputs: 'value' -- the target value to calculate distance
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the distance calculation: 'arcpy' (default) for EucDistance or 'numpy' for an exact Euclidean distance transform that does not require arcpy
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing the study area raster (must be first) and a target raster
             'output_array' -- an array containing the output raster
     Returned Value: Returns a raster dataset on disk containing the combined raster
-    Preconditions: requires a target raster and a value that exists in that raster
+    Preconditions: requires a target raster and a value that exists in that raster; the numpy backend requires a target raster on the same grid as the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import EucDistance
-    from arcpy.sa import ExtractByMask
-    from arcpy.sa import Raster
-    from arcpy.sa import SetNull
     import datetime
     import time
 
     # Parse key word argument inputs
     value = kwargs['value']
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     study_area = kwargs['input_array'][0]
     input_raster = kwargs['input_array'][1]
     output_raster = kwargs['output_array'][0]
 
+    # Calculate distances with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import numpy as np
+        from package_GeospatialProcessing import euclidean_distance_transform
+        from package_GeospatialProcessing import read_raster_array
+        from package_GeospatialProcessing import write_raster_array
+
+        # Read the study area and target rasters
+        print(f'\tReading target raster into memory...')
+        iteration_start = time.time()
+        study_array, study_mask, study_profile = read_raster_array(study_area)
+        input_array, input_mask, input_profile = read_raster_array(input_raster)
+        del study_array
+        if (input_array.shape != study_mask.shape
+                or not input_profile['transform'].almost_equals(study_profile['transform'])):
+            raise ValueError('Target raster must have the same extent and cell size as the study area raster.')
+        target_mask = input_mask & (input_array == value)
+        del input_array, input_mask
+        if not target_mask.any():
+            raise ValueError(f'Target raster never equals {value}.')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Calculate distances
+        print(f'\tCalculating distances...')
+        iteration_start = time.time()
+        distance_array = euclidean_distance_transform(target_mask,
+                                                      cell_size=abs(study_profile['transform'].a),
+                                                      threads=kwargs.get('threads'))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Save the distances within the study area to disk
+        print(f'\tSaving distance raster to disk...')
+        iteration_start = time.time()
+        output_array = np.where(study_mask, distance_array, -32768).astype('float32')
+        write_raster_array(output_raster, output_array, study_profile, 'float32', -32768)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = f'Calculated distance to {value} with the numpy backend.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import EucDistance
+    from arcpy.sa import ExtractByMask
+    from arcpy.sa import Raster
+    from arcpy.sa import SetNull
+    from package_Pipeline import read_compute_budget
+
     # Set overwrite option
     arcpy.env.overwriteOutput = True
 
     # Set workspace
     arcpy.env.workspace = work_geodatabase
 
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "66%"
+    # Use the cores of the compute budget on processes that can be split.
+    arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
 
     # Set snap raster, extent, and cell size
     arcpy.env.snapRaster = study_area
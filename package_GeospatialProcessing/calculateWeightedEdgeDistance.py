@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate weighted edge distance
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy, scipy, and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Calculate weighted edge distance" is a function that calculates the minimum inverse density-weighted distance to all foliar cover values greater than or equal to a minimum cover in memory from a single read of the cover raster. The result is equivalent to calculating the inverse density-weighted distance for each cover value and combining the results with a minimum mosaic. The distance to any target divided by the lowest density bounds the result from above, so the distance transform of each cover value is calculated tile by tile only within the density times the largest current weighted distance of the tile, and tiles without targets of the cover value within that bound are skipped.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate the minimum inverse density-weighted distance over all cover values
+def calculate_weighted_edge_distance(**kwargs):
+    """
+    Description: calculates the per-cell minimum of distance/(n/100) over all cover values n greater than or equal to a minimum cover
+    Inputs: 'minimum_cover' -- an integer value of the lowest foliar cover value to use as a target
+            'no_data' -- the no data value of the output raster
+            'tile_size' -- optional number of rows and columns in a tile of the bounded distance transforms (default 1024)
+            'threads' -- optional number of threads that process tiles; defaults to the cores of the compute budget
+            'input_array' -- an array containing the study area raster (must be first) and the foliar cover raster (must be second)
+            'output_array' -- an array containing the output raster
+    Returned Value: Returns a 32 bit signed integer raster dataset on disk containing the minimum inverse density-weighted distance in map units with decimals truncated
+    Preconditions: requires an integer foliar cover raster on the same grid as the study area raster (e.g., the output of sum_rasters) and square cells; weighted distances are exact within the study area and are stored as float32 before truncation
+    """
+
+    # Import packages
+    import concurrent.futures
+    import datetime
+    import math
+    import numpy as np
+    from scipy.ndimage import distance_transform_edt
+    import threading
+    import time
+    from package_GeospatialProcessing import read_raster_array
+    from package_GeospatialProcessing import write_raster_array
+    from package_Pipeline import read_compute_budget
+
+    # Parse key word argument inputs
+    minimum_cover = kwargs['minimum_cover']
+    no_data = kwargs['no_data']
+    tile_size = kwargs.get('tile_size', 1024)
+    threads = kwargs.get('threads')
+    if threads is None:
+        threads = read_compute_budget()['cores']
+    study_area = kwargs['input_array'][0]
+    input_raster = kwargs['input_array'][1]
+    output_raster = kwargs['output_array'][0]
+
+    # Read the study area and cover rasters
+    print(f'\tReading cover raster into memory...')
+    iteration_start = time.time()
+    study_array, study_mask, study_profile = read_raster_array(study_area)
+    cover_array, cover_mask, cover_profile = read_raster_array(input_raster)
+    del study_array
+    # Check that the rasters share a grid
+    if (cover_array.shape != study_mask.shape
+            or not cover_profile['transform'].almost_equals(study_profile['transform'])):
+        raise ValueError('Cover raster must have the same extent and cell size as the study area raster.')
+    cell_size = abs(cover_profile['transform'].a)
+    if abs(abs(cover_profile['transform'].e) - cell_size) > cell_size * 1e-6:
+        raise ValueError('Cover raster must have square cells.')
+    # Identify target cells and the cover values that occur in them
+    cover_array = np.where(cover_mask, cover_array, 0).astype('int16' if cover_array.max() <= 32767 else 'int32')
+    del cover_mask
+    target_mask = cover_array >= minimum_cover
+    cover_values = np.unique(cover_array[target_mask])
+    if len(cover_values) == 0:
+        raise ValueError(f'Foliar cover is never greater than or equal to {minimum_cover}%.')
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Calculate the distance to any target cell, which bounds the weighted distance of each cell from above
+    print(f'\tCalculating distance to cover values from {cover_values[0]}% to {cover_values[-1]}%...')
+    iteration_start = time.time()
+    edge_array = (distance_transform_edt(~target_mask) * (cell_size * 100 / cover_values[0])).astype('float32')
+    full_count = 1
+    del target_mask
+
+    # Define tiles that contain study area cells
+    row_count, column_count = cover_array.shape
+    tiles = [(row_start, column_start)
+             for row_start in range(0, row_count, tile_size)
+             for column_start in range(0, column_count, tile_size)
+             if study_mask[row_start:row_start + tile_size, column_start:column_start + tile_size].any()]
+    level_lock = threading.Lock()
+    tile_counts = {'calculated': 0, 'skipped': 0}
+
+    # Define a function to lower the weighted distance of a tile with the targets of a cover value within its bound
+    def update_tile(tile, target_value, density, level_distance):
+        row_start, column_start = tile
+        row_end = min(row_start + tile_size, row_count)
+        column_end = min(column_start + tile_size, column_count)
+        tile_edge = edge_array[row_start:row_end, column_start:column_end]
+        tile_study = study_mask[row_start:row_end, column_start:column_end]
+        # Targets farther than the density times the largest weighted distance of the tile cannot lower it
+        max_distance = density * float(tile_edge[tile_study].max())
+        halo = int(math.ceil(max_distance / cell_size))
+        halo_rows = (max(row_start - halo, 0), min(row_end + halo, row_count))
+        halo_columns = (max(column_start - halo, 0), min(column_end + halo, column_count))
+        # Use one transform of the full grid when a halo covers most of the grid
+        if (halo_rows[1] - halo_rows[0]) * (halo_columns[1] - halo_columns[0]) > row_count * column_count // 2:
+            with level_lock:
+                if len(level_distance) == 0:
+                    level_distance.append(distance_transform_edt(cover_array != target_value) * cell_size)
+            tile_distance = level_distance[0][row_start:row_end, column_start:column_end]
+        else:
+            halo_mask = cover_array[halo_rows[0]:halo_rows[1], halo_columns[0]:halo_columns[1]] == target_value
+            if not halo_mask.any():
+                with level_lock:
+                    tile_counts['skipped'] += 1
+                return
+            tile_distance = distance_transform_edt(~halo_mask) * cell_size
+            tile_distance = tile_distance[row_start - halo_rows[0]:row_end - halo_rows[0],
+                                          column_start - halo_columns[0]:column_end - halo_columns[0]]
+            with level_lock:
+                tile_counts['calculated'] += 1
+        np.minimum(tile_edge, (tile_distance / density).astype('float32'), out=tile_edge)
+
+    # Lower the weighted distance with each cover value starting from the highest, which has the lowest weight
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for target_value in cover_values[::-1]:
+            level_distance = []
+            list(executor.map(lambda tile: update_tile(tile, target_value, target_value / 100, level_distance), tiles))
+            full_count += len(level_distance)
+    cover_array = None
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(f'\tCalculated {full_count} full grid transforms and {tile_counts["calculated"]} bounded tile transforms '
+          f'for {len(cover_values)} cover values; skipped {tile_counts["skipped"]} tiles without targets within their bound.')
+    print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Save the edge raster to disk with decimals truncated and cells outside the study area set to no data
+    print(f'\tSaving edge raster to disk...')
+    iteration_start = time.time()
+    output_array = np.full(edge_array.shape, no_data, dtype='int32')
+    output_mask = study_mask & np.isfinite(edge_array)
+    output_array[output_mask] = np.trunc(edge_array[output_mask]).astype('int32')
+    write_raster_array(output_raster, output_array, study_profile, 'int32', no_data)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+    out_process = f'Successfully calculated minimum inverse density-weighted distance for {len(cover_values)} cover values.'
+    return out_process
@@ -2,11 +2,33 @@
 # ---------------------------------------------------------------------------
 # Combine raster classes
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Combine raster classes" is a function that creates a new raster from a set of existing rasters by selecting only particular classes from each.
 # ---------------------------------------------------------------------------
 
+# Define a block kernel to select classes from an input block
+def class_raster_blocks(input_blocks, class_values, out_value):
+    """
+    Description: assigns an output value to the cells of an input block that have one of a set of positive class values
+    Inputs: 'input_blocks' -- a list containing a masked categorical array
+            'class_values' -- a list of class values to select
+            'out_value' -- output value to assign to selected cells
+    Returned Value: Returns a masked array that has the output value in selected cells and is masked elsewhere
+    Preconditions: used as a block kernel for process_raster_blocks with functools.partial to set the class values and output value
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Select classes
+    input_block = input_blocks[0]
+    selected_mask = (~np.ma.getmaskarray(input_block)
+                     & np.isin(input_block.data, class_values)
+                     & (input_block.data > 0))
+
+    return np.ma.array(np.full(input_block.shape, out_value), mask=~selected_mask)
+
 # Define a function to create a raster from multiple categorical input rasters
 def combine_raster_classes(**kwargs):
     """
@@ -16,19 +38,16 @@ def combine_raster_classes(**kwargs):
             'statements' -- select by attribute SQL queries to perform for each input raster
             'out_value' -- output value to assign to combined raster
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the selection: 'arcpy' (default) for map algebra or 'numpy' to select classes block by block from statements of the form 'VALUE = n' or 'VALUE IN (n, m)'
+            'block_size' -- optional number of rows and columns in a block for the numpy backend (default 1024)
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing the study area raster (must be first) and input rasters to combine (order must match the order of statements)
             'output_array' -- an array containing the output raster
     Returned Value: Returns a raster dataset on disk containing the combined raster
-    Preconditions: requires existing categorical raster datasets
+    Preconditions: requires existing categorical raster datasets; the numpy backend requires an input raster that is aligned with the grid of the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import Con
-    from arcpy.sa import ExtractByAttributes
-    from arcpy.sa import ExtractByMask
-    from arcpy.sa import Raster
-    from arcpy.sa import SetNull
     import datetime
     import time
 
@@ -38,18 +57,72 @@ def combine_raster_classes(**kwargs):
     statement = kwargs['statement']
     out_value = kwargs['out_value']
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     study_area = kwargs['input_array'][0]
     input_raster = kwargs['input_array'][1]
     output_raster = kwargs['output_array'][0]
 
+    # Select classes block by block with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import functools
+        import numpy as np
+        import re
+        from package_GeospatialProcessing import convert_value_type
+        from package_GeospatialProcessing import process_raster_blocks
+
+        # Parse the class values from the selection statement
+        statement_match = re.fullmatch(r'\s*value\s*(?:=\s*(-?\d+)|in\s*\(([-\d\s,]+)\))\s*', statement, re.IGNORECASE)
+        if statement_match is None:
+            raise ValueError(f'Statement \'{statement}\' is not supported by the numpy backend.')
+        if statement_match.group(1) is not None:
+            class_values = [int(statement_match.group(1))]
+        else:
+            class_values = [int(value) for value in statement_match.group(2).split(',')]
+
+        # Convert the arcpy value type and no data value to numpy
+        output_type = convert_value_type(value_type)
+        no_data_value = np.dtype(output_type).type(float(no_data))
+
+        # Select classes and extract to study area
+        print(f'\tSelecting {len(class_values)} classes block by block...')
+        iteration_start = time.time()
+        process_raster_blocks(functools.partial(class_raster_blocks, class_values=class_values, out_value=out_value),
+                              study_area,
+                              [input_raster],
+                              output_raster,
+                              output_type,
+                              no_data_value,
+                              block_size=kwargs.get('block_size', 1024),
+                              threads=kwargs.get('threads'))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = 'Successfully merged raster categories.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import Con
+    from arcpy.sa import ExtractByAttributes
+    from arcpy.sa import ExtractByMask
+    from arcpy.sa import Raster
+    from arcpy.sa import SetNull
+    from package_Pipeline import read_compute_budget
+
     # Set overwrite option
     arcpy.env.overwriteOutput = True
 
     # Set workspace
     arcpy.env.workspace = work_geodatabase
 
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "66%"
+    # Use the cores of the compute budget on processes that can be split.
+    arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
 
     # Set snap raster, extent, and cell size
     arcpy.env.snapRaster = study_area
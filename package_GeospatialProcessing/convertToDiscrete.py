@@ -2,46 +2,103 @@
 # ---------------------------------------------------------------------------
 # Convert to discrete
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Convert to discrete" is a function that converts a continuous distribution to a discrete distribution including a negative state (-1), a non-significant state (0), and a positive state (1).
 # ---------------------------------------------------------------------------
 
+# Define a block kernel to convert continuous and significance blocks to a three state discrete block
+def discrete_raster_blocks(input_blocks, threshold):
+    """
+    Description: converts a continuous block and a significance block to a three state discrete block
+    Inputs: 'input_blocks' -- a list containing a masked continuous array and a masked significance array
+            'threshold' -- the continuous raster threshold
+    Returned Value: Returns a masked array that is 0 where the significance equals the threshold and otherwise 1 or -1 where the continuous value is above or not above the threshold
+    Preconditions: used as a block kernel for process_raster_blocks with functools.partial to set the threshold
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Convert blocks to discrete values
+    continuous_block, significance_block = input_blocks
+    non_significant = significance_block.data == threshold
+    discrete_values = np.where(non_significant, 0, np.where(continuous_block.data > threshold, 1, -1))
+    discrete_mask = (np.ma.getmaskarray(significance_block)
+                     | (~non_significant & np.ma.getmaskarray(continuous_block)))
+
+    return np.ma.array(discrete_values, mask=discrete_mask)
+
 # Define a function to convert a continuous binary raster and a significance raster to a three state discrete raster
 def convert_to_discrete(**kwargs):
     """
     Description: converts a continuous raster and a significance raster to a three state discrete raster
     Inputs: 'threshold' -- the continuous raster threshold
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the conversion: 'arcpy' (default) for map algebra or 'numpy' to convert the rasters block by block
+            'block_size' -- optional number of rows and columns in a block for the numpy backend (default 1024)
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing the study area raster (must be first), a continuous raster, and a binary significance raster where significant = 1 and non-significant = 0
             'output_array' -- an array containing the output raster
     Returned Value: Returns a raster dataset on disk containing the combined raster
-    Preconditions: requires continuous and significance rasters
+    Preconditions: requires continuous and significance rasters; the numpy backend requires rasters that are aligned with the grid of the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import Con
-    from arcpy.sa import Raster
     import datetime
     import time
 
     # Parse key word argument inputs
     threshold = kwargs['threshold']
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     study_area = kwargs['input_array'][0]
     continuous_raster = kwargs['input_array'][1]
     significance_raster = kwargs['input_array'][2]
     output_raster = kwargs['output_array'][0]
 
+    # Convert the rasters block by block with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import functools
+        from package_GeospatialProcessing import process_raster_blocks
+
+        # Convert continuous raster to discrete raster
+        print(f'\tConverting raster to discrete representation block by block...')
+        iteration_start = time.time()
+        process_raster_blocks(functools.partial(discrete_raster_blocks, threshold=threshold),
+                              study_area,
+                              [continuous_raster, significance_raster],
+                              output_raster,
+                              'int8',
+                              -128,
+                              block_size=kwargs.get('block_size', 1024),
+                              threads=kwargs.get('threads'))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = 'Converted continuous raster to discrete representation.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import Con
+    from arcpy.sa import Raster
+    from package_Pipeline import read_compute_budget
+
     # Set overwrite option
     arcpy.env.overwriteOutput = True
 
     # Set workspace
     arcpy.env.workspace = work_geodatabase
 
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "66%"
+    # Use the cores of the compute budget on processes that can be split.
+    arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
 
     # Set snap raster, extent, and cell size
     arcpy.env.snapRaster = study_area
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Convex hull polygons
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy installed.
+# Description: "Convex hull polygons" is a set of functions that calculate the convex hull of the points of each group (e.g., the telemetry fixes of each deployment) with the monotone chain algorithm, buffer convex polygons, and clip polygons to a convex polygon. Points that cannot be on a hull are removed for all groups at once before the hulls are calculated so that millions of points can be processed in memory.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate the convex hull of a set of points
+def calculate_convex_hull(x, y):
+    """
+    Description: calculates the convex hull of a set of points with the monotone chain algorithm
+    Inputs: 'x' -- an array of x coordinates
+            'y' -- an array of y coordinates
+    Returned Value: Returns an array of the hull vertices with shape (n, 2) in counter-clockwise order without a repeated closing vertex; fewer than three vertices are returned if the points are a single point or collinear
+    Preconditions: coordinates must be finite
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Sort unique points by x and then y
+    points = np.unique(np.column_stack([np.asarray(x, dtype='float64'), np.asarray(y, dtype='float64')]), axis=0)
+    if len(points) < 3:
+        return points
+
+    # Define a function to build a chain that turns left at every vertex
+    def build_chain(chain_points):
+        chain = []
+        for point in chain_points.tolist():
+            while len(chain) >= 2 and ((chain[-1][0] - chain[-2][0]) * (point[1] - chain[-2][1])
+                                       - (chain[-1][1] - chain[-2][1]) * (point[0] - chain[-2][0])) <= 0:
+                chain.pop()
+            chain.append(point)
+        return chain
+
+    # Join the lower and upper chains
+    lower_chain = build_chain(points)
+    upper_chain = build_chain(points[::-1])
+
+    return np.array(lower_chain[:-1] + upper_chain[:-1], dtype='float64')
+
+# Define a function to calculate the convex hull of each group of points
+def calculate_group_hulls(x, y, groups):
+    """
+    Description: calculates the convex hull of the points of each group
+    Inputs: 'x' -- an array of x coordinates
+            'y' -- an array of y coordinates
+            'groups' -- an array of the group (e.g., deployment id) of each point; integer group codes (e.g., from pandas.factorize) sort much faster than strings
+    Returned Value: Returns a dictionary of hull vertex arrays in counter-clockwise order keyed by group
+    Preconditions: coordinates must be finite
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Sort points by group and number the groups in sorted order
+    groups = np.asarray(groups)
+    order = np.argsort(groups, kind='stable')
+    x = np.asarray(x, dtype='float64')[order]
+    y = np.asarray(y, dtype='float64')[order]
+    groups = groups[order]
+    is_start = np.concatenate([[True], groups[1:] != groups[:-1]]) if len(groups) > 0 else np.zeros(0, dtype=bool)
+    group_starts = np.flatnonzero(is_start)
+    group_values = groups[group_starts]
+    group_codes = np.cumsum(is_start) - 1
+
+    # Find the leftmost, lowest, rightmost, and highest point of each group
+    def find_extreme(values, find_maximum):
+        extreme_values = (np.maximum if find_maximum else np.minimum).reduceat(values, group_starts)
+        is_extreme = values == extreme_values[group_codes]
+        extreme_index = np.full(len(group_values), -1)
+        extreme_index[group_codes[is_extreme][::-1]] = np.flatnonzero(is_extreme)[::-1]
+        return extreme_index
+
+    quadrilateral = np.stack([find_extreme(x, False),
+                              find_extreme(y, False),
+                              find_extreme(x, True),
+                              find_extreme(y, True)], axis=1)
+
+    # Remove points strictly inside the quadrilateral of the extreme points, which cannot be on the hull
+    is_inside = np.ones(len(x), dtype=bool)
+    for corner in range(4):
+        start_index = quadrilateral[group_codes, corner]
+        end_index = quadrilateral[group_codes, (corner + 1) % 4]
+        cross_product = ((x[end_index] - x[start_index]) * (y - y[start_index])
+                         - (y[end_index] - y[start_index]) * (x - x[start_index]))
+        is_inside &= cross_product > 0
+    x = x[~is_inside]
+    y = y[~is_inside]
+    group_codes = group_codes[~is_inside]
+    group_bounds = np.searchsorted(group_codes, np.arange(len(group_values) + 1))
+
+    # Calculate the hull of the remaining points of each group
+    hulls = {}
+    for group_code, group_value in enumerate(group_values.tolist()):
+        start, end = group_bounds[group_code], group_bounds[group_code + 1]
+        hulls[group_value] = calculate_convex_hull(x[start:end], y[start:end])
+
+    return hulls
+
+# Define a function to buffer a convex polygon
+def buffer_convex_polygon(vertices, distance, segments=90):
+    """
+    Description: buffers a convex polygon, line segment, or point by a distance
+    Inputs: 'vertices' -- an array of polygon vertices with shape (n, 2)
+            'distance' -- the buffer distance in the units of the coordinates
+            'segments' -- the number of segments used to approximate a full circle at each vertex
+    Returned Value: Returns an array of the buffered polygon vertices in counter-clockwise order
+    Preconditions: the buffer of a convex polygon is convex, so it is calculated as the hull of circles around the vertices; the circles are circumscribed so that the buffer is never narrower than the distance
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Place a circumscribed polygon around each vertex and return the hull of all circle vertices
+    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    radius = distance / np.cos(np.pi / segments)
+    offsets = np.column_stack([np.cos(angles), np.sin(angles)]) * radius
+    circle_points = (np.asarray(vertices, dtype='float64')[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, 2)
+
+    return calculate_convex_hull(circle_points[:, 0], circle_points[:, 1])
+
+# Define a function to clip polygon rings to a convex polygon
+def clip_polygon_to_convex(rings, convex_polygon):
+    """
+    Description: clips the rings of a polygon to a convex polygon with the Sutherland-Hodgman algorithm
+    Inputs: 'rings' -- a list of vertex arrays with shape (n, 2) for the exterior and interior rings of a polygon
+            'convex_polygon' -- an array of the vertices of a convex polygon in counter-clockwise order
+    Returned Value: Returns a list of the clipped rings that are not empty
+    Preconditions: the clipped rings describe the intersection under the even-odd rule; clipped concave rings can contain edges of zero width along the boundary of the convex polygon that are removed when the rings are simplified
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Clip each ring by each edge of the convex polygon
+    convex_polygon = np.asarray(convex_polygon, dtype='float64')
+    clipped_rings = []
+    for ring in rings:
+        ring = np.asarray(ring, dtype='float64')
+        if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+            ring = ring[:-1]
+        for edge_start, edge_end in zip(convex_polygon, np.roll(convex_polygon, -1, axis=0)):
+            if len(ring) == 0:
+                break
+            # Determine which vertices are inside the edge
+            edge_vector = edge_end - edge_start
+            side = edge_vector[0] * (ring[:, 1] - edge_start[1]) - edge_vector[1] * (ring[:, 0] - edge_start[0])
+            next_ring = np.roll(ring, -1, axis=0)
+            next_side = np.roll(side, -1)
+            is_inside = side >= 0
+            next_inside = next_side >= 0
+            # Calculate the intersections of ring segments that cross the edge
+            with np.errstate(divide='ignore', invalid='ignore'):
+                fraction = side / (side - next_side)
+                intersections = ring + (next_ring - ring) * fraction[:, np.newaxis]
+            # Each segment emits its intersection when it crosses the edge and its end vertex when the end is inside
+            crosses = is_inside != next_inside
+            emitted = np.stack([intersections, next_ring], axis=1)
+            is_emitted = np.column_stack([crosses, next_inside])
+            ring = emitted[is_emitted]
+        if len(ring) >= 3:
+            clipped_rings.append(ring)
+
+    return clipped_rings
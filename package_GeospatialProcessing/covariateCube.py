@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Covariate cube
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Covariate cube" is a set of functions that snap a set of covariate rasters to the grid of a study area raster and store them as one memory-mapped array of square tiles with a predictor name index. Each tile holds all bands of its rows and columns contiguously, so a window is read from a few contiguous ranges of the file, and cells without data hold a no data value instead of a separate mask. Readers open the cube once and receive windows of all bands or values at points without reading or aligning the individual rasters.
+# ---------------------------------------------------------------------------
+
+# Define a function to build a covariate cube
+def build_covariate_cube(study_area, covariate_rasters, output_folder, tile_size=1024, threads=None):
+    """
+    Description: snaps covariate rasters to the grid of a study area raster and stores them in a memory-mapped cube of tiles
+    Inputs: 'study_area' -- path to the study area raster that defines the grid of the cube and the cells that receive values
+            'covariate_rasters' -- a dictionary of covariate raster paths keyed by predictor name in band order
+            'output_folder' -- a folder in which to store the cube values ('values.npy') and the cube index ('cube.json')
+            'tile_size' -- the number of rows and columns in a tile of the cube
+            'threads' -- the number of threads that snap covariates; defaults to the cores of the compute budget
+    Returned Value: Returns the cube index dictionary and stores the cube on disk
+    Preconditions: covariates are resampled to the study area grid with nearest neighbor, which copies the values of rasters that are already aligned; values are stored with shape (tile row, tile column, band, row, column) in the smallest data type that holds the native data types of all covariates exactly; cells without data and the padding of edge tiles are NaN for floating point cubes and the minimum (signed) or maximum (unsigned) value of the data type for integer cubes, and a ValueError is raised if a covariate contains that value as data
+    """
+
+    # Import packages
+    import concurrent.futures
+    import json
+    import math
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+    from rasterio.windows import Window
+    from package_Pipeline import read_compute_budget
+
+    # Define number of threads
+    if threads is None:
+        threads = read_compute_budget()['cores']
+
+    # Read the study area grid and the native data type of each covariate
+    with rasterio.open(study_area) as study_reader:
+        grid_profile = study_reader.profile.copy()
+    covariate_types = {}
+    for predictor, raster in covariate_rasters.items():
+        with rasterio.open(raster) as covariate_reader:
+            covariate_types[predictor] = covariate_reader.dtypes[0]
+    value_type = np.result_type(*covariate_types.values())
+    cube_shape = (len(covariate_rasters), grid_profile['height'], grid_profile['width'])
+    tile_rows = math.ceil(cube_shape[1] / tile_size)
+    tile_columns = math.ceil(cube_shape[2] / tile_size)
+
+    # Define the no data value of the cube
+    if np.issubdtype(value_type, np.floating):
+        no_data = None
+        fill_value = np.nan
+    elif np.issubdtype(value_type, np.unsignedinteger):
+        no_data = int(np.iinfo(value_type).max)
+        fill_value = no_data
+    else:
+        no_data = int(np.iinfo(value_type).min)
+        fill_value = no_data
+
+    # Create temporary cube files so that interrupted builds do not leave partial cubes
+    os.makedirs(output_folder, exist_ok=True)
+    values_file = os.path.join(output_folder, 'values.npy')
+    index_file = os.path.join(output_folder, 'cube.json')
+    cube_values = np.lib.format.open_memmap(values_file + '.temporary', mode='w+', dtype=value_type,
+                                            shape=(tile_rows, tile_columns, cube_shape[0], tile_size, tile_size))
+
+    # Define the tiles of the study area grid
+    windows = [Window(column, row,
+                      min(tile_size, grid_profile['width'] - column),
+                      min(tile_size, grid_profile['height'] - row))
+               for row in range(0, grid_profile['height'], tile_size)
+               for column in range(0, grid_profile['width'], tile_size)]
+
+    # Define a function to snap a covariate to the study area grid tile by tile
+    def snap_covariate(band):
+        predictor = list(covariate_rasters)[band]
+        with rasterio.open(study_area) as study_reader, \
+                rasterio.open(covariate_rasters[predictor]) as covariate_reader, \
+                WarpedVRT(covariate_reader,
+                          crs=grid_profile['crs'],
+                          transform=grid_profile['transform'],
+                          width=grid_profile['width'],
+                          height=grid_profile['height'],
+                          resampling=Resampling.nearest) as snapped_reader:
+            for window in windows:
+                study_mask = study_reader.read_masks(1, window=window) > 0
+                snapped_values = snapped_reader.read(1, window=window, masked=True)
+                data_mask = study_mask & ~np.ma.getmaskarray(snapped_values)
+                # Treat non-finite floating point values as no data
+                if np.issubdtype(snapped_values.dtype, np.floating):
+                    data_mask &= np.isfinite(snapped_values.data)
+                tile_values = np.full((tile_size, tile_size), fill_value, dtype=value_type)
+                tile_values[:int(window.height), :int(window.width)] = np.where(data_mask, snapped_values.data,
+                                                                                 fill_value)
+                if no_data is not None and (snapped_values.data[data_mask] == no_data).any():
+                    raise ValueError(f'{predictor} contains the cube no data value {no_data} as data.')
+                cube_values[int(window.row_off) // tile_size, int(window.col_off) // tile_size, band] = tile_values
+        return band
+
+    # Snap covariates on multiple threads that each write their own band
+    if threads > 1 and cube_shape[0] > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(threads, cube_shape[0])) as executor:
+            list(executor.map(snap_covariate, range(cube_shape[0])))
+    else:
+        for band in range(cube_shape[0]):
+            snap_covariate(band)
+    # Flush and release the memory map so that the file can be moved on Windows
+    cube_values.flush()
+    cube_values = None
+
+    # Move the cube into place and write the index last so that an index always describes a complete cube
+    os.replace(values_file + '.temporary', values_file)
+    if os.path.exists(os.path.join(output_folder, 'mask.npy')):
+        os.remove(os.path.join(output_folder, 'mask.npy'))
+    cube_index = {'predictors': list(covariate_rasters),
+                  'native_types': covariate_types,
+                  'value_type': value_type.name,
+                  'no_data': no_data,
+                  'shape': list(cube_shape),
+                  'tile_size': tile_size,
+                  'transform': list(grid_profile['transform'])[:6],
+                  'crs': grid_profile['crs'].to_wkt() if grid_profile['crs'] is not None else None,
+                  'sources': {predictor: os.path.abspath(raster) for predictor, raster in covariate_rasters.items()}}
+    with open(index_file + '.temporary', 'w') as index_writer:
+        json.dump(cube_index, index_writer, indent=2)
+    os.replace(index_file + '.temporary', index_file)
+
+    return cube_index
+
+# Define a function to open a covariate cube
+def open_covariate_cube(cube_folder):
+    """
+    Description: opens the tiles of a covariate cube as a read-only memory map
+    Inputs: 'cube_folder' -- a folder that contains a cube built with build_covariate_cube
+    Returned Value: Returns a dictionary of the memory-mapped tiles ('values') with shape (tile row, tile column, band, row, column), the cube shape of bands, rows, and columns ('shape'), the tile size ('tile_size'), the no data value ('no_data', None for NaN), the predictor names in band order ('predictors'), the band of each predictor ('bands'), the grid transform ('transform'), and the cube index ('index')
+    Preconditions: the cube is read from disk only where it is accessed, so opening a cube does not read its values
+    """
+
+    # Import packages
+    import json
+    import math
+    import numpy as np
+    import os
+    from rasterio import Affine
+
+    # Read the cube index and map the cube file
+    with open(os.path.join(cube_folder, 'cube.json'), 'r') as index_reader:
+        cube_index = json.load(index_reader)
+    cube_values = np.load(os.path.join(cube_folder, 'values.npy'), mmap_mode='r')
+    band_count, row_count, column_count = cube_index['shape']
+    tile_size = cube_index['tile_size']
+    if cube_values.shape != (math.ceil(row_count / tile_size), math.ceil(column_count / tile_size),
+                             band_count, tile_size, tile_size):
+        raise ValueError(f'Cube files in {cube_folder} do not match the cube index.')
+
+    return {'values': cube_values,
+            'shape': tuple(cube_index['shape']),
+            'tile_size': tile_size,
+            'no_data': cube_index['no_data'],
+            'predictors': cube_index['predictors'],
+            'bands': {predictor: band for band, predictor in enumerate(cube_index['predictors'])},
+            'transform': Affine(*cube_index['transform']),
+            'index': cube_index}
+
+# Define a function to find the bands of a list of predictors
+def define_cube_bands(covariate_cube, predictors=None):
+    """
+    Description: finds the cube bands of a list of predictors in the order of the list
+    Inputs: 'covariate_cube' -- a cube opened with open_covariate_cube
+            'predictors' -- an optional list of predictor names (e.g., predictor_all); defaults to all bands
+    Returned Value: Returns a slice when the predictors are consecutive bands in cube order and a list of bands otherwise
+    Preconditions: raises a ValueError for predictors that are not in the cube
+    """
+
+    # Return all bands if no predictors are listed
+    if predictors is None:
+        return slice(0, len(covariate_cube['predictors']))
+
+    # Find the band of each predictor
+    missing_predictors = [predictor for predictor in predictors if predictor not in covariate_cube['bands']]
+    if len(missing_predictors) > 0:
+        raise ValueError(f'Predictors {", ".join(missing_predictors)} are not in the covariate cube.')
+    bands = [covariate_cube['bands'][predictor] for predictor in predictors]
+
+    # Use a slice for consecutive bands so that windows within a tile are views of the memory map
+    if len(bands) > 0 and bands == list(range(bands[0], bands[0] + len(bands))):
+        return slice(bands[0], bands[0] + len(bands))
+
+    return bands
+
+# Define a function to mask the no data values of a covariate cube
+def mask_cube_values(covariate_cube, cube_values):
+    """
+    Description: finds the cells of an array of cube values that hold data
+    Inputs: 'covariate_cube' -- a cube opened with open_covariate_cube
+            'cube_values' -- an array of values read from the cube
+    Returned Value: Returns a boolean array of the shape of the values that is True where values are valid
+    Preconditions: the no data value of the cube is NaN when the index stores None
+    """
+
+    # Import packages
+    import numpy as np
+
+    if covariate_cube['no_data'] is None:
+        return ~np.isnan(cube_values)
+
+    return cube_values != covariate_cube['no_data']
+
+# Define a function to read a window of a covariate cube
+def read_cube_window(covariate_cube, window, predictors=None):
+    """
+    Description: reads the values and no data mask of a window of a covariate cube for a list of predictors
+    Inputs: 'covariate_cube' -- a cube opened with open_covariate_cube
+            'window' -- a rasterio window on the grid of the cube
+            'predictors' -- an optional list of predictor names in the order of the output bands; defaults to all bands
+    Returned Value: Returns arrays of values and of a mask that is True where values are valid with shape (band, row, column)
+    Preconditions: the values are a read-only view of the memory map without a copy when the window lies within one tile and the predictors are consecutive bands in cube order; other windows are assembled from the tiles that they overlap
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define bands and window extent
+    bands = define_cube_bands(covariate_cube, predictors)
+    band_count = len(range(covariate_cube['shape'][0])[bands]) if isinstance(bands, slice) else len(bands)
+    tile_size = covariate_cube['tile_size']
+    row_start = int(window.row_off)
+    column_start = int(window.col_off)
+    row_end = min(row_start + int(window.height), covariate_cube['shape'][1])
+    column_end = min(column_start + int(window.width), covariate_cube['shape'][2])
+    tile_rows = range(row_start // tile_size, (row_end - 1) // tile_size + 1)
+    tile_columns = range(column_start // tile_size, (column_end - 1) // tile_size + 1)
+
+    # Read the window from its tile or from each tile that overlaps it
+    if len(tile_rows) == 1 and len(tile_columns) == 1:
+        tile_row = tile_rows[0]
+        tile_column = tile_columns[0]
+        window_values = covariate_cube['values'][tile_row, tile_column, bands,
+                                                 row_start - tile_row * tile_size:row_end - tile_row * tile_size,
+                                                 column_start - tile_column * tile_size:column_end - tile_column * tile_size]
+    else:
+        window_values = np.empty((band_count, row_end - row_start, column_end - column_start),
+                                 dtype=covariate_cube['values'].dtype)
+        for tile_row in tile_rows:
+            overlap_start = max(row_start, tile_row * tile_size)
+            overlap_end = min(row_end, (tile_row + 1) * tile_size)
+            for tile_column in tile_columns:
+                column_overlap_start = max(column_start, tile_column * tile_size)
+                column_overlap_end = min(column_end, (tile_column + 1) * tile_size)
+                window_values[:,
+                              overlap_start - row_start:overlap_end - row_start,
+                              column_overlap_start - column_start:column_overlap_end - column_start] = \
+                    covariate_cube['values'][tile_row, tile_column, bands,
+                                             overlap_start - tile_row * tile_size:overlap_end - tile_row * tile_size,
+                                             column_overlap_start - tile_column * tile_size:
+                                             column_overlap_end - tile_column * tile_size]
+
+    return window_values, mask_cube_values(covariate_cube, window_values)
+
+# Define a function to sample a covariate cube at points
+def sample_cube_points(covariate_cube, x, y, predictors=None):
+    """
+    Description: samples all bands of a covariate cube at a set of points
+    Inputs: 'covariate_cube' -- a cube opened with open_covariate_cube
+            'x' -- an array of x coordinates in the coordinate system of the cube
+            'y' -- an array of y coordinates in the coordinate system of the cube
+            'predictors' -- an optional list of predictor names in the order of the output columns; defaults to all bands
+    Returned Value: Returns a float64 array with one row per point and one column per predictor that is NaN for points outside the cube or in no data cells
+    Preconditions: points are sampled in tile and row order so that the memory map is read sequentially
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Convert coordinates to rows and columns with the inverse of the grid transform
+    transform = covariate_cube['transform']
+    band_count, row_count, column_count = covariate_cube['shape']
+    tile_size = covariate_cube['tile_size']
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    columns = np.floor((x - transform.c) / transform.a)
+    rows = np.floor((y - transform.f) / transform.e)
+    points = np.flatnonzero((rows >= 0) & (rows < row_count) & (columns >= 0) & (columns < column_count))
+    rows = rows[points].astype('int64')
+    columns = columns[points].astype('int64')
+
+    # Order the points by their position in the tiles of the cube
+    tile_rows, tile_row_offsets = np.divmod(rows, tile_size)
+    tile_columns, tile_column_offsets = np.divmod(columns, tile_size)
+    positions = (((tile_rows * covariate_cube['values'].shape[1] + tile_columns) * tile_size + tile_row_offsets)
+                 * tile_size + tile_column_offsets)
+    cell_order = np.argsort(positions, kind='stable')
+    points = points[cell_order]
+    tile_rows = tile_rows[cell_order]
+    tile_columns = tile_columns[cell_order]
+    tile_row_offsets = tile_row_offsets[cell_order]
+    tile_column_offsets = tile_column_offsets[cell_order]
+
+    # Look up the values of each band at the point cells
+    bands = define_cube_bands(covariate_cube, predictors)
+    bands = range(band_count)[bands] if isinstance(bands, slice) else bands
+    point_values = np.full((len(x), len(bands)), np.nan)
+    for column, band in enumerate(bands):
+        band_values = covariate_cube['values'][tile_rows, tile_columns, band, tile_row_offsets, tile_column_offsets]
+        valid_values = mask_cube_values(covariate_cube, band_values)
+        band_values = band_values.astype('float64')
+        band_values[~valid_values] = np.nan
+        point_values[points, column] = band_values
+
+    return point_values
@@ -2,11 +2,30 @@
 # ---------------------------------------------------------------------------
 # Create minimum raster
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Create minimum raster" is a function that creates a new raster from a set of existing rasters using a minimum value rule and extracts to a study area.
 # ---------------------------------------------------------------------------
 
+# Define a block kernel to calculate the minimum of input blocks
+def minimum_raster_blocks(input_blocks):
+    """
+    Description: calculates the minimum of masked input blocks
+    Inputs: 'input_blocks' -- a list of masked numeric arrays
+    Returned Value: Returns a masked array of minimum values that is masked where no input has data
+    Preconditions: used as a block kernel for process_raster_blocks
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate minimum
+    minimum_block = np.full(input_blocks[0].shape, np.inf)
+    for input_block in input_blocks:
+        np.minimum(minimum_block, input_block.astype('float64').filled(np.inf), out=minimum_block)
+
+    return np.ma.masked_invalid(minimum_block)
+
 # Define a function to create a minimum raster from multiple numeric input rasters
 def create_minimum_raster(**kwargs):
     """
@@ -16,16 +35,16 @@ def create_minimum_raster(**kwargs):
             'value_type' -- the raster value type
             'no_data' -- the raster no data value
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the mosaic: 'arcpy' (default) for a mosaic to new raster followed by extraction to the study area or 'numpy' to stream the input rasters block by block into the study area grid and write the output once
+            'block_size' -- optional number of rows and columns in a block for the numpy backend (default 1024)
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing the study area raster (must be first) and all input rasters from which to calculate the minimum (order does not matter)
             'output_array' -- an array containing the output minimum raster
     Returned Value: Returns a raster dataset on disk containing the minimum value raster
-    Preconditions: requires existing numeric raster datasets of the same value type
+    Preconditions: requires existing numeric raster datasets of the same value type; the numpy backend requires input rasters in the output projection that are aligned with the grid of the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import ExtractByMask
-    from arcpy.sa import Raster
     import datetime
     import os
     import time
@@ -36,94 +55,147 @@ def create_minimum_raster(**kwargs):
     value_type = kwargs['value_type']
     no_data = kwargs['no_data']
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     input_rasters = kwargs['input_array']
     study_area = input_rasters.pop(0)
     output_raster = kwargs['output_array'][0]
 
-    # Define intermediate files
-    output_location = os.path.split(output_raster)[0]
-    mosaic_name = 'merged_raster.tif'
-    mosaic_raster = os.path.join(output_location, mosaic_name)
-
-    # Set overwrite option
-    arcpy.env.overwriteOutput = True
-
-    # Set workspace
-    arcpy.env.workspace = work_geodatabase
-
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "66%"
-
-    # Set snap raster, extent, and cell size
-    arcpy.env.snapRaster = study_area
-    arcpy.env.extent = Raster(study_area).extent
-    arcpy.env.cellSize = "MINOF"
-
-    # Define the target projection
-    composite_projection = arcpy.SpatialReference(output_projection)
-
-    # Mosaic input rasters to new raster using minimum
-    print(f'\tMerging {len(input_rasters)} rasters using minimum value...')
-    iteration_start = time.time()
-    arcpy.management.MosaicToNewRaster(input_rasters,
-                                       output_location,
-                                       mosaic_name,
-                                       composite_projection,
-                                       value_type,
-                                       cell_size,
-                                       '1',
-                                       'MINIMUM',
-                                       'FIRST'
-                                       )
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
-
-    # Extract raster to study area
-    print(f'\tExtracting merged raster to study area...')
-    iteration_start = time.time()
-    extract_raster = ExtractByMask(mosaic_raster, study_area)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
-
-    # Save the summed raster to disk
-    print(f'\tSaving extracted raster to disk...')
-    iteration_start = time.time()
-    arcpy.management.CopyRaster(extract_raster,
-                                output_raster,
-                                '',
-                                '',
-                                no_data,
-                                'NONE',
-                                'NONE',
-                                value_type,
-                                'NONE',
-                                'NONE',
-                                'TIFF',
-                                'NONE',
-                                'CURRENT_SLICE',
-                                'NO_TRANSPOSE')
-    # Delete mosaic raster if it exists
-    if arcpy.Exists(mosaic_raster) == 1:
-        arcpy.management.Delete(mosaic_raster)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+    # Stream the input rasters into the study area grid with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import numpy as np
+        import rasterio
+        from rasterio.crs import CRS
+        from package_GeospatialProcessing import convert_value_type
+        from package_GeospatialProcessing import process_raster_blocks
+
+        # Convert the arcpy value type and no data value to numpy
+        output_type = convert_value_type(value_type)
+        no_data_value = np.dtype(output_type).type(float(no_data))
+
+        # Check the cell size of the study area and the projection of the input rasters
+        with rasterio.open(study_area) as study_reader:
+            study_transform = study_reader.transform
+        if (abs(study_transform.a - cell_size) > cell_size * 1e-6
+                or abs(abs(study_transform.e) - cell_size) > cell_size * 1e-6):
+            raise ValueError(f'Study area raster must have a cell size of {cell_size}.')
+        for raster in input_rasters:
+            with rasterio.open(raster) as input_reader:
+                if input_reader.crs is None or input_reader.crs.to_epsg() != output_projection:
+                    raise ValueError(f'{raster} must be in the output projection (EPSG:{output_projection}).')
+
+        # Calculate the minimum of the input rasters for each block
+        print(f'\tMerging {len(input_rasters)} rasters using minimum value block by block...')
+        iteration_start = time.time()
+        process_raster_blocks(minimum_raster_blocks,
+                              study_area,
+                              input_rasters,
+                              output_raster,
+                              output_type,
+                              no_data_value,
+                              block_size=kwargs.get('block_size', 1024),
+                              threads=kwargs.get('threads'),
+                              output_crs=CRS.from_epsg(output_projection))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = 'Successfully created minimum raster.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import ExtractByMask
+    from arcpy.sa import Raster
+    from package_GeospatialProcessing import scratch_workspace
+    from package_Pipeline import read_compute_budget
+
+    # Store the mosaic in a scratch workspace that is deleted when the extraction completes or fails
+    with scratch_workspace('minimum_raster') as define_scratch:
+        # Define intermediate files
+        mosaic_raster = define_scratch('merged_raster', 'raster')
+        output_location, mosaic_name = os.path.split(mosaic_raster)
+
+        # Set overwrite option
+        arcpy.env.overwriteOutput = True
+
+        # Set workspace
+        arcpy.env.workspace = work_geodatabase
+
+        # Use the cores of the compute budget on processes that can be split.
+        arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
+
+        # Set snap raster, extent, and cell size
+        arcpy.env.snapRaster = study_area
+        arcpy.env.extent = Raster(study_area).extent
+        arcpy.env.cellSize = "MINOF"
+
+        # Define the target projection
+        composite_projection = arcpy.SpatialReference(output_projection)
+
+        # Mosaic input rasters to new raster using minimum
+        print(f'\tMerging {len(input_rasters)} rasters using minimum value...')
+        iteration_start = time.time()
+        arcpy.management.MosaicToNewRaster(input_rasters,
+                                           output_location,
+                                           mosaic_name,
+                                           composite_projection,
+                                           value_type,
+                                           cell_size,
+                                           '1',
+                                           'MINIMUM',
+                                           'FIRST'
+                                           )
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Extract raster to study area
+        print(f'\tExtracting merged raster to study area...')
+        iteration_start = time.time()
+        extract_raster = ExtractByMask(mosaic_raster, study_area)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Save the summed raster to disk
+        print(f'\tSaving extracted raster to disk...')
+        iteration_start = time.time()
+        arcpy.management.CopyRaster(extract_raster,
+                                    output_raster,
+                                    '',
+                                    '',
+                                    no_data,
+                                    'NONE',
+                                    'NONE',
+                                    value_type,
+                                    'NONE',
+                                    'NONE',
+                                    'TIFF',
+                                    'NONE',
+                                    'CURRENT_SLICE',
+                                    'NO_TRANSPOSE')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
     out_process = 'Successfully created minimum raster.'
     return out_process
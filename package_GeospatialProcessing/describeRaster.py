@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Describe raster
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Describe raster" is a function that calculates the value type, no data value, grid, extent, minimum, maximum, data and no data counts, and the value histogram of an integer raster in a single streaming pass. The statistics are stored in a sidecar file next to the raster and are reused until the content hash of the raster changes.
+# ---------------------------------------------------------------------------
+
+# Define a function to describe a raster with statistics stored in a sidecar file
+def describe_raster(input_raster, hash_cache=None, strip_rows=1024, maximum_values=65536):
+    """
+    Description: returns the properties and statistics of the first band of a raster from a sidecar file or calculates them in one pass
+    Inputs: 'input_raster' -- path to a raster dataset
+            'hash_cache' -- an optional dictionary of previous file hashes keyed by absolute path that is read and updated in place
+            'strip_rows' -- the number of rows read at a time when the statistics are calculated
+            'maximum_values' -- the maximum number of distinct values in a stored histogram; rasters with more distinct values (e.g., distance rasters) are stored without a histogram
+    Returned Value: Returns a dictionary with the numpy data type ('dtype'), arcpy value type ('value_type'), no data value ('no_data'), dimensions ('width', 'height'), cell size ('cell_size'), extent ('bounds'), coordinate system ('crs'), count of cells with data ('count') and without data ('no_data_count'), minimum ('minimum'), maximum ('maximum'), and a dictionary of counts by value ('histogram') that is None for floating point rasters and rasters with more distinct values than the maximum
+    Preconditions: the sidecar is stored as the raster path with '.stats.json' appended and is replaced when the raster content changes
+    """
+
+    # Import packages
+    import json
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    from package_GeospatialProcessing import hash_dataset
+
+    # Create an empty cache if none was provided
+    if hash_cache is None:
+        hash_cache = {}
+
+    # Read the sidecar and reuse its file hash if the raster has the same size and modification time
+    raster_path = os.path.abspath(input_raster)
+    statistics_file = raster_path + '.stats.json'
+    statistics = None
+    if os.path.exists(statistics_file):
+        with open(statistics_file, 'r', encoding='utf-8') as statistics_reader:
+            statistics = json.load(statistics_reader)
+        hash_cache.setdefault(raster_path, statistics['hash_entry'])
+    raster_hash = hash_dataset(raster_path, hash_cache)
+    if raster_hash is None:
+        raise ValueError(f'{input_raster} does not exist.')
+
+    # Calculate statistics if the sidecar does not exist or does not match the raster content
+    if statistics is None or statistics['hash_entry']['hash'] != raster_hash:
+        # Define arcpy value types
+        value_types = {'uint8': '8_BIT_UNSIGNED',
+                       'int8': '8_BIT_SIGNED',
+                       'uint16': '16_BIT_UNSIGNED',
+                       'int16': '16_BIT_SIGNED',
+                       'uint32': '32_BIT_UNSIGNED',
+                       'int32': '32_BIT_SIGNED',
+                       'float32': '32_BIT_FLOAT',
+                       'float64': '64_BIT'}
+
+        # Stream the raster in strips of rows
+        with rasterio.open(raster_path) as raster_reader:
+            value_type = np.dtype(raster_reader.dtypes[0])
+            is_integer = np.issubdtype(value_type, np.integer)
+            value_counts = {} if is_integer else None
+            data_count = 0
+            minimum = None
+            maximum = None
+            for row in range(0, raster_reader.height, strip_rows):
+                window = Window(0, row, raster_reader.width, min(strip_rows, raster_reader.height - row))
+                strip_values = raster_reader.read(1, window=window, masked=True)
+                if not is_integer:
+                    strip_values = np.ma.masked_invalid(strip_values)
+                strip_values = strip_values.compressed()
+                if strip_values.size == 0:
+                    continue
+                data_count += strip_values.size
+                strip_minimum = strip_values.min().item()
+                strip_maximum = strip_values.max().item()
+                minimum = strip_minimum if minimum is None else min(minimum, strip_minimum)
+                maximum = strip_maximum if maximum is None else max(maximum, strip_maximum)
+                # Count values with a shifted bincount for narrow value ranges and unique values otherwise
+                if value_counts is not None:
+                    if strip_maximum - strip_minimum <= maximum_values:
+                        strip_counts = np.bincount((strip_values.astype('int64') - strip_minimum))
+                        strip_values = np.flatnonzero(strip_counts) + strip_minimum
+                        strip_counts = strip_counts[strip_counts > 0]
+                    else:
+                        strip_values, strip_counts = np.unique(strip_values, return_counts=True)
+                    for value, count in zip(strip_values.tolist(), strip_counts.tolist()):
+                        value_counts[value] = value_counts.get(value, 0) + count
+                    if len(value_counts) > maximum_values:
+                        value_counts = None
+
+            # Store statistics
+            raster_stat = os.stat(raster_path)
+            statistics = {'hash_entry': {'size': raster_stat.st_size,
+                                         'mtime_ns': raster_stat.st_mtime_ns,
+                                         'hash': raster_hash},
+                          'dtype': value_type.name,
+                          'value_type': value_types.get(value_type.name),
+                          'no_data': raster_reader.nodata,
+                          'width': raster_reader.width,
+                          'height': raster_reader.height,
+                          'cell_size': [abs(raster_reader.transform.a), abs(raster_reader.transform.e)],
+                          'bounds': list(raster_reader.bounds),
+                          'crs': raster_reader.crs.to_wkt() if raster_reader.crs is not None else None,
+                          'count': data_count,
+                          'no_data_count': raster_reader.width * raster_reader.height - data_count,
+                          'minimum': minimum,
+                          'maximum': maximum,
+                          'histogram': ({str(value): value_counts[value] for value in sorted(value_counts)}
+                                        if value_counts is not None else None)}
+
+        # Write the sidecar through a temporary file so that interrupted writes do not leave partial statistics
+        temporary_file = statistics_file + '.temporary'
+        with open(temporary_file, 'w', encoding='utf-8') as statistics_writer:
+            json.dump(statistics, statistics_writer, indent=2)
+        os.replace(temporary_file, statistics_file)
+
+    # Return statistics with integer histogram keys
+    raster_statistics = {key: value for key, value in statistics.items() if key != 'hash_entry'}
+    if raster_statistics['histogram'] is not None:
+        raster_statistics['histogram'] = {int(value): count for value, count in raster_statistics['histogram'].items()}
+
+    return raster_statistics
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Euclidean distance transform
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy installed.
+# Description: "Euclidean distance transform" is a function that calculates the exact Euclidean distance from every cell of a grid to the nearest target cell with the separable lower envelope algorithm of Felzenszwalb and Huttenlocher. Columns are processed in vertical strips and rows in horizontal strips on multiple threads, and a maximum distance allows the grid to be processed in independent tiles with overlapping halos.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate the exact Euclidean distance transform of a target mask
+def euclidean_distance_transform(target_mask, cell_size=1, max_distance=None, tile_size=2048, threads=None):
+    """
+    Description: calculates the Euclidean distance from each cell to the nearest target cell
+    Inputs: 'target_mask' -- a two dimensional boolean array that is True for target cells
+            'cell_size' -- the size of a square cell in map units
+            'max_distance' -- an optional maximum distance in map units; cells farther than the maximum distance from a target are returned as infinity and the grid is processed in tiles with halos of the maximum distance
+            'tile_size' -- the number of rows or columns in a strip or the number of rows and columns in a tile (excluding halos)
+            'threads' -- the number of threads used to process strips or tiles; defaults to the cores of the compute budget
+    Returned Value: Returns a float64 array of distances in map units that is infinity where no target is within reach
+    Preconditions: requires a boolean array; distances are calculated only from targets inside the array, which matches the behavior of EucDistance within the processing extent
+    """
+
+    # Import packages
+    import concurrent.futures
+    import math
+    import numpy as np
+    from package_Pipeline import read_compute_budget
+
+    # Define number of threads
+    if threads is None:
+        threads = read_compute_budget()['cores']
+
+    # Define a function to calculate the squared distance in cells to the nearest target in the same column
+    def transform_columns(column_mask):
+        row_count, column_count = column_mask.shape
+        squared_distance = np.full(column_mask.shape, np.inf)
+        # Sweep downward, counting cells since the last target
+        last_distance = np.full(column_count, np.inf)
+        for row in range(row_count):
+            last_distance = np.where(column_mask[row], 0, last_distance + 1)
+            squared_distance[row] = last_distance
+        # Sweep upward and keep the nearer target
+        last_distance = np.full(column_count, np.inf)
+        for row in range(row_count - 1, -1, -1):
+            last_distance = np.where(column_mask[row], 0, last_distance + 1)
+            np.minimum(squared_distance[row], last_distance, out=squared_distance[row])
+        return squared_distance ** 2
+
+    # Define a function to calculate the lower envelope of parabolas along each row
+    def transform_rows(column_squared):
+        row_count, column_count = column_squared.shape
+        row_index = np.arange(row_count)
+        # Store parabola vertices, envelope boundaries, and the index of the last parabola for each row
+        vertex = np.zeros((row_count, column_count), dtype='int64')
+        boundary = np.full((row_count, column_count + 1), np.inf)
+        last = np.full(row_count, -1, dtype='int64')
+        # Add the parabola of each column to the envelope of each row
+        for column in range(column_count):
+            value = column_squared[:, column]
+            active = np.flatnonzero(np.isfinite(value))
+            if active.size == 0:
+                continue
+            intersection = np.full(active.size, -np.inf)
+            pending = np.ones(active.size, dtype=bool)
+            # Remove parabolas that are hidden by the new parabola
+            while True:
+                candidates = np.flatnonzero(pending & (last[active] >= 0))
+                if candidates.size == 0:
+                    break
+                rows = active[candidates]
+                top = last[rows]
+                top_vertex = vertex[rows, top]
+                crossing = ((value[rows] + column * column) - (column_squared[rows, top_vertex] + top_vertex * top_vertex)) \
+                    / (2 * column - 2 * top_vertex)
+                hidden = crossing <= boundary[rows, top]
+                intersection[candidates] = crossing
+                last[rows[hidden]] -= 1
+                pending[candidates[~hidden]] = False
+            # Append the new parabola
+            rows = active
+            empty = last[rows] < 0
+            last[rows] += 1
+            vertex[rows, last[rows]] = column
+            boundary[rows, last[rows]] = np.where(empty, -np.inf, intersection)
+            boundary[rows, last[rows] + 1] = np.inf
+        # Evaluate the envelope at each column
+        squared_distance = np.full(column_squared.shape, np.inf)
+        has_envelope = last >= 0
+        position = np.zeros(row_count, dtype='int64')
+        for column in range(column_count):
+            while True:
+                advance = has_envelope & (boundary[row_index, position + 1] < column)
+                if not advance.any():
+                    break
+                position[advance] += 1
+            nearest = vertex[row_index, position]
+            squared_distance[has_envelope, column] = ((column - nearest) ** 2
+                                                      + column_squared[row_index, nearest])[has_envelope]
+        return squared_distance
+
+    # Define a function to calculate the exact distance transform of an array with strips processed on threads
+    def transform_array(array_mask, executor):
+        row_count, column_count = array_mask.shape
+        column_squared = np.empty(array_mask.shape)
+        column_strips = [(start, min(start + tile_size, column_count)) for start in range(0, column_count, tile_size)]
+        row_strips = [(start, min(start + tile_size, row_count)) for start in range(0, row_count, tile_size)]
+        if executor is None:
+            for start, end in column_strips:
+                column_squared[:, start:end] = transform_columns(array_mask[:, start:end])
+            squared_distance = np.vstack([transform_rows(column_squared[start:end]) for start, end in row_strips])
+        else:
+            column_results = executor.map(lambda strip: transform_columns(array_mask[:, strip[0]:strip[1]]), column_strips)
+            for (start, end), result in zip(column_strips, column_results):
+                column_squared[:, start:end] = result
+            squared_distance = np.vstack(list(executor.map(lambda strip: transform_rows(column_squared[strip[0]:strip[1]]),
+                                                           row_strips)))
+        return np.sqrt(squared_distance) * cell_size
+
+    # Check the target mask
+    target_mask = np.asarray(target_mask, dtype=bool)
+    if target_mask.ndim != 2:
+        raise ValueError('Target mask must be a two dimensional array.')
+    row_count, column_count = target_mask.shape
+
+    # Calculate the distance transform of the full grid when no maximum distance is given
+    if max_distance is None:
+        if threads > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                return transform_array(target_mask, executor)
+        return transform_array(target_mask, None)
+
+    # Process independent tiles with halos that contain every target within the maximum distance
+    halo = int(math.ceil(max_distance / cell_size))
+    distance_array = np.full(target_mask.shape, np.inf)
+
+    # Define a function to calculate the distance transform of a tile
+    def transform_tile(tile):
+        row_start, column_start = tile
+        row_end = min(row_start + tile_size, row_count)
+        column_end = min(column_start + tile_size, column_count)
+        halo_rows = (max(row_start - halo, 0), min(row_end + halo, row_count))
+        halo_columns = (max(column_start - halo, 0), min(column_end + halo, column_count))
+        tile_mask = target_mask[halo_rows[0]:halo_rows[1], halo_columns[0]:halo_columns[1]]
+        if not tile_mask.any():
+            return
+        tile_distance = transform_array(tile_mask, None)
+        tile_distance = tile_distance[row_start - halo_rows[0]:row_end - halo_rows[0],
+                                      column_start - halo_columns[0]:column_end - halo_columns[0]]
+        tile_distance[tile_distance > max_distance] = np.inf
+        distance_array[row_start:row_end, column_start:column_end] = tile_distance
+
+    # Calculate tiles on multiple threads
+    tiles = [(row_start, column_start)
+             for row_start in range(0, row_count, tile_size)
+             for column_start in range(0, column_count, tile_size)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(transform_tile, tiles))
+
+    return distance_array
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Execute geoprocessing job
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation for jobs that use arcpy. Jobs that do not use arcpy can be executed in any Python 3.6+ installation.
+# Description: "Execute geoprocessing job" is a function that runs a single geoprocessing function described in a job file through the arcpy geoprocessing wrapper in its own scratch workspace and records the result so that a batch executor running the job in a separate process can report and retry it.
+# ---------------------------------------------------------------------------
+
+# Define a function to execute a geoprocessing job from a job file
+def execute_geoprocessing_job(job_file):
+    """
+    Description: runs the geoprocessing function of a job file with its key word arguments and writes a result file
+    Inputs: 'job_file' -- a json file containing the module and name of the geoprocessing function, its key word arguments, the scratch workspace, and the result file
+    Returned Value: Returns True if the function completed and False if it raised an error; the status, error message, and elapsed seconds are written to the result file
+    Preconditions: job files are created by run_geoprocessing_batch; the geoprocessing function must be importable from its module
+    """
+
+    # Import packages
+    import importlib
+    import json
+    import os
+    import time
+    import traceback
+    from package_GeospatialProcessing import arcpy_geoprocessing
+
+    # Read job
+    with open(job_file, 'r', encoding='utf-8') as job_reader:
+        job = json.load(job_reader)
+    job_kwargs = job['kwargs']
+    scratch_workspace = job['scratch_workspace']
+    if not os.path.exists(scratch_workspace):
+        os.makedirs(scratch_workspace)
+
+    # Run the job in its scratch workspace
+    start_time = time.time()
+    try:
+        # Replace the shared work geodatabase with a scratch geodatabase so that concurrent jobs do not lock each other
+        try:
+            import arcpy
+            scratch_geodatabase = os.path.join(scratch_workspace, 'scratch.gdb')
+            if arcpy.Exists(scratch_geodatabase) == 0:
+                arcpy.management.CreateFileGDB(scratch_workspace, 'scratch.gdb')
+            arcpy.env.scratchWorkspace = scratch_workspace
+            if 'work_geodatabase' in job_kwargs:
+                job_kwargs['work_geodatabase'] = scratch_geodatabase
+        except ImportError:
+            pass
+
+        # Execute the geoprocessing function
+        geoprocessing_function = getattr(importlib.import_module(job['module']), job['function'])
+        arcpy_geoprocessing(geoprocessing_function, raise_errors=True, **job_kwargs)
+        job_result = {'status': 'completed', 'error': ''}
+    except Exception as error:
+        traceback.print_exc()
+        job_result = {'status': 'failed', 'error': f'{type(error).__name__}: {error}'}
+    job_result['elapsed'] = time.time() - start_time
+
+    # Write result
+    with open(job['result_file'], 'w', encoding='utf-8') as result_writer:
+        json.dump(job_result, result_writer, indent=2)
+
+    return job_result['status'] == 'completed'
@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Extract features to raster
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
-# Description: "Extract features to raster" is a function that selects features by user-defined attribute and converts the selected features to raster.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation. The numpy backend also requires rasterio.
+# Description: "Extract features to raster" is a function that selects features by user-defined attribute and converts the selected features to raster. The numpy backend reads projected features once, selects them by attribute value in memory, and burns them onto the study area grid with a scanline rasterizer.
 # ---------------------------------------------------------------------------
 
 # Define a function to convert selected features to raster
@@ -16,20 +16,21 @@ def extract_features_to_raster(**kwargs):
             'output_projection' -- the machine number for the output projection
             'geographic_transformation -- the string representation of the appropriate geographic transformation (blank if none required)
             'where_clause' -- a SQL query that will define the selected features
+            'value_field' -- the field that is converted to raster
+            'select_values' -- optional list of values of the value field that define the selected features for the numpy backend; the where clause is applied by the feature cursor if no values are listed
+            'backend' -- optional backend for the conversion: 'arcpy' (default) to project, select, and convert the features with scratch datasets or 'numpy' to burn the selected features onto the study area grid block by block and write the output once
+            'block_size' -- optional number of rows and columns in a block for the numpy backend (default 1024)
+            'threads' -- optional number of threads for the numpy backend
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
             'input_array' -- an array containing the study area raster (must be first), and the target feature class (must be second)
             'output_array' -- an array containing the output raster
     Returned Value: Returns a raster dataset
-    Preconditions: the initial raster must exist on disk and the boundary and grid datasets must be created manually
+    Preconditions: the initial raster must exist on disk and the boundary and grid datasets must be created manually; the numpy backend writes 1 for cells whose center is inside a selected feature, 0 for other cells in the study area, and no data outside the study area
     """
 
     # Import packages
     import arcpy
-    from arcpy.sa import Con
-    from arcpy.sa import IsNull
-    from arcpy.sa import Raster
     import datetime
-    import os
     import time
 
     # Parse key word argument inputs
@@ -43,98 +44,175 @@ def extract_features_to_raster(**kwargs):
     study_area = kwargs['input_array'][0]
     input_feature = kwargs['input_array'][1]
     output_raster = kwargs['output_array'][0]
+    backend = kwargs.get('backend', 'arcpy')
+
+    # Burn the selected features onto the study area grid with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import numpy as np
+        import rasterio
+        from package_GeospatialProcessing import rasterize_polygons
+
+        # Check the cell size of the study area
+        with rasterio.open(study_area) as study_reader:
+            study_transform = study_reader.transform
+        if (abs(study_transform.a - cell_size) > cell_size * 1e-6
+                or abs(abs(study_transform.e) - cell_size) > cell_size * 1e-6):
+            raise ValueError(f'Study area raster must have a cell size of {cell_size}.')
+
+        # Read the rings of the projected features and select features by attribute in memory
+        print('\tReading and selecting projected features...')
+        iteration_start = time.time()
+        if geographic_transformation != '':
+            arcpy.env.geographicTransformations = geographic_transformation
+        select_values = kwargs.get('select_values')
+        cursor_clause = where_clause if select_values is None else None
+        polygons = []
+        with arcpy.da.SearchCursor(input_feature,
+                                   ['SHAPE@', value_field],
+                                   cursor_clause,
+                                   arcpy.SpatialReference(output_projection)) as cursor:
+            for row in cursor:
+                if row[0] is None or (select_values is not None and row[1] not in select_values):
+                    continue
+                # A None point separates the rings of a part
+                rings = []
+                for part in row[0]:
+                    ring = []
+                    for point in part:
+                        if point is None:
+                            rings.append(np.array(ring))
+                            ring = []
+                        else:
+                            ring.append((point.X, point.Y))
+                    rings.append(np.array(ring))
+                polygons.append(rings)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Burn selected features onto the study area grid
+        print(f'\tBurning {len(polygons)} features onto the study area grid block by block...')
+        iteration_start = time.time()
+        rasterize_polygons(polygons,
+                           study_area,
+                           output_raster,
+                           inside_value=1,
+                           outside_value=0,
+                           value_type='int8',
+                           no_data=-128,
+                           block_size=kwargs.get('block_size', 1024),
+                           threads=kwargs.get('threads'))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = '\tSuccessfully extracted raster data to boundary.'
+        return out_process
+
+    # Import arcpy packages
+    from arcpy.sa import Con
+    from arcpy.sa import IsNull
+    from arcpy.sa import Raster
+    from package_GeospatialProcessing import scratch_workspace
+
+    # Store intermediate datasets in a scratch workspace that is deleted when the conversion completes or fails
+    with scratch_workspace('extract_features') as define_scratch:
+        # Define intermediate datasets
+        feature_projected = define_scratch('feature_projected')
+        intermediate_raster = define_scratch('feature_raster', 'raster')
+
+        # Set overwrite option
+        arcpy.env.overwriteOutput = True
+
+        # Set workspace
+        arcpy.env.workspace = work_geodatabase
+
+        # Set snap raster
+        arcpy.env.snapRaster = study_area
+
+        # Define the input and output projection
+        initial_projection = arcpy.SpatialReference(input_projection)
+        target_projection = arcpy.SpatialReference(output_projection)
+
+        # Project feature class
+        print('\tProjecting feature class...')
+        iteration_start = time.time()
+        arcpy.management.Project(input_feature,
+                                 feature_projected,
+                                 target_projection,
+                                 geographic_transformation,
+                                 initial_projection,
+                                 'NO_PRESERVE_SHAPE',
+                                 '',
+                                 'NO_VERTICAL'
+                                 )
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Select data from feature class
+        print('\tConverting select features to raster...')
+        iteration_start = time.time()
+        input_layer = arcpy.management.SelectLayerByAttribute(feature_projected,
+                                                              'NEW_SELECTION',
+                                                              where_clause,
+                                                              'NON_INVERT'
+                                                              )
+        # Convert features to raster
+        arcpy.conversion.FeatureToRaster(input_layer,
+                                         value_field,
+                                         intermediate_raster,
+                                         cell_size
+                                         )
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Define intermediate datasets
-    feature_projected = os.path.join(work_geodatabase, 'feature_projected')
-    intermediate_raster = os.path.join(os.path.split(output_raster)[0], 'feature_raster.tif')
-
-    # Set overwrite option
-    arcpy.env.overwriteOutput = True
-
-    # Set workspace
-    arcpy.env.workspace = work_geodatabase
-
-    # Set snap raster
-    arcpy.env.snapRaster = study_area
-
-    # Define the input and output projection
-    initial_projection = arcpy.SpatialReference(input_projection)
-    target_projection = arcpy.SpatialReference(output_projection)
-
-    # Project feature class
-    print('\tProjecting feature class...')
-    iteration_start = time.time()
-    arcpy.management.Project(input_feature,
-                             feature_projected,
-                             target_projection,
-                             geographic_transformation,
-                             initial_projection,
-                             'NO_PRESERVE_SHAPE',
-                             '',
-                             'NO_VERTICAL'
-                             )
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
-
-    # Select data from feature class
-    print('\tConverting select features to raster...')
-    iteration_start = time.time()
-    input_layer = arcpy.management.SelectLayerByAttribute(feature_projected,
-                                                          'NEW_SELECTION',
-                                                          where_clause,
-                                                          'NON_INVERT'
-                                                          )
-    # Convert features to raster
-    arcpy.conversion.FeatureToRaster(input_layer,
-                                     value_field,
-                                     intermediate_raster,
-                                     cell_size
-                                     )
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
-
-    # Convert values to one and null to zero
-    print('\tConverting values to one...')
-    iteration_start = time.time()
-    nonull_raster = Con(IsNull(Raster(intermediate_raster)), 0, 1)
-    arcpy.management.CopyRaster(nonull_raster,
-                                output_raster,
-                                '',
-                                '0',
-                                '-128',
-                                'NONE',
-                                'NONE',
-                                '8_BIT_SIGNED',
-                                'NONE',
-                                'NONE',
-                                'TIFF',
-                                'NONE',
-                                'CURRENT_SLICE',
-                                'NO_TRANSPOSE')
-    # Delete intermediate datasets if each exists
-    if arcpy.Exists(feature_projected) == 1:
-        arcpy.management.Delete(feature_projected)
-    if arcpy.Exists(intermediate_raster) == 1:
-        arcpy.management.Delete(intermediate_raster)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Convert values to one and null to zero
+        print('\tConverting values to one...')
+        iteration_start = time.time()
+        nonull_raster = Con(IsNull(Raster(intermediate_raster)), 0, 1)
+        arcpy.management.CopyRaster(nonull_raster,
+                                    output_raster,
+                                    '',
+                                    '0',
+                                    '-128',
+                                    'NONE',
+                                    'NONE',
+                                    '8_BIT_SIGNED',
+                                    'NONE',
+                                    'NONE',
+                                    'TIFF',
+                                    'NONE',
+                                    'CURRENT_SLICE',
+                                    'NO_TRANSPOSE')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
     out_process = f'\tSuccessfully extracted raster data to boundary.'
     return out_process
@@ -2,40 +2,110 @@
 # ---------------------------------------------------------------------------
 # Extract to Boundary
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Extract to Boundary" is a function that extracts raster data to a feature or raster boundary. All no data values are reset to a user-defined value.
 # ---------------------------------------------------------------------------
 
+# Define a block kernel to extract an input block to a boundary block
+def boundary_raster_blocks(input_blocks, no_data_replace):
+    """
+    Description: extracts an input block to the cells that have data in a boundary block
+    Inputs: 'input_blocks' -- a list containing a masked input array and a masked boundary array
+            'no_data_replace' -- a value to replace no data values or an empty string to keep no data values
+    Returned Value: Returns a masked array of input values inside the boundary
+    Preconditions: used as a block kernel for process_raster_blocks with functools.partial to set the replacement value
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Extract block to boundary
+    input_block, boundary_block = input_blocks
+    inside_mask = ~np.ma.getmaskarray(input_block) & ~np.ma.getmaskarray(boundary_block)
+    if no_data_replace == '':
+        return np.ma.array(input_block.data, mask=~inside_mask)
+
+    return np.ma.array(np.where(inside_mask, input_block.data, no_data_replace), mask=False)
+
 # Define a function to extract raster data to a boundary
 def extract_to_boundary(**kwargs):
     """
     Description: extracts a raster to a boundary
     Inputs: 'no_data_replace' -- a value to replace no data values (optional)
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the extraction: 'arcpy' (default) for map algebra or 'numpy' to extract the raster block by block
+            'block_size' -- optional number of rows and columns in a block for the numpy backend (default 1024)
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing the target raster to extract (must be first), the boundary feature class or raster (must be second), and the study area raster (must be third)
             'output_array' -- an array containing the output raster
     Returned Value: Returns a raster dataset
-    Preconditions: the initial raster must exist on disk and the boundary and grid datasets must be created manually
+    Preconditions: the initial raster must exist on disk and the boundary and grid datasets must be created manually; the numpy backend requires a raster boundary and rasters that are aligned with the grid of the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import Con
-    from arcpy.sa import IsNull
-    from arcpy.sa import ExtractByMask
-    from arcpy.sa import Raster
     import datetime
     import time
 
     # Parse key word argument inputs
     no_data_replace = kwargs['no_data_replace']
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     input_raster = kwargs['input_array'][0]
     boundary_data = kwargs['input_array'][1]
     study_area = kwargs['input_array'][2]
     output_raster = kwargs['output_array'][0]
 
+    # Extract the raster block by block with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import functools
+        import numpy as np
+        import rasterio
+        from package_GeospatialProcessing import process_raster_blocks
+
+        # Define the output value type and no data value from the input raster
+        with rasterio.open(input_raster) as input_reader:
+            value_type = input_reader.dtypes[0]
+            no_data_value = input_reader.nodata
+        # Use the no data default of arcpy for the value type if the input does not define one
+        if no_data_value is None:
+            if np.issubdtype(np.dtype(value_type), np.integer):
+                value_range = np.iinfo(np.dtype(value_type))
+                no_data_value = value_range.max if value_range.min == 0 else value_range.min
+            else:
+                no_data_value = float(np.finfo(np.dtype(value_type)).min)
+            print(f'\t{input_raster} has no NoData value; using {no_data_value} for the {value_type} output.')
+
+        # Extract raster to boundary
+        print(f'\tExtracting raster to boundary dataset block by block as {value_type} raster with NODATA value of {no_data_value}...')
+        iteration_start = time.time()
+        process_raster_blocks(functools.partial(boundary_raster_blocks, no_data_replace=no_data_replace),
+                              study_area,
+                              [input_raster, boundary_data],
+                              output_raster,
+                              value_type,
+                              no_data_value,
+                              block_size=kwargs.get('block_size', 1024),
+                              threads=kwargs.get('threads'))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = f'\tSuccessfully extracted raster data to boundary.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import Con
+    from arcpy.sa import IsNull
+    from arcpy.sa import ExtractByMask
+    from arcpy.sa import Raster
+    from package_GeospatialProcessing import describe_raster
+
     # Set overwrite option
     arcpy.env.overwriteOutput = True
 
@@ -81,20 +151,9 @@ def extract_to_boundary(**kwargs):
 
     # Save extracted raster to disk
     iteration_start = time.time()
-    no_data_value = Raster(input_raster).noDataValue
-    type_number = arcpy.management.GetRasterProperties(input_raster, 'VALUETYPE').getOutput(0)
-    value_types = ['1_BIT',
-                   '2_BIT',
-                   '4_BIT',
-                   '8_BIT_UNSIGNED',
-                   '8_BIT_SIGNED',
-                   '16_BIT_UNSIGNED',
-                   '16_BIT_SIGNED',
-                   '32_BIT_UNSIGNED',
-                   '32_BIT_SIGNED',
-                   '32_BIT_FLOAT',
-                   '64_BIT']
-    value_type = value_types[int(type_number)]
+    raster_statistics = describe_raster(input_raster)
+    no_data_value = raster_statistics['no_data']
+    value_type = raster_statistics['value_type']
     print(f'\tSaving extracted raster to disk as {value_type} raster with NODATA value of {no_data_value}...')
     arcpy.management.CopyRaster(final_raster,
                                 output_raster,
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Hash dataset
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation.
+# Description: "Hash dataset" is a function that calculates a content hash for a file, a folder, a shapefile, or a feature class or table in a file geodatabase. Feature classes and tables are hashed as the files of their own table, which are found in the system catalog of the geodatabase. Hashes of unchanged files are reused from a cache keyed by file size and modification time.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate a content hash for a dataset
+def hash_dataset(dataset, hash_cache=None):
+    """
+    Description: calculates a sha256 content hash for a dataset on disk
+    Inputs: 'dataset' -- path to a file, folder, shapefile, or feature class in a file geodatabase
+            'hash_cache' -- an optional dictionary of previous file hashes keyed by absolute path that is read and updated in place
+    Returned Value: Returns a hexadecimal hash string or None if the dataset does not exist
+    Preconditions: feature classes and tables in file geodatabases are hashed as the files of their own table, which are found in the system catalog of the geodatabase, so that writes to other datasets in the same geodatabase do not change the hash; the entire geodatabase is hashed if the system catalog cannot be read
+    """
+
+    # Import packages
+    import glob
+    import hashlib
+    import os
+    import struct
+
+    # Create an empty cache if none was provided
+    if hash_cache is None:
+        hash_cache = {}
+
+    # Define a function to hash a single file with reuse of cached hashes
+    def hash_file(file_path):
+        file_path = os.path.abspath(file_path)
+        file_stat = os.stat(file_path)
+        cache_entry = hash_cache.get(file_path)
+        if (cache_entry is not None
+                and cache_entry['size'] == file_stat.st_size
+                and cache_entry['mtime_ns'] == file_stat.st_mtime_ns):
+            return cache_entry['hash']
+        file_hash = hashlib.sha256()
+        with open(file_path, 'rb') as file_reader:
+            for chunk in iter(lambda: file_reader.read(8 * 1024 * 1024), b''):
+                file_hash.update(chunk)
+        hash_cache[file_path] = {'size': file_stat.st_size,
+                                 'mtime_ns': file_stat.st_mtime_ns,
+                                 'hash': file_hash.hexdigest()}
+        return file_hash.hexdigest()
+
+    # Define a function to hash a set of files by relative name and content
+    def hash_files(file_list, base_folder):
+        combined_hash = hashlib.sha256()
+        for file_path in sorted(file_list):
+            combined_hash.update(os.path.relpath(file_path, base_folder).replace('\\', '/').encode('utf-8'))
+            combined_hash.update(hash_file(file_path).encode('utf-8'))
+        return combined_hash.hexdigest()
+
+    # Define a function to read a variable length unsigned integer from a geodatabase table
+    def read_varuint(data, position):
+        value = 0
+        shift = 0
+        while True:
+            value_byte = data[position]
+            position += 1
+            value |= (value_byte & 0x7F) << shift
+            shift += 7
+            if value_byte < 0x80:
+                return value, position
+
+    # Define a function to find the table files of a dataset in a file geodatabase from the system catalog
+    def find_table_files(geodatabase, table_name):
+        # Read the system catalog, which stores one row per table with the table number as object id
+        with open(os.path.join(geodatabase, 'a00000001.gdbtablx'), 'rb') as index_reader:
+            index_data = index_reader.read()
+        with open(os.path.join(geodatabase, 'a00000001.gdbtable'), 'rb') as table_reader:
+            table_data = table_reader.read()
+        magic, block_count, row_count, offset_size = struct.unpack_from('<4i', index_data, 0)
+        if magic != 3 or struct.unpack_from('<i', table_data, 0)[0] != 3 or offset_size not in (4, 5, 6):
+            return None
+        if 16 + block_count * 1024 * offset_size > len(index_data):
+            return None
+
+        # Read the field definitions, which must be the object id, name, and file format of the catalog
+        position = struct.unpack_from('<q', table_data, 32)[0] + 14
+        nullable_fields = []
+        for field_number in range(struct.unpack_from('<h', table_data, position - 2)[0]):
+            name_length = table_data[position]
+            field_name = table_data[position + 1:position + 1 + 2 * name_length].decode('utf-16-le')
+            position += 1 + 2 * name_length
+            position += 1 + 2 * table_data[position]
+            field_type = table_data[position]
+            position += 1
+            if field_type == 6:
+                position += 2
+                continue
+            elif field_type == 4:
+                field_flag = table_data[position + 4]
+                default_length, position = read_varuint(table_data, position + 5)
+                position += default_length
+            elif field_type == 1:
+                field_flag = table_data[position + 1]
+                position += 3 + table_data[position + 2]
+            else:
+                return None
+            if field_flag & 1:
+                nullable_fields.append(field_name)
+            if field_name not in ('Name', 'FileFormat'):
+                return None
+
+        # Find the row of the table name
+        for row_number in range(row_count):
+            row_offset = int.from_bytes(index_data[16 + row_number * offset_size:16 + (row_number + 1) * offset_size],
+                                        'little')
+            if row_offset == 0:
+                continue
+            position = row_offset + 4
+            null_flags = table_data[position:position + (len(nullable_fields) + 7) // 8]
+            position += len(null_flags)
+            if 'Name' in nullable_fields:
+                name_bit = nullable_fields.index('Name')
+                if null_flags[name_bit // 8] >> (name_bit % 8) & 1:
+                    continue
+            name_length, position = read_varuint(table_data, position)
+            if table_data[position:position + name_length].decode('utf-8').lower() == table_name.lower():
+                return glob.glob(os.path.join(geodatabase, f'a{row_number + 1:08x}.*'))
+        return []
+
+    # Identify the storage of the dataset
+    dataset = os.path.abspath(dataset)
+    parent_folder = os.path.dirname(dataset)
+    while parent_folder != os.path.dirname(parent_folder) and not parent_folder.lower().endswith('.gdb'):
+        parent_folder = os.path.dirname(parent_folder)
+
+    # Hash a feature class or table as the files of its table or as the geodatabase if the catalog cannot be read
+    if parent_folder.lower().endswith('.gdb') and not os.path.exists(dataset):
+        try:
+            table_files = find_table_files(parent_folder, os.path.basename(dataset))
+        except (OSError, IndexError, UnicodeDecodeError, struct.error):
+            table_files = None
+        if table_files is None:
+            dataset = parent_folder
+        elif len(table_files) == 0:
+            return None
+        else:
+            table_files = [file_path for file_path in table_files if not file_path.lower().endswith('.lock')]
+            return hash_files(table_files, parent_folder)
+
+    # Hash the dataset according to its storage
+    if os.path.isdir(dataset):
+        file_list = [os.path.join(root, name)
+                     for root, folders, names in os.walk(dataset)
+                     for name in names
+                     if not name.lower().endswith('.lock')]
+        output_hash = hash_files(file_list, dataset)
+    elif os.path.isfile(dataset):
+        # Include the sidecar files of a shapefile
+        if dataset.lower().endswith('.shp'):
+            file_list = glob.glob(os.path.splitext(dataset)[0] + '.*')
+            output_hash = hash_files(file_list, os.path.dirname(dataset))
+        else:
+            output_hash = hash_file(dataset)
+    else:
+        output_hash = None
+
+    return output_hash
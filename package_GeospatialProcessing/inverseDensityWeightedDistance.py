@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate inverse density-weighted distance
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Calculate inverse density-weighted distance" is a function that calculates euclidean distance from raster values and divides distance by density (e.g., foliar cover).
 # ---------------------------------------------------------------------------
 
@@ -13,35 +13,99 @@ def calculate_idw_distance(**kwargs):
     Description: calculates the distance/density of an input raster
     Inputs: 'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
             'target_value' -- an integer value of the target foliar cover value
+            'backend' -- optional backend for the distance calculation: 'arcpy' (default) for EucDistance or 'numpy' for an exact Euclidean distance transform that does not require arcpy
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing the study area raster (must be first) and the input raster (must be second)
             'output_array' -- an array containing the output raster
     Returned Value: Returns a raster dataset on disk containing the IDW Distance values
-    Preconditions: requires an input foliar cover raster
+    Preconditions: requires an input foliar cover raster; the numpy backend requires a foliar cover raster on the same grid as the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import EucDistance
-    from arcpy.sa import Raster
-    from arcpy.sa import SetNull
     import datetime
     import time
 
     # Parse key word argument inputs
     work_geodatabase = kwargs['work_geodatabase']
     target_value = kwargs['target_value']
+    backend = kwargs.get('backend', 'arcpy')
     study_area = kwargs['input_array'][0]
     input_raster = kwargs['input_array'][1]
     output_raster = kwargs['output_array'][0]
 
+    # Calculate distances with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import numpy as np
+        from package_GeospatialProcessing import euclidean_distance_transform
+        from package_GeospatialProcessing import read_raster_array
+        from package_GeospatialProcessing import write_raster_array
+
+        # Read the study area and foliar cover rasters
+        print(f'\tReading cover raster into memory...')
+        iteration_start = time.time()
+        study_array, study_mask, study_profile = read_raster_array(study_area)
+        input_array, input_mask, input_profile = read_raster_array(input_raster)
+        del study_array
+        if (input_array.shape != study_mask.shape
+                or not input_profile['transform'].almost_equals(study_profile['transform'])):
+            raise ValueError('Cover raster must have the same extent and cell size as the study area raster.')
+        target_mask = input_mask & (input_array == target_value)
+        del input_array, input_mask
+        if not target_mask.any():
+            raise ValueError(f'Foliar cover never equals {target_value}%.')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Calculate the distance to the target value weighted by inverse density
+        print(f'\tCalculating inverse density-weighted distance to target value...')
+        iteration_start = time.time()
+        distance_array = euclidean_distance_transform(target_mask,
+                                                      cell_size=abs(study_profile['transform'].a),
+                                                      threads=kwargs.get('threads'))
+        edge_array = np.trunc(distance_array / (target_value / 100)).astype('int32')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Save the edge raster to disk
+        print(f'\tSaving edge raster to disk...')
+        iteration_start = time.time()
+        write_raster_array(output_raster, edge_array, study_profile, 'int32', -32768)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = f'Successfully calculated inverse density-weighted distance where foliar cover = {target_value}% with the numpy backend.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import EucDistance
+    from arcpy.sa import Raster
+    from arcpy.sa import SetNull
+    from package_Pipeline import read_compute_budget
+
     # Set overwrite option
     arcpy.env.overwriteOutput = True
 
     # Set workspace
     arcpy.env.workspace = work_geodatabase
 
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "50%"
+    # Use the cores of the compute budget on processes that can be split.
+    arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
 
     # Set snap raster, extent, and cell size
     arcpy.env.snapRaster = study_area
@@ -2,29 +2,108 @@
 # ---------------------------------------------------------------------------
 # Prepare validation points
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-06
-# Usage: Must be executed in an ArcGIS Pro Python 3.6+ installation.
-# Description: "Prepare validation points" is a function that extracts distances from point data and calculates a zonal mean distance within the bounds of the point data.
+# Last Updated: 2026-10-19
+# Usage: The arcpy backend must be executed in an ArcGIS Pro Python 3.6+ installation. The numpy backend requires rasterio and reads points with pyogrio if it is installed or with arcpy otherwise.
+# Description: "Prepare validation points" is a set of functions that extract distances from point data and calculate a zonal mean distance within the bounds of the point data. The numpy backend calculates the zonal means of all distance rasters with one masked block reduction over the buffered hull of the points and samples all rasters at the points with one cell lookup.
 # ---------------------------------------------------------------------------
 
+# Define a function to find the window of the extent of a zone polygon on a grid
+def define_zone_window(zone_rings, grid_transform, width, height):
+    """
+    Description: finds the window of the cells of a grid that intersect the extent of a zone polygon
+    Inputs: 'zone_rings' -- a list of vertex arrays for the rings of the zone polygon
+            'grid_transform' -- the affine transform of the grid
+            'width' -- the number of columns of the grid
+            'height' -- the number of rows of the grid
+    Returned Value: Returns a rasterio window that is clipped to the grid and is empty if the zone is outside the grid
+    Preconditions: the grid must be north up
+    """
+
+    # Import packages
+    import numpy as np
+    from rasterio.windows import Window
+
+    # Calculate the rows and columns of the zone extent
+    zone_vertices = np.concatenate([np.asarray(ring, dtype='float64') for ring in zone_rings])
+    column_offset = max(0, int(np.floor((zone_vertices[:, 0].min() - grid_transform.c) / grid_transform.a)))
+    column_end = min(width, int(np.ceil((zone_vertices[:, 0].max() - grid_transform.c) / grid_transform.a)))
+    row_offset = max(0, int(np.floor((zone_vertices[:, 1].max() - grid_transform.f) / grid_transform.e)))
+    row_end = min(height, int(np.ceil((zone_vertices[:, 1].min() - grid_transform.f) / grid_transform.e)))
+
+    return Window(column_offset, row_offset, max(0, column_end - column_offset), max(0, row_end - row_offset))
+
+# Define a function to calculate the mean of rasters within a zone polygon
+def calculate_zonal_means(zone_rings, input_rasters, block_size=1024):
+    """
+    Description: calculates the mean of the cells with data of each raster whose centers are inside a zone polygon
+    Inputs: 'zone_rings' -- a list of vertex arrays for the rings of the zone polygon
+            'input_rasters' -- a list of paths to rasters on the same grid
+            'block_size' -- the number of rows and columns read at a time
+    Returned Value: Returns a list of the zonal mean of each raster (NaN if the zone has no cells with data), the boolean zone mask, and the window of the zone on the grid
+    Preconditions: the zone is burned with the cell center rule and only the blocks of the zone extent are read
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+    from package_GeospatialProcessing import define_polygon_edges
+    from package_GeospatialProcessing import rasterize_polygon_block
+
+    # Define the window of the zone extent on the grid
+    zone_edges = define_polygon_edges([zone_rings])
+    readers = [rasterio.open(raster) for raster in input_rasters]
+    try:
+        grid_transform = readers[0].transform
+        zone_window = define_zone_window(zone_rings, grid_transform, readers[0].width, readers[0].height)
+        column_offset, row_offset = int(zone_window.col_off), int(zone_window.row_off)
+        zone_width, zone_height = int(zone_window.width), int(zone_window.height)
+
+        # Sum the cells with data inside the zone block by block
+        zone_mask = np.zeros((zone_height, zone_width), dtype=bool)
+        value_sums = np.zeros(len(readers))
+        value_counts = np.zeros(len(readers))
+        for row in range(0, zone_height, block_size):
+            for column in range(0, zone_width, block_size):
+                window = Window(column_offset + column, row_offset + row,
+                                min(block_size, zone_width - column), min(block_size, zone_height - row))
+                block_mask = rasterize_polygon_block(zone_edges, grid_transform, window)
+                zone_mask[row:row + int(window.height), column:column + int(window.width)] = block_mask
+                if not block_mask.any():
+                    continue
+                for number, reader in enumerate(readers):
+                    block_values = reader.read(1, window=window, masked=True)
+                    value_mask = block_mask & ~np.ma.getmaskarray(block_values)
+                    if np.issubdtype(block_values.dtype, np.floating):
+                        value_mask &= np.isfinite(block_values.data)
+                    value_sums[number] += block_values.data[value_mask].sum(dtype='float64')
+                    value_counts[number] += value_mask.sum()
+    finally:
+        for reader in readers:
+            reader.close()
+
+    # Calculate the zonal means
+    zonal_means = [value_sum / value_count if value_count > 0 else np.nan
+                   for value_sum, value_count in zip(value_sums, value_counts)]
+
+    return zonal_means, zone_mask, zone_window
+
 # Define a function to extract distance to points and calculate zonal mean
 def prepare_validation_points(**kwargs):
     """
     Description: extracts distance for a set of input points and calculates zonal mean for the bounds of the points
     Inputs: 'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the extraction: 'arcpy' (default) for bounding geometry, zonal statistics, and extraction tools with scratch datasets or 'numpy' to calculate the zonal means and extract the values in memory
+            'buffer_distance' -- optional distance in meters by which the convex hull of the points is buffered (default 1000)
+            'block_size' -- optional number of rows and columns read at a time by the numpy backend (default 1024)
             'input_array' -- an array containing the study area raster (must be first), a continuous distance raster for maternal females, a continuous distance raster for non-maternal females, and a feature class of validation points
             'output_array' -- an array containing the output zonal mean raster for maternal females, the output zonal mean raster for non-maternal females, and the output csv file
     Returned Value: Returns a raster dataset on disk containing the combined raster
-    Preconditions: requires continuous and significance rasters
+    Preconditions: requires continuous and significance rasters; the numpy backend requires distance rasters on the grid of the study area raster and single-part points in the coordinate system of the grid
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import ExtractMultiValuesToPoints
-    from arcpy.sa import Raster
-    from arcpy.sa import ZonalStatistics
     import datetime
-    import os
     import pandas as pd
     import time
 
@@ -37,6 +116,142 @@ def prepare_validation_points(**kwargs):
     calf_zonal = kwargs['output_array'][0]
     nocalf_zonal = kwargs['output_array'][1]
     output_file = kwargs['output_array'][2]
+    backend = kwargs.get('backend', 'arcpy')
+    buffer_distance = kwargs.get('buffer_distance', 1000)
+
+    # Calculate zonal means and extract values in memory with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import numpy as np
+        import os
+        import rasterio
+        import struct
+        from rasterio.windows import transform as window_transform
+        from package_GeospatialProcessing import buffer_convex_polygon
+        from package_GeospatialProcessing import calculate_convex_hull
+        from package_GeospatialProcessing import sample_raster_points
+        from package_GeospatialProcessing import write_raster_array
+
+        # Check that the distance rasters are on the grid of the study area
+        with rasterio.open(study_area) as study_reader:
+            study_grid = (study_reader.transform, study_reader.width, study_reader.height)
+            study_crs = study_reader.crs
+        for distance_raster in [calf_distance, nocalf_distance]:
+            with rasterio.open(distance_raster) as distance_reader:
+                if (distance_reader.transform, distance_reader.width, distance_reader.height) != study_grid:
+                    raise ValueError(f'{distance_raster} must be on the grid of the study area raster.')
+
+        # Read the attributes and coordinates of the points
+        print('\tReading points and calculating buffered bounding geometry...')
+        iteration_start = time.time()
+        # Read the points with pyogrio if it is installed so that arcpy is not required
+        try:
+            import pyogrio
+            from pyogrio.raw import read as read_features
+        except ImportError:
+            pyogrio = None
+        if pyogrio is not None:
+            if os.path.dirname(validation_points).lower().endswith('.gdb'):
+                feature_source = os.path.dirname(validation_points)
+                feature_layer = os.path.basename(validation_points)
+            else:
+                feature_source = validation_points
+                feature_layer = None
+            feature_info = pyogrio.read_info(feature_source, layer=feature_layer)
+            feature_meta, feature_ids, feature_geometry, feature_values = read_features(feature_source,
+                                                                                        layer=feature_layer,
+                                                                                        return_fids=True)
+            if any(geometry is None for geometry in feature_geometry):
+                raise ValueError(f'{validation_points} must not contain features without a point geometry.')
+            # Read the coordinates from the well-known binary of each point in the byte order of the point
+            point_coordinates = np.array([struct.unpack('<dd' if geometry[0] == 1 else '>dd', geometry[5:21])
+                                          for geometry in feature_geometry], dtype='float64').reshape(-1, 2)
+            point_values = {feature_info['fid_column'] or 'FID': feature_ids}
+            point_values.update(zip(feature_meta['fields'], feature_values))
+            point_x = point_coordinates[:, 0]
+            point_y = point_coordinates[:, 1]
+        # Otherwise read the points with arcpy
+        else:
+            import arcpy
+            point_fields = [field.name for field in arcpy.ListFields(validation_points)
+                            if field.name != arcpy.Describe(validation_points).shapeFieldName]
+            point_array = arcpy.da.FeatureClassToNumPyArray(validation_points,
+                                                            point_fields + ['SHAPE@X', 'SHAPE@Y'],
+                                                            '',
+                                                            False,
+                                                            False,
+                                                            -99999)
+            point_values = {field: point_array[field] for field in point_fields}
+            point_x = point_array['SHAPE@X'].astype('float64')
+            point_y = point_array['SHAPE@Y'].astype('float64')
+        # Buffer the convex hull of the points
+        zone_polygon = buffer_convex_polygon(calculate_convex_hull(point_x, point_y), buffer_distance)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Calculate zonal means of both distance rasters in one pass over the zone
+        print('\tCalculating zonal means block by block...')
+        iteration_start = time.time()
+        zonal_means, zone_mask, zone_window = calculate_zonal_means([zone_polygon],
+                                                                    [calf_distance, nocalf_distance],
+                                                                    kwargs.get('block_size', 1024))
+        # Write the zonal mean rasters on the window of the zone
+        for zonal_mean, output_raster in zip(zonal_means, [calf_zonal, nocalf_zonal]):
+            output_profile = {'driver': 'GTiff',
+                              'crs': study_crs,
+                              'transform': window_transform(zone_window, study_grid[0]),
+                              'height': zone_mask.shape[0],
+                              'width': zone_mask.shape[1]}
+            write_raster_array(output_raster,
+                               np.where(zone_mask, zonal_mean, -32768),
+                               output_profile,
+                               'float32',
+                               -32768)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Sample all rasters at the points with one cell lookup and export the table
+        print('\tExtract values to points...')
+        iteration_start = time.time()
+        cell_cache = {}
+        output_data = pd.DataFrame(point_values)
+        for field, raster in [('distance_calf', calf_distance),
+                              ('distance_nocalf', nocalf_distance),
+                              ('mean_calf', calf_zonal),
+                              ('mean_nocalf', nocalf_zonal)]:
+            output_data[field] = sample_raster_points(raster, point_x, point_y, cell_cache=cell_cache)
+        output_data = output_data.fillna(-99999)
+        output_data.to_csv(output_file, header=True, index=False, sep=',', encoding='utf-8')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = 'Exported extracted values to table.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import ExtractMultiValuesToPoints
+    from arcpy.sa import Raster
+    from arcpy.sa import ZonalStatistics
+    from package_GeospatialProcessing import scratch_workspace
+    from package_Pipeline import read_compute_budget
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -44,76 +259,109 @@ def prepare_validation_points(**kwargs):
     # Set workspace
     arcpy.env.workspace = work_geodatabase
 
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "66%"
+    # Use the cores of the compute budget on processes that can be split.
+    arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
 
     # Set snap raster, extent, and cell size
     arcpy.env.snapRaster = study_area
     arcpy.env.extent = Raster(study_area).extent
     arcpy.env.cellSize = "MINOF"
 
-    # Define intermediate datasets
-    extracted_points = os.path.join(work_geodatabase, 'validation_points_extracted')
-    minimum_bound = os.path.join(work_geodatabase, 'minimum_bound')
-    buffered_bound = os.path.join(work_geodatabase, 'buffered_bound')
-
-    # Calculate bounding geometry
-    print(f'\tCalculate bounding geometry from points...')
-    iteration_start = time.time()
-    arcpy.management.MinimumBoundingGeometry(validation_points,
-                                             minimum_bound,
-                                             'CONVEX_HULL',
-                                             'ALL',
-                                             '',
-                                             'NO_MBG_FIELDS')
-    arcpy.analysis.Buffer(minimum_bound,
-                          buffered_bound,
-                          '1000 Meters',
-                          'FULL',
-                          'ROUND',
-                          'NONE',
-                          '',
-                          'PLANAR')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
-
-    # Calculate zonal mean distances
-    distance_rasters = [calf_distance, nocalf_distance]
-    output_rasters = [calf_zonal, nocalf_zonal]
-    count = 1
-    for distance_raster in distance_rasters:
-        # Define output raster
-        output_raster = output_rasters[count - 1]
-        print(f'\tCalculate zonal mean {count} of {len(output_rasters)}...')
+    # Store intermediate datasets in a scratch workspace that is deleted when the extraction completes or fails
+    with scratch_workspace('validation_points') as define_scratch:
+        # Define intermediate datasets
+        extracted_points = define_scratch('validation_points_extracted')
+        minimum_bound = define_scratch('minimum_bound')
+        buffered_bound = define_scratch('buffered_bound')
+
+        # Calculate bounding geometry
+        print(f'\tCalculate bounding geometry from points...')
+        iteration_start = time.time()
+        arcpy.management.MinimumBoundingGeometry(validation_points,
+                                                 minimum_bound,
+                                                 'CONVEX_HULL',
+                                                 'ALL',
+                                                 '',
+                                                 'NO_MBG_FIELDS')
+        arcpy.analysis.Buffer(minimum_bound,
+                              buffered_bound,
+                              '1000 Meters',
+                              'FULL',
+                              'ROUND',
+                              'NONE',
+                              '',
+                              'PLANAR')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Calculate zonal mean distances
+        distance_rasters = [calf_distance, nocalf_distance]
+        output_rasters = [calf_zonal, nocalf_zonal]
+        count = 1
+        for distance_raster in distance_rasters:
+            # Define output raster
+            output_raster = output_rasters[count - 1]
+            print(f'\tCalculate zonal mean {count} of {len(output_rasters)}...')
+            iteration_start = time.time()
+            # Calculate zonal mean
+            zonal_raster = ZonalStatistics(buffered_bound,
+                                           'OBJECTID',
+                                           distance_raster,
+                                           'MEAN',
+                                           'DATA',
+                                           'CURRENT_SLICE')
+            # Save zonal raster to disk
+            arcpy.management.CopyRaster(zonal_raster,
+                                        output_raster,
+                                        '',
+                                        '',
+                                        '-32768',
+                                        'NONE',
+                                        'NONE',
+                                        '32_BIT_FLOAT',
+                                        'NONE',
+                                        'NONE',
+                                        'TIFF',
+                                        'NONE',
+                                        'CURRENT_SLICE',
+                                        'NO_TRANSPOSE')
+            # End timing
+            iteration_end = time.time()
+            iteration_elapsed = int(iteration_end - iteration_start)
+            iteration_success_time = datetime.datetime.now()
+            # Report success
+            print(
+                f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+            print('\t----------')
+            count += 1
+
+        # Extract values to points
+        print(f'\tExtract values to points...')
         iteration_start = time.time()
-        # Calculate zonal mean
-        zonal_raster = ZonalStatistics(buffered_bound,
-                                       'OBJECTID',
-                                       distance_raster,
-                                       'MEAN',
-                                       'DATA',
-                                       'CURRENT_SLICE')
-        # Save zonal raster to disk
-        arcpy.management.CopyRaster(zonal_raster,
-                                    output_raster,
-                                    '',
-                                    '',
-                                    '-32768',
-                                    'NONE',
-                                    'NONE',
-                                    '32_BIT_FLOAT',
-                                    'NONE',
-                                    'NONE',
-                                    'TIFF',
-                                    'NONE',
-                                    'CURRENT_SLICE',
-                                    'NO_TRANSPOSE')
+        # Copy validation points
+        arcpy.management.CopyFeatures(validation_points, extracted_points)
+        # Extract values
+        ExtractMultiValuesToPoints(extracted_points,
+                                   [[calf_distance, 'distance_calf'],
+                                    [nocalf_distance, 'distance_nocalf'],
+                                    [calf_zonal, 'mean_calf'],
+                                    [nocalf_zonal, 'mean_nocalf']],
+                                   'NONE')
+        # Export table
+        final_fields = [field.name for field in arcpy.ListFields(extracted_points)
+                        if field.name != arcpy.Describe(extracted_points).shapeFieldName]
+        output_data = pd.DataFrame(arcpy.da.TableToNumPyArray(extracted_points,
+                                                              final_fields,
+                                                              '',
+                                                              False,
+                                                              -99999))
+        output_data.to_csv(output_file, header=True, index=False, sep=',', encoding='utf-8')
         # End timing
         iteration_end = time.time()
         iteration_elapsed = int(iteration_end - iteration_start)
@@ -122,43 +370,5 @@ def prepare_validation_points(**kwargs):
         print(
             f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
         print('\t----------')
-        count += 1
-
-    # Extract values to points
-    print(f'\tExtract values to points...')
-    iteration_start = time.time()
-    # Copy validation points
-    arcpy.management.CopyFeatures(validation_points, extracted_points)
-    # Extract values
-    ExtractMultiValuesToPoints(extracted_points,
-                               [[calf_distance, 'distance_calf'],
-                                [nocalf_distance, 'distance_nocalf'],
-                                [calf_zonal, 'mean_calf'],
-                                [nocalf_zonal, 'mean_nocalf']],
-                               'NONE')
-    # Export table
-    final_fields = [field.name for field in arcpy.ListFields(extracted_points)
-                    if field.name != arcpy.Describe(extracted_points).shapeFieldName]
-    output_data = pd.DataFrame(arcpy.da.TableToNumPyArray(extracted_points,
-                                                          final_fields,
-                                                          '',
-                                                          False,
-                                                          -99999))
-    output_data.to_csv(output_file, header=True, index=False, sep=',', encoding='utf-8')
-    # Delete intermediate files
-    if arcpy.Exists(minimum_bound):
-        arcpy.management.Delete(minimum_bound)
-    if arcpy.Exists(buffered_bound):
-        arcpy.management.Delete(buffered_bound)
-    if arcpy.Exists(extracted_points):
-        arcpy.management.Delete(extracted_points)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
     out_process = 'Exported extracted values to table.'
     return out_process
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Process raster blocks
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Process raster blocks" is a set of functions that apply a block kernel to a set of input rasters on the grid of a study area raster. Blocks are aligned with the study area grid, each input block is read once from the overlapping window of the input raster, blocks are processed on a pool of threads or processes, and the output is written block by block to a single GeoTIFF so that memory use is bounded by the block size.
+# ---------------------------------------------------------------------------
+
+# Store the readers of a worker process
+process_readers = {}
+
+# Define a function to convert an arcpy value type to a numpy data type
+def convert_value_type(value_type):
+    """
+    Description: converts an arcpy raster value type to a numpy data type name
+    Inputs: 'value_type' -- an arcpy raster value type (e.g., '16_BIT_SIGNED')
+    Returned Value: Returns a numpy data type name (e.g., 'int16')
+    Preconditions: bit value types smaller than 8 bits are not supported
+    """
+
+    # Define value types
+    value_types = {'8_BIT_UNSIGNED': 'uint8',
+                   '8_BIT_SIGNED': 'int8',
+                   '16_BIT_UNSIGNED': 'uint16',
+                   '16_BIT_SIGNED': 'int16',
+                   '32_BIT_UNSIGNED': 'uint32',
+                   '32_BIT_SIGNED': 'int32',
+                   '32_BIT_FLOAT': 'float32',
+                   '64_BIT': 'float64'}
+    if value_type not in value_types:
+        raise ValueError(f'Value type {value_type} is not supported by the numpy backend.')
+
+    return value_types[value_type]
+
+# Define a function to calculate the offsets of input rasters on a reference grid
+def define_block_offsets(reference_profile, input_rasters):
+    """
+    Description: calculates the row and column offsets of input rasters on the grid of a reference raster
+    Inputs: 'reference_profile' -- the rasterio profile of the reference raster
+            'input_rasters' -- a list of paths to input rasters
+    Returned Value: Returns a list of row offset, column offset, height, and width for each input raster
+    Preconditions: input rasters must have the cell size and coordinate system of the reference raster and must be aligned with its grid
+    """
+
+    # Import packages
+    import rasterio
+
+    # Calculate offsets
+    reference_transform = reference_profile['transform']
+    cell_size = abs(reference_transform.a)
+    input_offsets = []
+    for raster in input_rasters:
+        with rasterio.open(raster) as input_reader:
+            if (reference_profile['crs'] is not None and input_reader.crs is not None
+                    and input_reader.crs != reference_profile['crs']):
+                raise ValueError(f'{raster} must have the coordinate system of the study area raster.')
+            input_transform = input_reader.transform
+            if (abs(input_transform.a - reference_transform.a) > cell_size * 1e-6
+                    or abs(input_transform.e - reference_transform.e) > cell_size * 1e-6):
+                raise ValueError(f'{raster} must have the cell size of the study area raster.')
+            row_offset = (input_transform.f - reference_transform.f) / reference_transform.e
+            column_offset = (input_transform.c - reference_transform.c) / reference_transform.a
+            if abs(row_offset - round(row_offset)) > 1e-6 or abs(column_offset - round(column_offset)) > 1e-6:
+                raise ValueError(f'{raster} is not aligned with the grid of the study area raster.')
+            input_offsets.append((int(round(row_offset)), int(round(column_offset)),
+                                  input_reader.height, input_reader.width))
+
+    return input_offsets
+
+# Define a function to read the blocks of the study area and input rasters
+def read_raster_blocks(readers, input_offsets, window):
+    """
+    Description: reads a block of the study area raster and the overlapping windows of the input rasters
+    Inputs: 'readers' -- a list of open rasterio datasets for the study area raster (must be first) and the input rasters
+            'input_offsets' -- the row and column offsets of the input rasters from define_block_offsets
+            'window' -- a rasterio window on the grid of the study area raster
+    Returned Value: Returns a boolean array that is True inside the study area, a list of masked arrays of input values on the block where cells outside an input raster are masked, and the number of bytes read
+    Preconditions: readers must not be shared between threads
+    """
+
+    # Import packages
+    import numpy as np
+    from rasterio.windows import Window
+
+    # Read the study area block
+    block_row, block_column = int(window.row_off), int(window.col_off)
+    block_height, block_width = int(window.height), int(window.width)
+    study_mask = readers[0].read_masks(1, window=window) > 0
+
+    # Read the part of each input raster that overlaps the block
+    input_blocks = []
+    bytes_read = 0
+    for input_reader, (row_offset, column_offset, input_height, input_width) in zip(readers[1:], input_offsets):
+        input_block = np.ma.masked_all((block_height, block_width), dtype=input_reader.dtypes[0])
+        row_start = max(block_row, row_offset)
+        row_end = min(block_row + block_height, row_offset + input_height)
+        column_start = max(block_column, column_offset)
+        column_end = min(block_column + block_width, column_offset + input_width)
+        if row_start < row_end and column_start < column_end:
+            input_values = input_reader.read(1, masked=True,
+                                             window=Window(column_start - column_offset, row_start - row_offset,
+                                                           column_end - column_start, row_end - row_start))
+            # Treat non-finite floating point values as no data
+            if np.issubdtype(input_values.dtype, np.floating):
+                input_values = np.ma.masked_invalid(input_values)
+            input_block[row_start - block_row:row_end - block_row,
+                        column_start - block_column:column_end - block_column] = input_values
+            bytes_read += input_values.data.nbytes
+        input_blocks.append(input_block)
+
+    return study_mask, input_blocks, bytes_read
+
+# Define a function to apply a block kernel and convert the result to the output value type
+def apply_block_kernel(block_kernel, study_mask, input_blocks, value_type, no_data):
+    """
+    Description: applies a block kernel to the input blocks and extracts the result to the study area
+    Inputs: 'block_kernel' -- a function that receives a list of masked input arrays and returns a masked array of output values
+            'study_mask' -- a boolean array that is True inside the study area
+            'input_blocks' -- a list of masked arrays of input values on the block
+            'value_type' -- a numpy data type name for the output
+            'no_data' -- the no data value of the output
+    Returned Value: Returns an array of output values with cells that are masked or outside the study area set to no data
+    Preconditions: integer outputs must fit the range of the output value type
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Apply the kernel and identify output cells
+    output_values = np.ma.asarray(block_kernel(input_blocks))
+    output_mask = study_mask & ~np.ma.getmaskarray(output_values)
+    valid_values = output_values.data[output_mask]
+
+    # Check that integer outputs fit the output value type
+    output_type = np.dtype(value_type)
+    if np.issubdtype(output_type, np.integer) and valid_values.size > 0:
+        value_range = np.iinfo(output_type)
+        if valid_values.max() > value_range.max or valid_values.min() < value_range.min:
+            raise OverflowError(f'Output values exceed the range of the {output_type.name} output value type.')
+
+    # Convert the block to the output value type
+    output_block = np.full(study_mask.shape, no_data, dtype=output_type)
+    output_block[output_mask] = valid_values.astype(output_type)
+
+    return output_block
+
+# Define a function to open readers in a worker process
+def open_process_readers(rasters):
+    """
+    Description: opens the study area and input rasters once in a worker process
+    Inputs: 'rasters' -- a list of paths to the study area raster (must be first) and the input rasters
+    Returned Value: Stores open rasterio datasets in the process readers
+    Preconditions: used as the initializer of a process pool
+    """
+
+    # Import packages
+    import rasterio
+
+    # Open readers
+    process_readers['readers'] = [rasterio.open(raster) for raster in rasters]
+
+# Define a function to process a block in a worker process
+def process_block(block_kernel, input_offsets, window, value_type, no_data):
+    """
+    Description: reads a block and applies a block kernel in a worker process
+    Inputs: 'block_kernel' -- a picklable block kernel function
+            'input_offsets' -- the row and column offsets of the input rasters from define_block_offsets
+            'window' -- a rasterio window on the grid of the study area raster
+            'value_type' -- a numpy data type name for the output
+            'no_data' -- the no data value of the output
+    Returned Value: Returns the window, the output block, and the number of bytes read
+    Preconditions: the worker process must be initialized with open_process_readers
+    """
+
+    # Process block
+    study_mask, input_blocks, bytes_read = read_raster_blocks(process_readers['readers'], input_offsets, window)
+    output_block = apply_block_kernel(block_kernel, study_mask, input_blocks, value_type, no_data)
+
+    return window, output_block, bytes_read
+
+# Define a function to apply a block kernel to input rasters on the grid of a study area raster
+def process_raster_blocks(block_kernel, study_area, input_rasters, output_raster, value_type, no_data,
+                          block_size=1024, threads=None, pool='thread', output_crs=None):
+    """
+    Description: applies a block kernel to input rasters block by block on the grid of a study area raster and writes the output once
+    Inputs: 'block_kernel' -- a function that receives a list of masked input arrays (cells with no data or outside an input raster are masked) and returns a masked array of output values (masked cells are written as no data)
+            'study_area' -- path to the study area raster that defines the output grid and the cells that receive output values
+            'input_rasters' -- a list of paths to input rasters in the order that they are passed to the block kernel
+            'output_raster' -- path to the output GeoTIFF
+            'value_type' -- a numpy data type name for the output (e.g., 'int16', 'int32', 'float32')
+            'no_data' -- the no data value of the output
+            'block_size' -- the number of rows and columns in a block; multiples of 512 match the output tiles
+            'threads' -- the number of threads or processes; defaults to the cores of the compute budget
+            'pool' -- 'thread' to process blocks on threads or 'process' to process blocks in separate processes, which requires a picklable block kernel defined at the module level
+            'output_crs' -- an optional rasterio coordinate reference system for the output; defaults to the coordinate system of the study area raster
+    Returned Value: Returns a dictionary with the number of blocks, the number of megabytes read, and the elapsed seconds
+    Preconditions: input rasters must be aligned with the grid of the study area raster but may cover a different extent
+    """
+
+    # Import packages
+    import concurrent.futures
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    import threading
+    import time
+    from package_Pipeline import read_compute_budget
+
+    # Define number of threads and check the pool type
+    if threads is None:
+        threads = read_compute_budget()['cores']
+    if pool not in ('thread', 'process'):
+        raise ValueError(f'Pool must be \'thread\' or \'process\', not \'{pool}\'.')
+    if no_data is None:
+        raise ValueError('A no data value is required for the output raster.')
+
+    # Define the output grid from the study area
+    with rasterio.open(study_area) as study_reader:
+        output_profile = study_reader.profile.copy()
+    input_offsets = define_block_offsets(output_profile, input_rasters)
+    output_profile.update(driver='GTiff',
+                          count=1,
+                          dtype=value_type,
+                          nodata=no_data,
+                          compress='lzw',
+                          tiled=True,
+                          blockxsize=512,
+                          blockysize=512,
+                          BIGTIFF='IF_SAFER')
+    if output_crs is not None:
+        output_profile.update(crs=output_crs)
+
+    # Define blocks aligned with the study area grid
+    windows = [Window(column, row,
+                      min(block_size, output_profile['width'] - column),
+                      min(block_size, output_profile['height'] - row))
+               for row in range(0, output_profile['height'], block_size)
+               for column in range(0, output_profile['width'], block_size)]
+
+    # Process blocks and write each output block once
+    block_start = time.time()
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+    write_lock = threading.Lock()
+    bytes_read = [0]
+    # Remove the partial output if a block fails
+    try:
+        with rasterio.open(temporary_raster, 'w', **output_profile) as raster_writer:
+            if pool == 'process':
+                # Process blocks in worker processes that each open the rasters once
+                with concurrent.futures.ProcessPoolExecutor(max_workers=threads,
+                                                            initializer=open_process_readers,
+                                                            initargs=([study_area] + list(input_rasters),)) as executor:
+                    block_futures = [executor.submit(process_block, block_kernel, input_offsets, window, value_type, no_data)
+                                     for window in windows]
+                    for block_future in concurrent.futures.as_completed(block_futures):
+                        window, output_block, block_bytes = block_future.result()
+                        raster_writer.write(output_block, 1, window=window)
+                        bytes_read[0] += block_bytes
+            else:
+                local_readers = threading.local()
+                opened_readers = []
+
+                # Define a function to process a block with readers that are not shared between threads
+                def process_thread_block(window):
+                    if not hasattr(local_readers, 'readers'):
+                        local_readers.readers = [rasterio.open(raster) for raster in [study_area] + list(input_rasters)]
+                        with write_lock:
+                            opened_readers.extend(local_readers.readers)
+                    study_mask, input_blocks, block_bytes = read_raster_blocks(local_readers.readers, input_offsets, window)
+                    output_block = apply_block_kernel(block_kernel, study_mask, input_blocks, value_type, no_data)
+                    with write_lock:
+                        raster_writer.write(output_block, 1, window=window)
+                        bytes_read[0] += block_bytes
+
+                # Process all blocks
+                try:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                        list(executor.map(process_thread_block, windows))
+                finally:
+                    for input_reader in opened_readers:
+                        input_reader.close()
+    except Exception:
+        if os.path.exists(temporary_raster):
+            os.remove(temporary_raster)
+        raise
+    os.replace(temporary_raster, output_raster)
+    block_elapsed = time.time() - block_start
+
+    return {'blocks': len(windows),
+            'megabytes_read': bytes_read[0] / 1048576,
+            'elapsed': block_elapsed}
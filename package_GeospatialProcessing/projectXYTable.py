@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Project xy table
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
-# Description: "Project xy table" is a function that converts xy data in a csv table to a feature class and projects the feature class.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation for the arcpy backend or a Python 3.6+ installation with numpy and pandas installed for the numpy backend.
+# Description: "Project xy table" is a function that converts xy data in a csv table to a feature class and projects the feature class, or projects the xy data directly to Alaska Albers in a csv table.
 # ---------------------------------------------------------------------------
 
 # Define a function to convert and project xy coordinates from a csv table
@@ -16,16 +16,15 @@ def project_xy_table(**kwargs):
             'output_projection' -- the machine number for the output projection
             'transformation' -- the geographic transformation to apply in the projection (can be null)
             'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the projection: 'arcpy' (default) to create and project a feature class or 'numpy' to project the coordinates of the table in closed form
             'input_array' -- an array containing the csv table
-            'output_array' -- an array containing the output feature class
-    Returned Value: Returns a feature class to disk in a shapefile or geodatabase
-    Preconditions: requires an input csv table with latitude and longitude fields
+            'output_array' -- an array containing the output feature class, or the output csv table for the numpy backend
+    Returned Value: Returns a feature class to disk in a shapefile or geodatabase, or a csv table with POINT_X and POINT_Y fields in place of the input coordinate fields for the numpy backend
+    Preconditions: requires an input csv table with latitude and longitude fields; the numpy backend projects only from NAD 1983 (4269) or WGS 1984 (4326) to NAD 1983 Alaska Albers (3338) and does not apply the transformation
     """
 
     # Import packages
-    import arcpy
     import datetime
-    import os
     import time
 
     # Parse key word argument inputs
@@ -35,64 +34,98 @@ def project_xy_table(**kwargs):
     output_projection = kwargs['output_projection']
     transformation = kwargs['transformation']
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     input_csv = kwargs['input_array'][0]
     output_feature = kwargs['output_array'][0]
 
-    # Define intermediate files
-    point_feature = os.path.join(work_geodatabase, 'point_feature')
+    # Project the coordinates of the table in closed form with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import pandas as pd
+        from package_GeospatialProcessing import project_table_albers
+
+        # Check that the projection is supported
+        if input_projection not in (4269, 4326) or output_projection != 3338:
+            raise ValueError(f'The numpy backend projects from 4269 or 4326 to 3338, not from {input_projection} '
+                             f'to {output_projection}.')
+
+        # Project xy coordinates
+        print(f'\tProjecting xy coordinates...')
+        iteration_start = time.time()
+        input_data = pd.read_csv(input_csv)
+        output_data = project_table_albers(input_data, [longitude_field, latitude_field])
+        # Remove old coordinates to match the fields of the arcpy backend
+        output_data = output_data.drop(columns=[longitude_field, latitude_field])
+        output_data.to_csv(output_feature, header=True, index=False, sep=',', encoding='utf-8')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = 'Successfully projected coordinates.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from package_GeospatialProcessing import scratch_workspace
+
+    # Store intermediate datasets in a scratch workspace that is deleted when the projection completes or fails
+    with scratch_workspace('project_xy') as define_scratch:
+        # Define intermediate files
+        point_feature = define_scratch('point_feature')
 
-    # Set overwrite option
-    arcpy.env.overwriteOutput = True
+        # Set overwrite option
+        arcpy.env.overwriteOutput = True
 
-    # Set workspace
-    arcpy.env.workspace = work_geodatabase
+        # Set workspace
+        arcpy.env.workspace = work_geodatabase
 
-    # Define the input and output projection
-    initial_projection = arcpy.SpatialReference(input_projection)
-    target_projection = arcpy.SpatialReference(output_projection)
+        # Define the input and output projection
+        initial_projection = arcpy.SpatialReference(input_projection)
+        target_projection = arcpy.SpatialReference(output_projection)
 
-    # Convert xy coordinates to table feature class
-    print(f'\tConverting point table to feature class...')
-    iteration_start = time.time()
-    arcpy.management.XYTableToPoint(input_csv,
-                                    point_feature,
-                                    longitude_field,
-                                    latitude_field,
-                                    '',
-                                    initial_projection)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Convert xy coordinates to table feature class
+        print(f'\tConverting point table to feature class...')
+        iteration_start = time.time()
+        arcpy.management.XYTableToPoint(input_csv,
+                                        point_feature,
+                                        longitude_field,
+                                        latitude_field,
+                                        '',
+                                        initial_projection)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Project xy coordinates
-    print(f'\tProjecting xy coordinates...')
-    iteration_start = time.time()
-    arcpy.management.Project(point_feature,
-                             output_feature,
-                             target_projection,
-                             transformation,
-                             initial_projection,
-                             '',
-                             '',
-                             '')
-    # Remove old coordinates and add new coordinates
-    arcpy.management.DeleteField(output_feature, [longitude_field, latitude_field])
-    arcpy.management.AddXY(output_feature)
-    # Delete point feature if it exists
-    if arcpy.Exists(point_feature) == 1:
-        arcpy.management.Delete(point_feature)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Project xy coordinates
+        print(f'\tProjecting xy coordinates...')
+        iteration_start = time.time()
+        arcpy.management.Project(point_feature,
+                                 output_feature,
+                                 target_projection,
+                                 transformation,
+                                 initial_projection,
+                                 '',
+                                 '',
+                                 '')
+        # Remove old coordinates and add new coordinates
+        arcpy.management.DeleteField(output_feature, [longitude_field, latitude_field])
+        arcpy.management.AddXY(output_feature)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
     out_process = 'Successfully converted and projected coordinates.'
     return out_process
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Raster Array Input and Output
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Raster Array Input and Output" is a set of functions that read a single band raster into a numpy array and write a numpy array to a GeoTIFF on the grid of a reference raster.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a raster into an array
+def read_raster_array(input_raster):
+    """
+    Description: reads the first band of a raster into a numpy array
+    Inputs: 'input_raster' -- path to a raster dataset
+    Returned Value: Returns a numpy array of raster values, a boolean array that is True where the raster has data, and the raster profile
+    Preconditions: requires a raster format that can be read by rasterio (e.g., GeoTIFF or ERDAS Imagine)
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+
+    # Read raster values, data mask, and profile
+    with rasterio.open(input_raster) as raster_reader:
+        raster_array = raster_reader.read(1)
+        data_mask = raster_reader.read_masks(1) > 0
+        raster_profile = raster_reader.profile.copy()
+
+    # Treat non-finite floating point values as no data
+    if np.issubdtype(raster_array.dtype, np.floating):
+        data_mask = data_mask & np.isfinite(raster_array)
+
+    return raster_array, data_mask, raster_profile
+
+# Define a function to write an array to a raster
+def write_raster_array(output_raster, raster_array, raster_profile, value_type, no_data):
+    """
+    Description: writes a numpy array to a compressed single band GeoTIFF
+    Inputs: 'output_raster' -- path to the output GeoTIFF
+            'raster_array' -- a two dimensional numpy array of output values with no data cells already set to the no data value
+            'raster_profile' -- the profile of the reference raster that defines the grid of the output
+            'value_type' -- a numpy data type name for the output (e.g., 'int16', 'int32', 'float32')
+            'no_data' -- the no data value of the output
+    Returned Value: Returns a raster dataset on disk
+    Preconditions: the array must have the same shape as the reference raster
+    """
+
+    # Import packages
+    import os
+    import rasterio
+
+    # Check that the array matches the reference grid
+    if raster_array.shape != (raster_profile['height'], raster_profile['width']):
+        raise ValueError(f'Array shape {raster_array.shape} does not match the reference raster '
+                         f'({raster_profile["height"]}, {raster_profile["width"]}).')
+
+    # Define output profile
+    output_profile = raster_profile.copy()
+    output_profile.update(driver='GTiff',
+                          count=1,
+                          dtype=value_type,
+                          nodata=no_data,
+                          compress='lzw',
+                          tiled=True,
+                          blockxsize=512,
+                          blockysize=512,
+                          BIGTIFF='IF_SAFER')
+
+    # Write array to a temporary file and move it into place so that interrupted writes do not leave partial rasters
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+    with rasterio.open(temporary_raster, 'w', **output_profile) as raster_writer:
+        raster_writer.write(raster_array.astype(value_type, copy=False), 1)
+    os.replace(temporary_raster, output_raster)
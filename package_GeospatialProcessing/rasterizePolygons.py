@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Rasterize polygons
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Rasterize polygons" is a set of functions that burn polygons onto the grid of a study area raster with a scanline algorithm. The crossings of all polygon edges with the cell center line of each row are calculated at once, sorted by polygon, row, and position, and paired with the even-odd rule, so holes and multipart polygons are burned without testing individual cells. The grid is burned block by block and the output is written once.
+# ---------------------------------------------------------------------------
+
+# Define a function to collect the edges of a set of polygons
+def define_polygon_edges(polygons):
+    """
+    Description: collects the non-horizontal edges of the rings of a set of polygons
+    Inputs: 'polygons' -- a list of polygons, each a list of vertex arrays with shape (n, 2) for its exterior and interior rings (the rings of all parts of a multipart polygon belong to one polygon)
+    Returned Value: Returns an array with one row per edge and the columns x1, y1, x2, y2, and polygon number
+    Preconditions: the rings of a polygon are combined with the even-odd rule, so interior rings are holes regardless of their orientation
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Collect the edges of all rings
+    edge_list = []
+    for polygon_number, rings in enumerate(polygons):
+        for ring in rings:
+            ring = np.asarray(ring, dtype='float64')
+            if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+                ring = ring[:-1]
+            if len(ring) >= 3:
+                edge_list.append(np.column_stack([ring, np.roll(ring, -1, axis=0), np.full(len(ring), polygon_number)]))
+    if len(edge_list) == 0:
+        return np.empty((0, 5))
+    edges = np.concatenate(edge_list)
+
+    # Remove horizontal edges because they never cross a cell center line
+    return edges[edges[:, 1] != edges[:, 3]]
+
+# Define a function to burn polygon edges onto a block of a grid
+def rasterize_polygon_block(edges, grid_transform, window):
+    """
+    Description: burns polygons onto a block of a grid with the even-odd scanline rule at cell centers
+    Inputs: 'edges' -- an array of polygon edges from define_polygon_edges
+            'grid_transform' -- the affine transform of the grid
+            'window' -- a rasterio window on the grid
+    Returned Value: Returns a boolean array of the block that is True for cells whose center is inside a polygon
+    Preconditions: the grid must be north up; a cell is burned when its center is inside a polygon, which matches the cell center rule of FeatureToRaster
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define the block position on the grid
+    row_offset, column_offset = int(window.row_off), int(window.col_off)
+    height, width = int(window.height), int(window.width)
+    cell_width, cell_height = grid_transform.a, grid_transform.e
+    origin_x, origin_y = grid_transform.c, grid_transform.f
+
+    # Select the edges that span the cell center lines of the block
+    y_minimum = np.minimum(edges[:, 1], edges[:, 3])
+    y_maximum = np.maximum(edges[:, 1], edges[:, 3])
+    first_center = origin_y + cell_height * (row_offset + 0.5)
+    last_center = origin_y + cell_height * (row_offset + height - 0.5)
+    block_edges = (y_maximum > last_center) & (y_minimum <= first_center)
+    edges = edges[block_edges]
+    y_minimum = y_minimum[block_edges]
+    y_maximum = y_maximum[block_edges]
+    if len(edges) == 0:
+        return np.zeros((height, width), dtype=bool)
+
+    # Calculate the block rows that each edge may cross with one row of margin for rounding
+    first_row = np.floor((y_maximum - origin_y) / cell_height - 0.5).astype('int64') - row_offset
+    last_row = np.floor((y_minimum - origin_y) / cell_height - 0.5).astype('int64') - row_offset + 1
+    first_row = np.clip(first_row, 0, height - 1)
+    last_row = np.clip(last_row, 0, height - 1)
+    row_counts = last_row - first_row + 1
+
+    # Expand each edge to its candidate rows and keep the rows whose center line it crosses
+    edge_numbers = np.repeat(np.arange(len(edges)), row_counts)
+    rows = first_row[edge_numbers] + np.arange(row_counts.sum()) - np.repeat(np.cumsum(row_counts) - row_counts,
+                                                                              row_counts)
+    center_y = origin_y + cell_height * (row_offset + rows + 0.5)
+    x1, y1, x2, y2, polygon_numbers = (edges[edge_numbers, column] for column in range(5))
+    is_crossing = (y1 > center_y) != (y2 > center_y)
+    rows = rows[is_crossing]
+    center_y = center_y[is_crossing]
+    x1, y1, x2, y2, polygon_numbers = (values[is_crossing] for values in (x1, y1, x2, y2, polygon_numbers))
+    crossing_x = x1 + (center_y - y1) * (x2 - x1) / (y2 - y1)
+
+    # Convert each crossing to the first column whose center is at or beyond the crossing
+    crossing_columns = np.ceil((crossing_x - origin_x) / cell_width - 0.5).astype('int64') - column_offset
+    crossing_columns = np.clip(crossing_columns, 0, width)
+
+    # Pair the crossings of each polygon and row in order so that each pair encloses the inside of the polygon
+    crossing_order = np.lexsort((crossing_x, rows, polygon_numbers))
+    rows = rows[crossing_order]
+    crossing_columns = crossing_columns[crossing_order]
+    span_rows = rows[0::2]
+    span_starts = crossing_columns[0::2]
+    span_ends = crossing_columns[1::2]
+
+    # Mark the start and end of each span and fill the spans with a cumulative sum along each row
+    span_marks = (np.bincount(span_rows * (width + 1) + span_starts, minlength=height * (width + 1))
+                  - np.bincount(span_rows * (width + 1) + span_ends, minlength=height * (width + 1)))
+    span_cover = np.cumsum(span_marks.reshape(height, width + 1), axis=1)[:, :width]
+
+    return span_cover > 0
+
+# Define a function to rasterize polygons on the grid of a study area raster
+def rasterize_polygons(polygons, study_area, output_raster, inside_value=1, outside_value=0, value_type='int8',
+                       no_data=-128, block_size=1024, threads=None):
+    """
+    Description: burns polygons onto the grid of a study area raster block by block and writes the output once
+    Inputs: 'polygons' -- a list of polygons, each a list of vertex arrays for its rings in the coordinate system of the study area raster
+            'study_area' -- path to the study area raster that defines the output grid and the cells that receive output values
+            'output_raster' -- path to the output GeoTIFF
+            'inside_value' -- the value of cells whose center is inside a polygon
+            'outside_value' -- the value of the other cells in the study area
+            'value_type' -- a numpy data type name for the output
+            'no_data' -- the no data value of the output outside of the study area
+            'block_size' -- the number of rows and columns in a block; multiples of 512 match the output tiles
+            'threads' -- the number of threads that burn blocks; defaults to the cores of the compute budget
+    Returned Value: Returns a dictionary with the number of blocks, the number of burned cells, and the elapsed seconds
+    Preconditions: the study area raster must be north up
+    """
+
+    # Import packages
+    import concurrent.futures
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    import threading
+    import time
+    from package_Pipeline import read_compute_budget
+
+    # Define number of threads
+    if threads is None:
+        threads = read_compute_budget()['cores']
+
+    # Define the output grid from the study area
+    with rasterio.open(study_area) as study_reader:
+        output_profile = study_reader.profile.copy()
+    grid_transform = output_profile['transform']
+    if grid_transform.b != 0 or grid_transform.d != 0 or grid_transform.e >= 0:
+        raise ValueError('Study area raster must be north up.')
+    output_profile.update(driver='GTiff',
+                          count=1,
+                          dtype=value_type,
+                          nodata=no_data,
+                          compress='lzw',
+                          tiled=True,
+                          blockxsize=512,
+                          blockysize=512,
+                          BIGTIFF='IF_SAFER')
+
+    # Collect polygon edges and define blocks aligned with the study area grid
+    edges = define_polygon_edges(polygons)
+    windows = [Window(column, row,
+                      min(block_size, output_profile['width'] - column),
+                      min(block_size, output_profile['height'] - row))
+               for row in range(0, output_profile['height'], block_size)
+               for column in range(0, output_profile['width'], block_size)]
+
+    # Burn blocks and write each output block once
+    block_start = time.time()
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+    write_lock = threading.Lock()
+    local_readers = threading.local()
+    opened_readers = []
+    burned_cells = [0]
+    # Remove the partial output if a block fails
+    try:
+        with rasterio.open(temporary_raster, 'w', **output_profile) as raster_writer:
+            # Define a function to burn a block with a study area reader that is not shared between threads
+            def burn_block(window):
+                if not hasattr(local_readers, 'reader'):
+                    local_readers.reader = rasterio.open(study_area)
+                    with write_lock:
+                        opened_readers.append(local_readers.reader)
+                study_mask = local_readers.reader.read_masks(1, window=window) > 0
+                is_inside = rasterize_polygon_block(edges, grid_transform, window) & study_mask
+                output_block = np.full(study_mask.shape, no_data, dtype=value_type)
+                output_block[study_mask] = outside_value
+                output_block[is_inside] = inside_value
+                with write_lock:
+                    raster_writer.write(output_block, 1, window=window)
+                    burned_cells[0] += int(is_inside.sum())
+
+            # Burn all blocks
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                    list(executor.map(burn_block, windows))
+            finally:
+                for study_reader in opened_readers:
+                    study_reader.close()
+    except Exception:
+        if os.path.exists(temporary_raster):
+            os.remove(temporary_raster)
+        raise
+    os.replace(temporary_raster, output_raster)
+    block_elapsed = time.time() - block_start
+
+    return {'blocks': len(windows),
+            'burned_cells': burned_cells[0],
+            'elapsed': block_elapsed}
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Run geoprocessing batch
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation for jobs that use arcpy. Requires pandas.
+# Description: "Run geoprocessing batch" is a function that runs a list of independent geoprocessing jobs through the arcpy geoprocessing wrapper in separate worker processes with a limit on concurrent jobs, a scratch workspace for each job, an even share of the compute budget for each job, retries with exponential backoff for failed jobs, and a summary table of the status, attempts, and timing of each job.
+# ---------------------------------------------------------------------------
+
+# Define a function to run a batch of geoprocessing jobs in separate processes
+def run_geoprocessing_batch(jobs, scratch_folder, max_workers=2, retries=2, backoff=30, summary_file=None,
+                            interpreter=None):
+    """
+    Description: runs independent geoprocessing jobs concurrently in separate processes and retries failed jobs
+    Inputs: 'jobs' -- a list of jobs where each job is a list or tuple of a geoprocessing function and its key word arguments
+            'scratch_folder' -- a folder in which to store the job files, logs, and scratch workspace of each job
+            'max_workers' -- the maximum number of jobs that run at the same time; the compute budget is divided evenly among them
+            'retries' -- the number of times a failed job is rerun before it is reported as failed; jobs with missing inputs are not rerun
+            'backoff' -- the seconds to wait before the first retry of a job; the wait doubles for each further retry
+            'summary_file' -- an optional csv file in which to store the summary table
+            'interpreter' -- an optional path to the python executable for the worker processes; defaults to the current python
+    Returned Value: Returns a pandas data frame with the name, function, status, attempts, elapsed seconds, error, and log file of each job
+    Preconditions: geoprocessing functions must be importable from their modules and key word arguments must be serializable to json; jobs must not write the same outputs
+    """
+
+    # Import packages
+    import concurrent.futures
+    import datetime
+    import json
+    import os
+    import pandas as pd
+    import shutil
+    import subprocess
+    import sys
+    import threading
+    import time
+    from package_Pipeline import read_compute_budget
+
+    # Define the interpreter and the repository folder so that workers can import the repository packages
+    if interpreter is None:
+        interpreter = sys.executable
+    repository_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [repository_folder] + [path for path in [os.environ.get('PYTHONPATH')] if path])
+    environment['PYTHONUNBUFFERED'] = '1'
+
+    # Divide the compute budget evenly among concurrent jobs so that workers do not oversubscribe the budget
+    batch_budget = read_compute_budget()
+    job_cores = max(1, batch_budget['cores'] // max_workers)
+    job_memory = (batch_budget['memory_mb'] // max_workers if batch_budget['memory_mb'] is not None else None)
+    environment['COMPUTE_BUDGET'] = json.dumps({'cores': job_cores,
+                                                'memory_mb': job_memory,
+                                                'source': 'batch job'})
+
+    # Name each job after its first output
+    job_names = []
+    for geoprocessing_function, job_kwargs in jobs:
+        output_array = job_kwargs.get('output_array', [])
+        base_name = (os.path.splitext(os.path.basename(output_array[0]))[0] if len(output_array) > 0
+                     else geoprocessing_function.__name__)
+        job_name = base_name
+        suffix = 2
+        while job_name in job_names:
+            job_name = f'{base_name}_{suffix}'
+            suffix += 1
+        job_names.append(job_name)
+
+    # Create log folder
+    log_folder = os.path.join(scratch_folder, 'logs')
+    if not os.path.exists(log_folder):
+        os.makedirs(log_folder)
+
+    # Define a function to run a job with retries in separate processes
+    print_lock = threading.Lock()
+
+    def run_job(job_name, geoprocessing_function, job_kwargs):
+        job_folder = os.path.join(scratch_folder, job_name)
+        job_status = {'job': job_name,
+                      'function': geoprocessing_function.__name__,
+                      'status': 'failed',
+                      'attempts': 0,
+                      'elapsed': 0.0,
+                      'error': '',
+                      'log_file': ''}
+        for attempt in range(1, retries + 2):
+            # Wait before retries with exponential backoff
+            if attempt > 1:
+                wait_time = backoff * 2 ** (attempt - 2)
+                with print_lock:
+                    print(f'\tRetrying {job_name} in {wait_time} seconds (attempt {attempt} of {retries + 1})...')
+                time.sleep(wait_time)
+            # Write the job file with a clean scratch workspace
+            if os.path.exists(job_folder):
+                shutil.rmtree(job_folder, ignore_errors=True)
+            os.makedirs(job_folder)
+            job_file = os.path.join(job_folder, 'job.json')
+            result_file = os.path.join(job_folder, 'result.json')
+            with open(job_file, 'w', encoding='utf-8') as job_writer:
+                json.dump({'module': geoprocessing_function.__module__,
+                           'function': geoprocessing_function.__name__,
+                           'kwargs': job_kwargs,
+                           'scratch_workspace': os.path.join(job_folder, 'workspace'),
+                           'result_file': result_file}, job_writer, indent=2)
+            # Run the job in a separate process
+            log_file = os.path.join(log_folder, f'{job_name}_attempt{attempt}.txt')
+            start_time = time.time()
+            with open(log_file, 'w', encoding='utf-8') as log_writer:
+                process = subprocess.run([interpreter, '-c',
+                                          'import sys; from package_GeospatialProcessing import execute_geoprocessing_job; '
+                                          'sys.exit(0 if execute_geoprocessing_job(sys.argv[1]) else 1)',
+                                          job_file],
+                                         cwd=repository_folder,
+                                         env=environment,
+                                         stdout=log_writer,
+                                         stderr=subprocess.STDOUT)
+            job_status['attempts'] = attempt
+            job_status['elapsed'] += time.time() - start_time
+            job_status['log_file'] = log_file
+            # Read the result of the job and treat a worker that exited with an error as failed
+            worker_error = {'status': 'failed', 'error': f'Worker process exited with code {process.returncode}.'}
+            job_result = worker_error
+            if os.path.exists(result_file):
+                with open(result_file, 'r', encoding='utf-8') as result_reader:
+                    job_result = json.load(result_reader)
+            if process.returncode != 0 and job_result['status'] == 'completed':
+                job_result = worker_error
+            job_status['status'] = job_result['status']
+            job_status['error'] = job_result['error']
+            if job_result['status'] == 'completed':
+                shutil.rmtree(job_folder, ignore_errors=True)
+                break
+            with print_lock:
+                print(f'\tJob {job_name} failed on attempt {attempt}: {job_status["error"]}')
+            # Do not retry jobs with missing inputs
+            if job_status['error'].startswith('FileNotFoundError'):
+                break
+        with print_lock:
+            print(f'\tJob {job_name} {job_status["status"]} after {job_status["attempts"]} attempt(s) '
+                  f'(Elapsed time: {datetime.timedelta(seconds=int(job_status["elapsed"]))}).')
+        return job_status
+
+    # Run jobs with a limit on concurrent jobs
+    job_memory_text = f'{job_memory} MB' if job_memory is not None else 'unknown memory'
+    print(f'\tRunning {len(jobs)} jobs with up to {max_workers} at a time; each job is allocated {job_cores} of '
+          f'{batch_budget["cores"]} core(s) and {job_memory_text} ({batch_budget["source"]} budget)...')
+    batch_start = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        job_futures = [executor.submit(run_job, job_name, geoprocessing_function, job_kwargs)
+                       for job_name, (geoprocessing_function, job_kwargs) in zip(job_names, jobs)]
+        job_statuses = [job_future.result() for job_future in job_futures]
+    batch_elapsed = int(time.time() - batch_start)
+
+    # Create summary table
+    summary_data = pd.DataFrame(job_statuses,
+                                columns=['job', 'function', 'status', 'attempts', 'elapsed', 'error', 'log_file'])
+    summary_data['elapsed'] = summary_data['elapsed'].round(1)
+    if summary_file is not None:
+        summary_data.to_csv(summary_file, header=True, index=False, sep=',', encoding='utf-8')
+
+    # Report summary
+    completed_count = int((summary_data['status'] == 'completed').sum())
+    print(f'\tCompleted {completed_count} of {len(jobs)} jobs; {len(jobs) - completed_count} failed '
+          f'(Elapsed time: {datetime.timedelta(seconds=batch_elapsed)}).')
+    if len(jobs) > 0:
+        print(summary_data[['job', 'status', 'attempts', 'elapsed']].to_string(index=False))
+    print('\t----------')
+
+    return summary_data
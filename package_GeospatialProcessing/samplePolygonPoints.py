@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Sample polygon points
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy 1.17+ installed.
+# Description: "Sample polygon points" is a set of functions that index the edges of a polygon in horizontal strips, test whole arrays of points against the indexed edges with the even-odd rule, and draw a seeded, uniform random sample of points inside each polygon of a set by batched rejection sampling within the polygon extents.
+# ---------------------------------------------------------------------------
+
+# Define a function to index the edges of a polygon
+def define_edge_index(rings, strip_count=None):
+    """
+    Description: indexes the non-horizontal edges of the rings of a polygon by horizontal strips
+    Inputs: 'rings' -- a list of vertex arrays with shape (n, 2) for the rings of a polygon
+            'strip_count' -- an optional number of horizontal strips; defaults to the square root of the number of edges
+    Returned Value: Returns a dictionary of the edge coordinates ('edges'), the polygon extent ('bounds'), the strip height ('strip_height'), and the edge numbers of each strip ('strip_edges')
+    Preconditions: rings are combined with the even-odd rule, so interior rings are holes regardless of their orientation
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Collect the edges of all rings
+    edge_list = []
+    for ring in rings:
+        ring = np.asarray(ring, dtype='float64')
+        if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+            ring = ring[:-1]
+        if len(ring) >= 3:
+            edge_list.append(np.column_stack([ring, np.roll(ring, -1, axis=0)]))
+    if len(edge_list) == 0:
+        raise ValueError('Polygon does not contain a ring with at least three vertices.')
+    edges = np.concatenate(edge_list)
+
+    # Calculate the extent before horizontal edges are removed because they never cross a horizontal ray
+    bounds = (edges[:, 0].min(), edges[:, 1].min(), edges[:, 0].max(), edges[:, 1].max())
+    edges = edges[edges[:, 1] != edges[:, 3]]
+
+    # Assign each edge to the strips that its y range overlaps
+    if strip_count is None:
+        strip_count = max(1, int(np.sqrt(len(edges))))
+    strip_height = max((bounds[3] - bounds[1]) / strip_count, np.finfo('float64').tiny)
+    first_strip = np.clip(((np.minimum(edges[:, 1], edges[:, 3]) - bounds[1]) // strip_height).astype(int),
+                          0, strip_count - 1)
+    last_strip = np.clip(((np.maximum(edges[:, 1], edges[:, 3]) - bounds[1]) // strip_height).astype(int),
+                         0, strip_count - 1)
+    strip_edges = [np.flatnonzero((first_strip <= strip) & (last_strip >= strip)) for strip in range(strip_count)]
+
+    return {'edges': edges,
+            'bounds': bounds,
+            'strip_height': strip_height,
+            'strip_edges': strip_edges}
+
+# Define a function to test if points are inside an indexed polygon
+def test_points_in_polygon(x, y, edge_index):
+    """
+    Description: tests if points are inside a polygon by counting the indexed edges that a ray from each point crosses
+    Inputs: 'x' -- an array of x coordinates
+            'y' -- an array of y coordinates
+            'edge_index' -- an edge index of a polygon created by define_edge_index
+    Returned Value: Returns a boolean array that is True for points inside the polygon
+    Preconditions: points exactly on an edge may be classified as inside or outside
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define the strip of each point
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    bounds = edge_index['bounds']
+    strip_count = len(edge_index['strip_edges'])
+    point_strip = np.clip(((y - bounds[1]) // edge_index['strip_height']).astype(int), 0, strip_count - 1)
+
+    # Count the edges of the strip that a ray to the east of each point crosses
+    is_inside = np.zeros(len(x), dtype=bool)
+    for strip, strip_edges in enumerate(edge_index['strip_edges']):
+        point_numbers = np.flatnonzero(point_strip == strip)
+        if len(point_numbers) == 0 or len(strip_edges) == 0:
+            continue
+        x1, y1, x2, y2 = (edge_index['edges'][strip_edges, column][np.newaxis, :] for column in range(4))
+        point_x = x[point_numbers][:, np.newaxis]
+        point_y = y[point_numbers][:, np.newaxis]
+        spans = (y1 > point_y) != (y2 > point_y)
+        crossings = spans & (point_x < x1 + (point_y - y1) * (x2 - x1) / (y2 - y1))
+        is_inside[point_numbers] = crossings.sum(axis=1) % 2 == 1
+    is_inside &= (x >= bounds[0]) & (x <= bounds[2]) & (y >= bounds[1]) & (y <= bounds[3])
+
+    return is_inside
+
+# Define a function to sample random points inside polygons
+def sample_polygon_points(polygons, number_points, seed=None, batch_limit=1000000):
+    """
+    Description: draws uniform random points inside each polygon of a set by batched rejection sampling
+    Inputs: 'polygons' -- a dictionary of lists of polygon rings keyed by polygon id (e.g., deployment id)
+            'number_points' -- the number of points to draw in each polygon
+            'seed' -- an optional seed for the random number generator so that samples are reproducible
+            'batch_limit' -- the maximum number of candidate points tested at a time
+    Returned Value: Returns arrays of the x coordinates, y coordinates, and polygon ids of the points, ordered by polygon
+    Preconditions: the same seed, polygons, and number of points return the same sample
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Create random number generator
+    generator = np.random.default_rng(seed)
+
+    # Draw points within each polygon
+    x_list = []
+    y_list = []
+    id_list = []
+    for polygon_id, rings in polygons.items():
+        edge_index = define_edge_index(rings)
+        minimum_x, minimum_y, maximum_x, maximum_y = edge_index['bounds']
+        accepted_x = []
+        accepted_y = []
+        accepted_count = 0
+        acceptance_rate = 0.5
+        while accepted_count < number_points:
+            # Draw enough candidates in the extent to fill the remaining points at the observed acceptance rate
+            batch_size = int(min(batch_limit, (number_points - accepted_count) / acceptance_rate * 1.1 + 16))
+            candidate_x = generator.uniform(minimum_x, maximum_x, batch_size)
+            candidate_y = generator.uniform(minimum_y, maximum_y, batch_size)
+            is_inside = test_points_in_polygon(candidate_x, candidate_y, edge_index)
+            inside_count = int(is_inside.sum())
+            acceptance_rate = max(inside_count / batch_size, 0.001)
+            accepted_x.append(candidate_x[is_inside])
+            accepted_y.append(candidate_y[is_inside])
+            accepted_count += inside_count
+        x_list.append(np.concatenate(accepted_x)[:number_points])
+        y_list.append(np.concatenate(accepted_y)[:number_points])
+        id_list.append(np.full(number_points, polygon_id))
+
+    return np.concatenate(x_list), np.concatenate(y_list), np.concatenate(id_list)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Sample raster points
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Sample raster points" is a set of functions that convert point coordinates to the rows and columns of a raster grid in one vectorized step and sample raster values at all points by reading only the row strips that contain points, so that memory use is bounded by the strip size instead of the raster size.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate the raster cells of points
+def define_point_cells(raster_reader, x, y, strip_height=1024):
+    """
+    Description: calculates the row and column of each point on the grid of a raster and orders the points by row strip
+    Inputs: 'raster_reader' -- an open rasterio dataset that defines the grid
+            'x' -- an array of x coordinates in the coordinate system of the raster
+            'y' -- an array of y coordinates in the coordinate system of the raster
+            'strip_height' -- the number of raster rows read at a time
+    Returned Value: Returns a dictionary of the point numbers inside the raster ordered by row ('points'), their rows ('rows') and columns ('columns'), and the first and last position of the points of each strip that contains points ('strips')
+    Preconditions: the raster must not be rotated
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Check that the grid is not rotated
+    transform = raster_reader.transform
+    if transform.b != 0 or transform.d != 0:
+        raise ValueError('Rotated rasters are not supported.')
+
+    # Convert coordinates to rows and columns with the inverse of the grid transform
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    columns = np.floor((x - transform.c) / transform.a)
+    rows = np.floor((y - transform.f) / transform.e)
+    is_inside = (rows >= 0) & (rows < raster_reader.height) & (columns >= 0) & (columns < raster_reader.width)
+
+    # Order the points inside the raster by row so that each strip is a contiguous slice of points
+    points = np.flatnonzero(is_inside)
+    rows = rows[points].astype('int64')
+    columns = columns[points].astype('int64')
+    row_order = np.argsort(rows, kind='stable')
+    points = points[row_order]
+    rows = rows[row_order]
+    columns = columns[row_order]
+
+    # Find the slice of points in each strip
+    point_strips = rows // strip_height
+    strip_numbers, strip_starts = np.unique(point_strips, return_index=True)
+    strip_ends = np.append(strip_starts[1:], len(points))
+    strips = [(int(strip) * strip_height, int(start), int(end))
+              for strip, start, end in zip(strip_numbers, strip_starts, strip_ends)]
+
+    return {'points': points,
+            'rows': rows,
+            'columns': columns,
+            'strips': strips}
+
+# Define a function to sample the values of a raster at points
+def sample_raster_points(input_raster, x, y, cell_cache=None, strip_height=1024):
+    """
+    Description: samples the first band of a raster at a set of points by reading the row strips that contain points
+    Inputs: 'input_raster' -- path to a raster dataset
+            'x' -- an array of x coordinates in the coordinate system of the raster
+            'y' -- an array of y coordinates in the coordinate system of the raster
+            'cell_cache' -- an optional dictionary in which the point cells of each raster grid are stored so that rasters on the same grid reuse them
+            'strip_height' -- the number of raster rows read at a time
+    Returned Value: Returns a float64 array of raster values with NaN for points that are outside the raster or in no data cells
+    Preconditions: the same coordinate arrays must be passed with the same cell cache
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+
+    # Sample raster values
+    point_values = np.full(len(x), np.nan)
+    with rasterio.open(input_raster) as raster_reader:
+        # Calculate the point cells once for each raster grid
+        grid_key = (tuple(raster_reader.transform), raster_reader.height, raster_reader.width, strip_height)
+        if cell_cache is None:
+            cell_cache = {}
+        if grid_key not in cell_cache:
+            cell_cache[grid_key] = define_point_cells(raster_reader, x, y, strip_height)
+        point_cells = cell_cache[grid_key]
+
+        # Read the columns of each strip that contain points and look up the values of its points
+        for row_start, start, end in point_cells['strips']:
+            strip_rows = point_cells['rows'][start:end] - row_start
+            strip_columns = point_cells['columns'][start:end]
+            column_start = int(strip_columns.min())
+            window = Window(column_start, row_start,
+                            int(strip_columns.max()) - column_start + 1,
+                            min(strip_height, raster_reader.height - row_start))
+            strip_values = raster_reader.read(1, window=window, masked=True)
+            sampled_values = strip_values.data[strip_rows, strip_columns - column_start].astype('float64')
+            sampled_values[np.ma.getmaskarray(strip_values)[strip_rows, strip_columns - column_start]] = np.nan
+            # Treat non-finite floating point values as no data
+            sampled_values[~np.isfinite(sampled_values)] = np.nan
+            point_values[point_cells['points'][start:end]] = sampled_values
+
+    return point_values
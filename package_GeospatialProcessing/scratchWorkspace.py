@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Scratch workspace
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in any Python 3.6+ installation. Feature classes and tables are stored in memory only in an ArcGIS Pro Python 3.6 installation.
+# Description: "Scratch workspace" is a context manager that defines uniquely named intermediate datasets in memory or in a temporary folder on local disk instead of the project geodatabase on the network drive and deletes all of them when the context closes, including when a geoprocessing step fails.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import contextlib
+
+# Define a context manager to create and delete a scratch workspace
+@contextlib.contextmanager
+def scratch_workspace(prefix='scratch', local_folder=None, memory_limit=2 * 1024 ** 3):
+    """
+    Description: creates a scratch workspace and yields a function that defines unique intermediate dataset paths
+    Inputs: 'prefix' -- a prefix for the temporary folder name
+            'local_folder' -- an optional folder on local disk in which to create the temporary folder; defaults to the system temporary folder
+            'memory_limit' -- the largest size hint in bytes for which feature classes and tables are stored in memory; larger datasets are stored in a scratch geodatabase on local disk
+    Returned Value: Yields a function define_scratch(name, data_type='feature', size_hint=None) that returns a path for an intermediate feature class or table ('feature' or 'table'), a GeoTIFF ('raster'), or a folder ('folder')
+    Preconditions: rasters and folders are always stored on local disk; intermediate datasets must not be used after the context closes
+    """
+
+    # Import packages
+    import os
+    import shutil
+    import tempfile
+    import uuid
+
+    # Use the arcpy memory workspace if arcpy is installed
+    try:
+        import arcpy
+    except ImportError:
+        arcpy = None
+
+    # Create a unique temporary folder and name suffix so that concurrent calls do not collide
+    scratch_folder = tempfile.mkdtemp(prefix=f'{prefix}_', dir=local_folder)
+    scratch_suffix = uuid.uuid4().hex[:8]
+    memory_datasets = []
+
+    # Define a function to define a unique intermediate dataset path
+    def define_scratch(name, data_type='feature', size_hint=None):
+        unique_name = f'{name}_{scratch_suffix}'
+        if data_type == 'raster':
+            return os.path.join(scratch_folder, unique_name + '.tif')
+        if data_type == 'folder':
+            folder_path = os.path.join(scratch_folder, unique_name)
+            os.makedirs(folder_path)
+            return folder_path
+        if data_type not in ('feature', 'table'):
+            raise ValueError(f'Scratch data type must be \'feature\', \'table\', \'raster\', or \'folder\', not \'{data_type}\'.')
+        # Store feature classes and tables in memory unless they are expected to be large
+        if arcpy is not None and (size_hint is None or size_hint <= memory_limit):
+            memory_path = os.path.join('in_memory', unique_name)
+            memory_datasets.append(memory_path)
+            return memory_path
+        # Otherwise store them in a scratch geodatabase on local disk
+        scratch_geodatabase = os.path.join(scratch_folder, 'scratch.gdb')
+        if arcpy is not None and arcpy.Exists(scratch_geodatabase) == 0:
+            arcpy.management.CreateFileGDB(scratch_folder, 'scratch.gdb')
+        return os.path.join(scratch_geodatabase, unique_name)
+
+    # Yield the scratch function and delete all intermediate datasets when the context closes
+    try:
+        yield define_scratch
+    finally:
+        if arcpy is not None:
+            for memory_path in memory_datasets:
+                if arcpy.Exists(memory_path) == 1:
+                    arcpy.management.Delete(memory_path)
+        shutil.rmtree(scratch_folder, ignore_errors=True)
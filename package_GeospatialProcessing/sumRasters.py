@@ -2,46 +2,118 @@
 # ---------------------------------------------------------------------------
 # Sum rasters
 # Author: Timm Nawrocki
-# Last Updated: 2021-10-05
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation with rasterio installed for the arcpy backend or a Python 3.6+ installation with numpy and rasterio installed for the numpy backend.
 # Description: "Sum rasters" is a function that sums n number of rasters and returns a single output raster.
 # ---------------------------------------------------------------------------
 
+# Define a block kernel to sum input blocks with no data treated as zero
+def sum_raster_blocks(input_blocks):
+    """
+    Description: sums masked input blocks with masked cells treated as zero
+    Inputs: 'input_blocks' -- a list of masked integer arrays
+    Returned Value: Returns a 64 bit integer array of summed values
+    Preconditions: used as a block kernel for process_raster_blocks
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Sum blocks
+    summed_block = np.zeros(input_blocks[0].shape, dtype='int64')
+    for input_block in input_blocks:
+        summed_block += input_block.filled(0).astype('int64')
+
+    return summed_block
+
 # Define a function to sum n number of rasters
 def sum_rasters(**kwargs):
     """
     Description: calculates the sum of all input rasters in an array
     Inputs: 'work_geodatabase' -- path to a file geodatabase that will serve as the workspace
+            'backend' -- optional backend for the summation: 'arcpy' (default) for map algebra or 'numpy' for a block-wise sum that reads each input block once
+            'block_size' -- optional number of rows and columns in a block for the numpy backend (default 1024)
+            'threads' -- optional number of threads for the numpy backend
             'input_array' -- an array containing a raster study area (must be first) and all input rasters to be summed
             'output_array' -- an array containing the output summed raster
     Returned Value: Returns a raster dataset on disk containing the summed values
-    Preconditions: requires existing numeric raster datasets of the same value type
+    Preconditions: requires existing numeric raster datasets of the same value type; the numpy backend requires integer input rasters that are aligned with the grid of the study area raster
     """
 
     # Import packages
-    import arcpy
-    from arcpy.sa import Con
-    from arcpy.sa import ExtractByMask
-    from arcpy.sa import IsNull
-    from arcpy.sa import Raster
     import datetime
     import time
 
     # Parse key word argument inputs
     work_geodatabase = kwargs['work_geodatabase']
+    backend = kwargs.get('backend', 'arcpy')
     input_rasters = kwargs['input_array']
     study_area = input_rasters.pop(0)
     output_raster = kwargs['output_array'][0]
     input_length = len(input_rasters)
 
+    # Sum rasters block by block with the numpy backend if selected
+    if backend == 'numpy':
+        # Import packages
+        import numpy as np
+        import rasterio
+        from package_GeospatialProcessing import process_raster_blocks
+
+        # Check that the inputs are integer rasters and define the output type from the first input
+        for raster in input_rasters:
+            with rasterio.open(raster) as input_reader:
+                if not np.issubdtype(np.dtype(input_reader.dtypes[0]), np.integer):
+                    raise ValueError(f'{raster} must have an integer value type.')
+        with rasterio.open(input_rasters[0]) as input_reader:
+            value_type = input_reader.dtypes[0]
+            no_data_value = input_reader.nodata
+        # Use the no data default of arcpy for the value type if the first input does not define one
+        if no_data_value is None:
+            value_range = np.iinfo(np.dtype(value_type))
+            no_data_value = value_range.max if value_range.min == 0 else value_range.min
+            print(f'\t{input_rasters[0]} has no NoData value; using {no_data_value} for the {value_type} output.')
+
+        # Sum the input rasters for each block
+        print(f'\tSumming {input_length} rasters block by block...')
+        iteration_start = time.time()
+        block_summary = process_raster_blocks(sum_raster_blocks,
+                                              study_area,
+                                              input_rasters,
+                                              output_raster,
+                                              value_type,
+                                              no_data_value,
+                                              block_size=kwargs.get('block_size', 1024),
+                                              threads=kwargs.get('threads'))
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(f'\tRead {block_summary["megabytes_read"]:.1f} MB in {block_summary["blocks"]} blocks at '
+              f'{block_summary["megabytes_read"] / max(block_summary["elapsed"], 1e-6):.1f} MB/s.')
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+        out_process = 'Successfully summed rasters.'
+        return out_process
+
+    # Import arcpy packages
+    import arcpy
+    from arcpy.sa import Con
+    from arcpy.sa import ExtractByMask
+    from arcpy.sa import IsNull
+    from arcpy.sa import Raster
+    from package_GeospatialProcessing import describe_raster
+    from package_Pipeline import read_compute_budget
+
     # Set overwrite option
     arcpy.env.overwriteOutput = True
 
     # Set workspace
     arcpy.env.workspace = work_geodatabase
 
-    # Use two thirds of cores on processes that can be split.
-    arcpy.env.parallelProcessingFactor = "66%"
+    # Use the cores of the compute budget on processes that can be split.
+    arcpy.env.parallelProcessingFactor = str(read_compute_budget()['cores'])
 
     # Set snap raster, extent, and cell size
     arcpy.env.snapRaster = study_area
@@ -101,20 +173,9 @@ def sum_rasters(**kwargs):
 
     # Save the summed raster to disk
     iteration_start = time.time()
-    no_data_value = Raster(raster_one).noDataValue
-    type_number = arcpy.management.GetRasterProperties(raster_one, 'VALUETYPE').getOutput(0)
-    value_types = ['1_BIT',
-                   '2_BIT',
-                   '4_BIT',
-                   '8_BIT_UNSIGNED',
-                   '8_BIT_SIGNED',
-                   '16_BIT_UNSIGNED',
-                   '16_BIT_SIGNED',
-                   '32_BIT_UNSIGNED',
-                   '32_BIT_SIGNED',
-                   '32_BIT_FLOAT',
-                   '64_BIT']
-    value_type = value_types[int(type_number)]
+    raster_statistics = describe_raster(raster_one)
+    no_data_value = raster_statistics['no_data']
+    value_type = raster_statistics['value_type']
     print(f'\tSaving summed raster to disk as {value_type} raster with NODATA value of {no_data_value}...')
     arcpy.management.CopyRaster(extract_raster,
                                 output_raster,
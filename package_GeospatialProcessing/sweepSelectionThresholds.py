@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Sweep selection thresholds
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.6+ installation with numpy, pandas, and rasterio installed (e.g., a clone of the ArcGIS Pro Python environment).
+# Description: "Sweep selection thresholds" is a set of functions that convert a continuous selection raster and a significance raster to discrete habitat and calculate the distance to selected habitat for a list of thresholds in one run. The rasters are read once and classified once into the number of thresholds that each cell exceeds, the discrete habitat of each threshold is derived from that level, thresholds that select the same cells share one distance transform, and validation points and zones are located on the grid once and sampled in memory for every threshold.
+# ---------------------------------------------------------------------------
+
+# Define a function to classify selection values by the number of thresholds they exceed
+def define_selection_levels(continuous_array, significance_array, thresholds, significance_value=0):
+    """
+    Description: classifies each cell by the number of thresholds that its continuous selection value exceeds
+    Inputs: 'continuous_array' -- an array of continuous selection values
+            'significance_array' -- an array of significance values on the grid of the continuous array
+            'thresholds' -- a list of continuous selection thresholds in ascending order
+            'significance_value' -- the significance value of non-significant cells
+    Returned Value: Returns an int16 array that is -1 for non-significant cells and otherwise the number of thresholds that are less than the continuous value
+    Preconditions: a significant cell is selected at the threshold with sorted position k when its level is greater than k, so the discrete habitat of all thresholds is contained in one array
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Count the thresholds below each value and mark non-significant cells
+    selection_levels = np.searchsorted(np.asarray(thresholds, dtype='float64'), continuous_array, side='left')
+    selection_levels = selection_levels.astype('int16')
+    selection_levels[significance_array == significance_value] = -1
+
+    return selection_levels
+
+# Define a function to calculate discrete habitat, distance to habitat, and validation samples for a list of thresholds
+def sweep_selection_distance(study_area, continuous_raster, significance_raster, thresholds, validation_points=None,
+                             output_folder=None, output_name='Selection', significance_value=0, buffer_distance=1000,
+                             threads=None):
+    """
+    Description: converts continuous selection to discrete habitat and calculates the distance to selected habitat for each threshold in a list and samples the distances at sets of validation points and their zones
+    Inputs: 'study_area' -- path to the study area raster that defines the grid and the cells that receive values
+            'continuous_raster' -- path to the continuous selection raster on the grid of the study area
+            'significance_raster' -- path to the binary significance raster on the grid of the study area
+            'thresholds' -- a list of continuous selection thresholds
+            'validation_points' -- an optional dictionary of validation point sets keyed by name, each a tuple of x and y coordinate arrays in the coordinate system of the grid
+            'output_folder' -- an optional folder in which to store the discrete and distance rasters of each threshold; rasters are not written if no folder is given
+            'output_name' -- the prefix of the output raster names (e.g., 'SouthwestAlaska_Moose_Calving_Calf')
+            'significance_value' -- the significance value of non-significant cells, which are assigned the neutral discrete state
+            'buffer_distance' -- the distance in map units by which the convex hull of each point set is buffered to define its zone
+            'threads' -- the number of threads for the distance transform; defaults to the cores of the compute budget
+    Returned Value: Returns a data frame with the number of selected cells and the status of each threshold and a data frame with the point set, point number, threshold, distance to habitat ('distance'), and zonal mean distance ('mean') of each validation point and threshold
+    Preconditions: the discrete habitat of each threshold matches convert_to_discrete with that threshold for continuous values and with significance_value for significance values, and distances match calculate_raw_distance; distances and zonal means are NaN for thresholds that select no cells
+    """
+
+    # Import packages
+    import datetime
+    import numpy as np
+    import os
+    import pandas as pd
+    import time
+    from package_GeospatialProcessing import buffer_convex_polygon
+    from package_GeospatialProcessing import calculate_convex_hull
+    from package_GeospatialProcessing import define_polygon_edges
+    from package_GeospatialProcessing import define_zone_window
+    from package_GeospatialProcessing import euclidean_distance_transform
+    from package_GeospatialProcessing import rasterize_polygon_block
+    from package_GeospatialProcessing import read_raster_array
+    from package_GeospatialProcessing import write_raster_array
+
+    # Sort thresholds so that the selected cells of each threshold contain the selected cells of the next
+    thresholds = sorted(set(float(threshold) for threshold in thresholds))
+    if validation_points is None:
+        validation_points = {}
+
+    # Read the rasters once and classify cells by the number of thresholds they exceed
+    print(f'\tReading rasters and classifying selection for {len(thresholds)} thresholds...')
+    iteration_start = time.time()
+    study_array, study_mask, study_profile = read_raster_array(study_area)
+    del study_array
+    continuous_array, continuous_mask, continuous_profile = read_raster_array(continuous_raster)
+    significance_array, significance_mask, significance_profile = read_raster_array(significance_raster)
+    for input_raster, input_profile in [(continuous_raster, continuous_profile),
+                                        (significance_raster, significance_profile)]:
+        if ((input_profile['height'], input_profile['width']) != study_mask.shape
+                or not input_profile['transform'].almost_equals(study_profile['transform'])):
+            raise ValueError(f'{input_raster} must have the same extent and cell size as the study area raster.')
+    selection_levels = define_selection_levels(continuous_array, significance_array, thresholds, significance_value)
+    # Keep cells inside the study area that have a significance value and, unless neutral, a continuous value
+    data_mask = study_mask & significance_mask & ((selection_levels < 0) | continuous_mask)
+    del continuous_array, continuous_mask, significance_array, significance_mask
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Locate the cells of each point set and burn its zone once for all thresholds
+    grid_transform = study_profile['transform']
+    row_count, column_count = study_mask.shape
+    point_locations = {}
+    for point_set, (x, y) in validation_points.items():
+        x = np.asarray(x, dtype='float64')
+        y = np.asarray(y, dtype='float64')
+        columns = np.floor((x - grid_transform.c) / grid_transform.a)
+        rows = np.floor((y - grid_transform.f) / grid_transform.e)
+        points = np.flatnonzero((rows >= 0) & (rows < row_count) & (columns >= 0) & (columns < column_count))
+        rows = rows[points].astype('int64')
+        columns = columns[points].astype('int64')
+        zone_rings = [buffer_convex_polygon(calculate_convex_hull(x, y), buffer_distance)]
+        zone_window = define_zone_window(zone_rings, grid_transform, column_count, row_count)
+        zone_mask = rasterize_polygon_block(define_polygon_edges([zone_rings]), grid_transform, zone_window)
+        row_slice, column_slice = zone_window.toslices()
+        zone_mask &= study_mask[row_slice, column_slice]
+        # Points take the zonal mean only where their cell is in the zone, as when the zonal raster is sampled
+        in_zone = ((rows >= zone_window.row_off) & (rows < zone_window.row_off + zone_window.height)
+                   & (columns >= zone_window.col_off) & (columns < zone_window.col_off + zone_window.width))
+        in_zone[in_zone] = zone_mask[rows[in_zone] - int(zone_window.row_off), columns[in_zone] - int(zone_window.col_off)]
+        point_locations[point_set] = {'count': len(x),
+                                      'points': points,
+                                      'rows': rows,
+                                      'columns': columns,
+                                      'in_zone': in_zone,
+                                      'zone_slices': (row_slice, column_slice),
+                                      'zone_mask': zone_mask}
+
+    # Calculate discrete habitat and distance to habitat for each threshold
+    if output_folder is not None:
+        os.makedirs(output_folder, exist_ok=True)
+    cell_size = abs(grid_transform.a)
+    threshold_results = []
+    point_results = []
+    distance_array = None
+    previous_cells = None
+    for number, threshold in enumerate(thresholds):
+        print(f'\tCalculating distance to habitat for threshold {threshold:g} ({number + 1} of {len(thresholds)})...')
+        iteration_start = time.time()
+        target_mask = data_mask & (selection_levels > number)
+        selected_cells = int(target_mask.sum())
+        # Reuse the distances of the previous threshold when the nested selection did not change
+        if selected_cells == 0:
+            distance_array = np.full(target_mask.shape, np.nan)
+            status = 'no selection'
+        elif selected_cells == previous_cells:
+            status = 'reused'
+        else:
+            distance_array = euclidean_distance_transform(target_mask, cell_size=cell_size, threads=threads)
+            status = 'calculated'
+        previous_cells = selected_cells
+        del target_mask
+
+        # Write the discrete and distance rasters of the threshold
+        if output_folder is not None:
+            threshold_label = f'{threshold:g}'.replace('-', 'm').replace('.', 'p')
+            discrete_array = np.where(selection_levels < 0, 0, np.where(selection_levels > number, 1, -1))
+            write_raster_array(os.path.join(output_folder, f'{output_name}_Discrete_{threshold_label}.tif'),
+                               np.where(data_mask, discrete_array, -128),
+                               study_profile,
+                               'int8',
+                               -128)
+            del discrete_array
+            write_raster_array(os.path.join(output_folder, f'{output_name}_Distance_{threshold_label}.tif'),
+                               np.where(study_mask & np.isfinite(distance_array), distance_array, -32768),
+                               study_profile,
+                               'float32',
+                               -32768)
+
+        # Sample the distances at the points and the zonal mean of each point set
+        for point_set, point_location in point_locations.items():
+            row_slice, column_slice = point_location['zone_slices']
+            zone_distances = distance_array[row_slice, column_slice][point_location['zone_mask']]
+            zonal_mean = zone_distances.mean(dtype='float64') if zone_distances.size > 0 else np.nan
+            point_distances = np.full(point_location['count'], np.nan)
+            point_distances[point_location['points']] = distance_array[point_location['rows'],
+                                                                       point_location['columns']]
+            point_distances[point_location['points'][~study_mask[point_location['rows'],
+                                                                 point_location['columns']]]] = np.nan
+            point_means = np.full(point_location['count'], np.nan)
+            point_means[point_location['points'][point_location['in_zone']]] = zonal_mean
+            point_results.append(pd.DataFrame({'points': point_set,
+                                               'point': np.arange(point_location['count']),
+                                               'threshold': threshold,
+                                               'distance': point_distances,
+                                               'mean': point_means}))
+        threshold_results.append([threshold, selected_cells, status])
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(f'\tSelected {selected_cells} cells ({status}).')
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+    # Combine the results of all thresholds
+    threshold_table = pd.DataFrame(threshold_results, columns=['threshold', 'selected_cells', 'status'])
+    if len(point_results) > 0:
+        point_table = pd.concat(point_results, ignore_index=True)
+    else:
+        point_table = pd.DataFrame(columns=['points', 'point', 'threshold', 'distance', 'mean'])
+
+    return threshold_table, point_table
+
+# Define a function to summarize proximal accuracy by threshold
+def summarize_proximal_accuracy(validation_table):
+    """
+    Description: summarizes the proximal accuracy of validation points relative to the zonal mean distance to habitat for each point set, threshold, and calf status
+    Inputs: 'validation_table' -- a data frame with the columns points, threshold, calfStatus, distance_calf, distance_nocalf, mean_calf, and mean_nocalf
+    Returned Value: Returns a data frame with the sample size, the mean sample and zonal distances, and the accuracy of each point set, threshold, and calf status
+    Preconditions: rows with missing values are dropped; accuracy is the zonal mean distance minus the sample mean distance divided by the zonal mean distance for the habitat of the calf status, as in the proximal accuracy script
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Summarize the points with values by point set, threshold, and calf status
+    summary_fields = ['calfStatus', 'distance_calf', 'distance_nocalf', 'mean_calf', 'mean_nocalf']
+    accuracy_table = (validation_table[['points', 'threshold'] + summary_fields]
+                      .dropna()
+                      .groupby(['points', 'threshold', 'calfStatus'])
+                      .agg(sample_n=('distance_calf', 'size'),
+                           sample_calf=('distance_calf', 'mean'),
+                           sample_nocalf=('distance_nocalf', 'mean'),
+                           mean_calf=('mean_calf', 'mean'),
+                           mean_nocalf=('mean_nocalf', 'mean'))
+                      .reset_index())
+
+    # Calculate accuracy relative to the habitat of each calf status
+    accuracy_table['accuracy'] = np.select(
+        [accuracy_table['calfStatus'] == 1, accuracy_table['calfStatus'] == 0],
+        [(accuracy_table['mean_calf'] - accuracy_table['sample_calf']) / accuracy_table['mean_calf'],
+         (accuracy_table['mean_nocalf'] - accuracy_table['sample_nocalf']) / accuracy_table['mean_nocalf']],
+        0)
+
+    return accuracy_table
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Initialization for Paths Module
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Python functions must be executed in an Anaconda Python 3.8+ distribution. R functions are sourced through init.R.
+# Description: This initialization file imports modules in the package so that the contents are accessible.
+# ---------------------------------------------------------------------------
+
+# Import functions from modules
+from package_Paths.simulateRandomPaths import load_path_distributions
+from package_Paths.simulateRandomPaths import simulate_moose_year
+from package_Paths.simulateRandomPaths import simulate_path_table
+from package_Paths.simulateRandomPaths import simulate_random_paths
+from package_Paths.summarizePathCovariates import select_random_paths
+from package_Paths.summarizePathCovariates import sum_path_covariate
+from package_Paths.summarizePathCovariates import summarize_path_covariates
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Simulate random paths
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with numpy, pandas, and pyarrow 13+ installed.
+# Description: "Simulate random paths" is a set of functions that generate random movement paths for each moose-year from random start points and empirical distributions of bearings and step lengths. All bearings and step lengths of all paths of a moose-year are drawn at once and the coordinates are built with cumulative sums. Moose-years are simulated in parallel processes. The paths are written to a csv table one moose-year at a time. The functions are a Python implementation of createRandomPaths in the R toolchain.
+# ---------------------------------------------------------------------------
+
+# Define distributions shared by the simulation processes
+path_distributions = {}
+
+# Define a function to store the distributions in a simulation process
+def load_path_distributions(distributions):
+    """
+    Description: stores the bearing and step length distributions for the simulation of moose-years in the current process
+    Inputs: 'distributions' -- a dictionary of numpy arrays of bearings in radians ('angles') and step lengths in meters for cows without ('distCalf0') and with calves ('distCalf1')
+    Returned Value: None
+    Preconditions: called as the initializer of each simulation process so that the distributions are copied once per process instead of once per moose-year
+    """
+
+    # Store distributions
+    path_distributions.clear()
+    path_distributions.update(distributions)
+
+# Define a function to simulate the paths of a moose-year
+def simulate_moose_year(start_x, start_y, path_length, calf_status, seed):
+    """
+    Description: simulates random paths from a set of start points with bearings and step lengths drawn from the stored distributions
+    Inputs: 'start_x' -- an array of the x coordinates of the start point of each path
+            'start_y' -- an array of the y coordinates of the start point of each path
+            'path_length' -- the number of points in each path, including the start point
+            'calf_status' -- 1 to draw step lengths for cows with calves and 0 to draw step lengths for cows without calves
+            'seed' -- a seed or numpy SeedSequence for the random number generator of the moose-year
+    Returned Value: Returns arrays of x and y coordinates with one row per path and one column per point
+    Preconditions: distributions must be stored with load_path_distributions; bearings are measured clockwise from north, so x uses the sine and y the cosine of the bearing
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Draw all bearings and step lengths of all paths at once
+    generator = np.random.default_rng(seed)
+    angles = path_distributions['angles']
+    distances = path_distributions[f'distCalf{calf_status}']
+    step_shape = (len(start_x), path_length - 1)
+    bearings = angles[generator.integers(0, len(angles), step_shape)]
+    step_lengths = distances[generator.integers(0, len(distances), step_shape)]
+
+    # Build the coordinates of each path from the cumulative sum of its steps
+    x = np.empty((len(start_x), path_length))
+    y = np.empty((len(start_y), path_length))
+    x[:, 0] = start_x
+    y[:, 0] = start_y
+    x[:, 1:] = start_x[:, np.newaxis] + np.cumsum(step_lengths * np.sin(bearings), axis=1)
+    y[:, 1:] = start_y[:, np.newaxis] + np.cumsum(step_lengths * np.cos(bearings), axis=1)
+
+    return x, y
+
+# Define a function to simulate the paths of a moose-year as rows of a csv table
+def simulate_path_table(moose_year_id, deployment_id, start_x, start_y, path_length, calf_status, seed):
+    """
+    Description: simulates the random paths of a moose-year and formats their points as rows of allPaths.csv
+    Inputs: 'moose_year_id' -- the id of the moose-year
+            'deployment_id' -- the deployment id of the moose
+            'start_x' -- an array of the x coordinates of the start point of each path
+            'start_y' -- an array of the y coordinates of the start point of each path
+            'path_length' -- the number of points in each path, including the start point
+            'calf_status' -- 1 for cows with calves and 0 for cows without calves
+            'seed' -- a seed or numpy SeedSequence for the random number generator of the moose-year
+    Returned Value: Returns the number of path points and the utf-8 encoded csv rows without a header
+    Preconditions: the rows are formatted in the simulation process so that formatting runs in parallel
+    """
+
+    # Import packages
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # Simulate paths
+    path_x, path_y = simulate_moose_year(start_x, start_y, path_length, calf_status, seed)
+
+    # Create a table of path points ordered by path and point
+    path_count = path_x.shape[0]
+    path_id = np.repeat(np.arange(1, path_count + 1), path_length)
+    point_id = np.tile(np.arange(1, path_length + 1), path_count)
+    path_table = pd.DataFrame({'mooseYear_id': moose_year_id,
+                               'pointID': point_id,
+                               'x': path_x.ravel(),
+                               'y': path_y.ravel(),
+                               'calfStatus': calf_status,
+                               'response': 0,
+                               'deployment_id': deployment_id,
+                               'pathID': path_id})
+    path_table['fullPath_id'] = f'{moose_year_id}-' + path_table['pathID'].astype(str)
+    path_table['fullPoint_id'] = path_table['fullPath_id'] + '-' + path_table['pointID'].astype(str)
+
+    # Format rows with the arrow csv writer, which is several times faster than pandas for floating point values and raises an error instead of quoting ids that contain separators
+    output_buffer = pa.BufferOutputStream()
+    pa_csv.write_csv(pa.Table.from_pandas(path_table, preserve_index=False),
+                     output_buffer,
+                     pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+
+    return len(path_table), output_buffer.getvalue().to_pybytes()
+
+# Define a function to simulate random paths for all moose-years
+def simulate_random_paths(start_points, path_info, distributions, output_csv, observed_paths=None, seed=None,
+                          workers=None):
+    """
+    Description: simulates random paths for each moose-year with start points sampled without replacement
+    Inputs: 'start_points' -- a data frame of random start points with deployment_id, POINT_X, and POINT_Y fields
+            'path_info' -- a data frame with one row per moose-year and the fields mooseYear_id, deployment_id, calfStatus, length (the number of points in the observed path), and numberOfPaths
+            'distributions' -- a dictionary of numpy arrays of bearings in radians ('angles') and step lengths in meters for cows without ('distCalf0') and with calves ('distCalf1')
+            'output_csv' -- a csv file in which to store the points of the observed and random paths
+            'observed_paths' -- an optional data frame of observed path points with the fields of allPaths.csv that is written before the random paths
+            'seed' -- an optional seed so that the start points and paths are reproducible
+            'workers' -- an optional number of simulation processes; defaults to the cores of the compute budget
+    Returned Value: Returns the number of random path points written to a csv file with the fields mooseYear_id, pointID, x, y, calfStatus, response, deployment_id, pathID, fullPath_id, and fullPoint_id of allPaths.csv
+    Preconditions: a start point used by one path is not used by another path, including paths of other moose-years of the same deployment; the random paths of each moose-year are formatted in the simulation processes and written in moose-year order so that memory use does not grow with the number of moose-years
+    """
+
+    # Import packages
+    import concurrent.futures
+    import numpy as np
+    import pandas as pd
+    from package_Pipeline import read_compute_budget
+
+    # Define number of workers
+    if workers is None:
+        workers = read_compute_budget()['cores']
+
+    # Sample start points without replacement in moose-year order from a random permutation of the points of each deployment
+    seed_sequence = np.random.SeedSequence(seed)
+    start_generator = np.random.default_rng(seed_sequence.spawn(1)[0])
+    point_pools = {}
+    for deployment_id, deployment_points in start_points.groupby('deployment_id', sort=False):
+        permutation = start_generator.permutation(len(deployment_points))
+        point_pools[deployment_id] = [deployment_points['POINT_X'].to_numpy()[permutation],
+                                      deployment_points['POINT_Y'].to_numpy()[permutation],
+                                      0]
+    simulation_list = []
+    for moose_year, year_seed in zip(path_info.itertuples(index=False), seed_sequence.spawn(len(path_info))):
+        if moose_year.deployment_id not in point_pools:
+            raise ValueError(f'No start points exist for deployment {moose_year.deployment_id}.')
+        pool_x, pool_y, pool_start = point_pools[moose_year.deployment_id]
+        pool_end = pool_start + moose_year.numberOfPaths
+        if pool_end > len(pool_x):
+            raise ValueError(f'Deployment {moose_year.deployment_id} has too few remaining start points for '
+                             f'{moose_year.numberOfPaths} paths of {moose_year.mooseYear_id}.')
+        point_pools[moose_year.deployment_id][2] = pool_end
+        simulation_list.append((moose_year.mooseYear_id, moose_year.deployment_id,
+                                pool_x[pool_start:pool_end], pool_y[pool_start:pool_end],
+                                int(moose_year.length), int(moose_year.calfStatus), year_seed))
+
+    # Write the observed paths first so that the table has the row order of allPaths.csv
+    path_fields = ['mooseYear_id', 'pointID', 'x', 'y', 'calfStatus', 'response', 'deployment_id', 'pathID',
+                   'fullPath_id', 'fullPoint_id']
+    header_table = pd.DataFrame(columns=path_fields)
+    if observed_paths is not None:
+        header_table = observed_paths[path_fields]
+    header_table.to_csv(output_csv, header=True, index=False, sep=',', encoding='utf-8')
+
+    # Simulate moose-years in parallel processes that each receive the distributions once and append them in order
+    point_count = 0
+    with open(output_csv, 'ab') as output_writer:
+        if workers > 1 and len(simulation_list) > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                        initializer=load_path_distributions,
+                                                        initargs=(distributions,)) as executor:
+                simulation_futures = [executor.submit(simulate_path_table, *simulation)
+                                      for simulation in simulation_list]
+                for simulation_future in simulation_futures:
+                    path_points, path_text = simulation_future.result()
+                    output_writer.write(path_text)
+                    point_count += path_points
+        else:
+            load_path_distributions(distributions)
+            for simulation in simulation_list:
+                path_points, path_text = simulate_path_table(*simulation)
+                output_writer.write(path_text)
+                point_count += path_points
+
+    return point_count
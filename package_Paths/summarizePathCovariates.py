@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Summarize path covariates
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with numpy, pandas, and rasterio installed.
+# Description: "Summarize path covariates" is a set of functions that sample covariate rasters at the points of the observed and random paths, exclude paths and points with the lake and no data rules of summarizeByPath, reduce the covariates to the mean of each path with group sums over path numbers, and select a set of random paths for each moose-year. The functions are a Python implementation of extractCovariates and summarizeByPath in the R toolchain.
+# ---------------------------------------------------------------------------
+
+# Define a function to sample a covariate raster and sum its values for each path
+def sum_path_covariate(input_raster, x, y, path_codes, path_count, point_weights, cell_cache):
+    """
+    Description: samples a covariate raster at the path points and sums the values and no data points of each path
+    Inputs: 'input_raster' -- path to a covariate raster
+            'x' -- an array of the x coordinates of the path points
+            'y' -- an array of the y coordinates of the path points
+            'path_codes' -- an array of the path number of each point
+            'path_count' -- the number of paths
+            'point_weights' -- an array that is 1 for points included in the path means and 0 for excluded points
+            'cell_cache' -- a dictionary in which the point cells of each raster grid are stored
+    Returned Value: Returns arrays of the sum of included values and the number of no data points of each path
+    Preconditions: points with no data are counted for all points, including points excluded from the means
+    """
+
+    # Import packages
+    import numpy as np
+    from package_GeospatialProcessing import sample_raster_points
+
+    # Sample raster values and sum them by path
+    point_values = sample_raster_points(input_raster, x, y, cell_cache=cell_cache)
+    is_missing = np.isnan(point_values)
+    missing_count = np.bincount(path_codes, weights=is_missing, minlength=path_count)
+    value_sum = np.bincount(path_codes, weights=np.where(is_missing, 0, point_values) * point_weights,
+                            minlength=path_count)
+
+    return value_sum, missing_count
+
+# Define a function to summarize covariates for each path
+def summarize_path_covariates(path_table, covariate_rasters, lake_raster, lake_limit=7, outside_value=128,
+                              threads=None):
+    """
+    Description: calculates the mean of each covariate for each path after excluding paths outside the study area, paths with no data, random paths with too many points in lakes, and points in lakes
+    Inputs: 'path_table' -- a data frame of path points with mooseYear_id, fullPath_id, x, y, calfStatus, and response fields
+            'covariate_rasters' -- a dictionary of covariate raster paths keyed by covariate name in output order
+            'lake_raster' -- path to the lake raster with 1 for lake, 0 for land, and the outside value beyond the study area
+            'lake_limit' -- the maximum number of lake points in a random path
+            'outside_value' -- the lake value of points outside the study area
+            'threads' -- the number of threads that sample rasters; defaults to the cores of the compute budget
+    Returned Value: Returns a data frame with one row per path sorted by mooseYear_id and fullPath_id and the fields mooseYear_id, fullPath_id, calfStatus, response, and the mean of each covariate with the suffix '_mean'
+    Preconditions: path coordinates must be in the coordinate system of the rasters; calfStatus and response must be constant within a path; a path is excluded when any of its points has no data in any raster, as in summarizeByPath
+    """
+
+    # Import packages
+    import concurrent.futures
+    import numpy as np
+    import pandas as pd
+    from package_GeospatialProcessing import sample_raster_points
+    from package_Pipeline import read_compute_budget
+
+    # Define number of threads
+    if threads is None:
+        threads = read_compute_budget()['cores']
+
+    # Number the paths in sorted order so that the path means are grouped with index sums
+    path_ids = path_table['fullPath_id'].to_numpy()
+    path_codes, path_names = pd.factorize(path_ids, sort=True)
+    path_count = len(path_names)
+    x = path_table['x'].to_numpy(dtype='float64')
+    y = path_table['y'].to_numpy(dtype='float64')
+
+    # Sample the lake raster first so that its point cells are cached for the covariates on the same grid
+    cell_cache = {}
+    lake_values = sample_raster_points(lake_raster, x, y, cell_cache=cell_cache)
+    is_random = path_table['response'].to_numpy() == 0
+    is_lake = lake_values == 1
+    lake_sum = np.bincount(path_codes, weights=is_lake & is_random, minlength=path_count)
+    exclude_path = ((np.bincount(path_codes, weights=np.isnan(lake_values), minlength=path_count) > 0)
+                    | (np.bincount(path_codes, weights=lake_values == outside_value, minlength=path_count) > 0)
+                    | (lake_sum > lake_limit))
+    point_weights = (lake_values == 0).astype('float64')
+    point_count = np.bincount(path_codes, weights=point_weights, minlength=path_count)
+
+    # Sum the included values and no data points of each covariate for each path
+    covariate_names = list(covariate_rasters)
+    if threads > 1 and len(covariate_names) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            covariate_sums = list(executor.map(lambda raster: sum_path_covariate(raster, x, y, path_codes, path_count,
+                                                                                 point_weights, cell_cache),
+                                               covariate_rasters.values()))
+    else:
+        covariate_sums = [sum_path_covariate(raster, x, y, path_codes, path_count, point_weights, cell_cache)
+                          for raster in covariate_rasters.values()]
+    for value_sum, missing_count in covariate_sums:
+        exclude_path |= missing_count > 0
+
+    # Exclude paths that have no remaining points after lake points are removed
+    exclude_path |= point_count == 0
+
+    # Calculate the mean of each covariate for the included paths
+    path_numbers = np.flatnonzero(~exclude_path)
+    first_points = np.full(path_count, len(path_codes))
+    np.minimum.at(first_points, path_codes, np.arange(len(path_codes)))
+    path_means = pd.DataFrame({'mooseYear_id': path_table['mooseYear_id'].to_numpy()[first_points[path_numbers]],
+                               'fullPath_id': path_names[path_numbers]})
+    for field in ['calfStatus', 'response']:
+        path_means[field] = path_table[field].to_numpy()[first_points[path_numbers]]
+    for covariate, (value_sum, missing_count) in zip(covariate_names, covariate_sums):
+        path_means[f'{covariate}_mean'] = value_sum[path_numbers] / point_count[path_numbers]
+
+    # Sort paths by moose-year and path
+    path_means = path_means.sort_values(['mooseYear_id', 'fullPath_id'], kind='stable', ignore_index=True)
+
+    return path_means
+
+# Define a function to select random paths for each moose-year
+def select_random_paths(path_means, number_paths=500, group_size=10, observed_iteration=99, seed=None):
+    """
+    Description: selects a random sample of random paths for each moose-year and assigns them to iterations
+    Inputs: 'path_means' -- a data frame of path means with mooseYear_id and response fields
+            'number_paths' -- the number of random paths selected for each moose-year
+            'group_size' -- the number of random paths of a moose-year in each iteration
+            'observed_iteration' -- the iteration id of the observed paths
+            'seed' -- an optional seed so that the selection is reproducible
+    Returned Value: Returns a data frame of the observed paths followed by the selected random paths of each moose-year with an iteration_id field
+    Preconditions: every moose-year must have at least the number of random paths that are selected
+    """
+
+    # Import packages
+    import numpy as np
+    import pandas as pd
+
+    # Rank the random paths of each moose-year in a random order
+    generator = np.random.default_rng(seed)
+    random_paths = path_means[path_means['response'] == 0].copy()
+    random_paths['random_key'] = generator.random(len(random_paths))
+    random_paths = random_paths.sort_values(['mooseYear_id', 'random_key'], kind='stable')
+    path_rank = random_paths.groupby('mooseYear_id', sort=False).cumcount().to_numpy()
+
+    # Check that every moose-year has enough random paths
+    path_counts = random_paths.groupby('mooseYear_id', sort=False).size()
+    path_counts = path_counts.reindex(path_means['mooseYear_id'].unique(), fill_value=0)
+    if (path_counts < number_paths).any():
+        short_years = ', '.join(path_counts[path_counts < number_paths].index.astype(str))
+        raise ValueError(f'Moose-years {short_years} have fewer than {number_paths} random paths.')
+
+    # Select the first ranked paths and assign them to iterations
+    random_paths = random_paths[path_rank < number_paths].drop(columns='random_key')
+    random_paths['iteration_id'] = path_rank[path_rank < number_paths] // group_size
+    observed_paths = path_means[path_means['response'] == 1].copy()
+    observed_paths['iteration_id'] = observed_iteration
+
+    return pd.concat([observed_paths, random_paths], ignore_index=True)
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Initialization for Pipeline Module
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Functions can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation.
+# Description: This initialization file imports modules in the package so that the contents are accessible.
+# ---------------------------------------------------------------------------
+
+# Import functions from modules
+from package_Pipeline.definePipelineStage import define_pipeline_stage
+from package_Pipeline.executePipelineStage import execute_pipeline_stage
+from package_Pipeline.readComputeBudget import read_compute_budget
+from package_Pipeline.readPipelineParameter import read_pipeline_parameter
+from package_Pipeline.runPipeline import run_pipeline
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Define pipeline stage
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation.
+# Description: "Define pipeline stage" is a function that declares a numbered script as a pipeline stage with its inputs, outputs, parameters, interpreter, and optional peak memory.
+# ---------------------------------------------------------------------------
+
+# Define a function to declare a pipeline stage
+def define_pipeline_stage(name, script, inputs, outputs, parameters=None, interpreter=None, intermediates=None,
+                          resources=None, memory_mb=None):
+    """
+    Description: declares a script as a pipeline stage
+    Inputs: 'name' -- a unique name for the stage
+            'script' -- path to the python script that the stage executes
+            'inputs' -- a list of files, folders, or geodatabase datasets that the script reads
+            'outputs' -- a list of files or folders that the script writes
+            'parameters' -- an optional dictionary of parameters passed to the script and read with read_pipeline_parameter
+            'interpreter' -- an optional path to the python executable for the script (e.g., the ArcGIS Pro python); defaults to the current python
+            'intermediates' -- an optional list of glob patterns for intermediate files that must be removed before the stage is rerun
+            'resources' -- an optional list of names for shared resources (e.g., a folder in which intermediate files with fixed names are written); stages that share a resource are not run concurrently
+            'memory_mb' -- an optional peak memory in megabytes that the stage requires (e.g., for stages that hold whole grids in memory); the stage is only started when that much of the memory budget is not reserved by running stages
+    Returned Value: Returns a dictionary describing the stage
+    Preconditions: outputs must not be stored in a file geodatabase because they are removed as files or folders before a stage is rerun
+    """
+
+    # Import packages
+    import os
+    import sys
+
+    # Check that the script exists
+    if not os.path.isfile(script):
+        raise ValueError(f'Script for stage {name} does not exist: {script}')
+
+    # Check that outputs are not stored in a geodatabase
+    for output_data in outputs:
+        output_parts = os.path.normpath(output_data).lower().split(os.sep)
+        if any(part.endswith('.gdb') for part in output_parts[:-1]):
+            raise ValueError(f'Output for stage {name} is stored in a geodatabase: {output_data}')
+
+    # Define stage
+    stage = {'name': name,
+             'script': os.path.abspath(script),
+             'inputs': [os.path.normpath(input_data) for input_data in inputs],
+             'outputs': [os.path.normpath(output_data) for output_data in outputs],
+             'parameters': dict(parameters) if parameters is not None else {},
+             'interpreter': interpreter if interpreter is not None else sys.executable,
+             'intermediates': list(intermediates) if intermediates is not None else [],
+             'resources': list(resources) if resources is not None else [],
+             'memory_mb': int(memory_mb) if memory_mb is not None else None}
+
+    return stage
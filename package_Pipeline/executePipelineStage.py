@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Execute pipeline stage
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation.
+# Description: "Execute pipeline stage" is a function that runs the script of a pipeline stage in its interpreter with the stage parameters and compute budget and writes the script messages to a log file.
+# ---------------------------------------------------------------------------
+
+# Define a function to execute a pipeline stage
+def execute_pipeline_stage(stage, log_file, budget=None):
+    """
+    Description: runs the script of a pipeline stage as a separate process
+    Inputs: 'stage' -- a stage defined by define_pipeline_stage
+            'log_file' -- a text file in which to store the messages and errors of the script
+            'budget' -- an optional dictionary with the number of cores ('cores') and memory in megabytes ('memory_mb') allocated to the script and read with read_compute_budget
+    Returned Value: Returns the exit code of the script and the elapsed seconds
+    Preconditions: the interpreter of the stage must be able to import the repository packages
+    """
+
+    # Import packages
+    import json
+    import os
+    import subprocess
+    import time
+
+    # Define the repository folder so that scripts can import the repository packages
+    repository_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # Pass parameters and the repository folder to the script environment
+    environment = dict(os.environ)
+    environment['PIPELINE_PARAMETERS'] = json.dumps(stage['parameters'])
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [repository_folder] + [path for path in [os.environ.get('PYTHONPATH')] if path])
+    environment['PYTHONUNBUFFERED'] = '1'
+    if budget is not None:
+        environment['COMPUTE_BUDGET'] = json.dumps({'cores': budget['cores'],
+                                                    'memory_mb': budget['memory_mb'],
+                                                    'source': f'stage {stage["name"]}'})
+
+    # Create outputs folders if they do not already exist
+    for output_data in stage['outputs']:
+        output_folder = os.path.dirname(output_data)
+        if output_folder and not os.path.exists(output_folder):
+            os.makedirs(output_folder)
+
+    # Run script and write messages to log
+    start_time = time.time()
+    with open(log_file, 'w', encoding='utf-8') as log_writer:
+        if budget is not None:
+            memory_text = f'{budget["memory_mb"]} MB' if budget['memory_mb'] is not None else 'unknown memory'
+            log_writer.write(f'Compute budget: {budget["cores"]} core(s) and {memory_text}\n')
+            log_writer.write('----------\n')
+            log_writer.flush()
+        process = subprocess.run([stage['interpreter'], stage['script']],
+                                 cwd=repository_folder,
+                                 env=environment,
+                                 stdout=log_writer,
+                                 stderr=subprocess.STDOUT)
+    elapsed_time = time.time() - start_time
+
+    return process.returncode, elapsed_time
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read compute budget
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation. Physical memory is read with psutil if it is installed.
+# Description: "Read compute budget" is a function that reads the number of cores and the memory allocated to a script by the pipeline runner or a batch executor and falls back to the cores and physical memory of the machine when the script is run by hand.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a compute budget
+def read_compute_budget():
+    """
+    Description: reads the compute budget from the COMPUTE_BUDGET environment variable
+    Inputs: None
+    Returned Value: Returns a dictionary with the number of cores ('cores'), the memory in megabytes ('memory_mb') that is None if the physical memory cannot be determined, and the source of the budget ('source')
+    Preconditions: the pipeline runner and the batch executor store budgets as a json object in the COMPUTE_BUDGET environment variable
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Read the budget allocated by the pipeline runner or a batch executor
+    if 'COMPUTE_BUDGET' in os.environ:
+        budget = json.loads(os.environ['COMPUTE_BUDGET'])
+        return {'cores': max(1, int(budget['cores'])),
+                'memory_mb': budget.get('memory_mb'),
+                'source': budget.get('source', 'allocated')}
+
+    # Otherwise read the physical memory of the machine
+    try:
+        import psutil
+        memory_mb = int(psutil.virtual_memory().total / 1024 ** 2)
+    except ImportError:
+        try:
+            memory_mb = int(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024 ** 2)
+        except (AttributeError, ValueError, OSError):
+            memory_mb = None
+
+    return {'cores': os.cpu_count() or 1,
+            'memory_mb': memory_mb,
+            'source': 'machine'}
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read pipeline parameter
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation.
+# Description: "Read pipeline parameter" is a function that reads a parameter passed to a script by the pipeline runner and falls back to a default when the script is run by hand.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a pipeline parameter
+def read_pipeline_parameter(name, default):
+    """
+    Description: reads a parameter from the PIPELINE_PARAMETERS environment variable
+    Inputs: 'name' -- the name of the parameter
+            'default' -- the value to return when the script is not run by the pipeline or the parameter is not set
+    Returned Value: Returns the parameter value
+    Preconditions: the pipeline runner stores parameters as a json object in the PIPELINE_PARAMETERS environment variable
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Read parameters passed by the pipeline runner
+    parameters = json.loads(os.environ.get('PIPELINE_PARAMETERS', '{}'))
+
+    return parameters.get(name, default)
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Run pipeline
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an ArcGIS Pro Python 3.6+ or Anaconda Python 3.8+ installation.
+# Description: "Run pipeline" is a function that orders pipeline stages by their declared inputs and outputs, reruns only the stages for which the script, a parameter, or the content of an input changed or an output is missing, and runs independent stages concurrently unless they share a resource or their declared memory does not fit in the memory that running stages have not reserved. Each running stage receives a share of the cores and memory of the machine that is passed to the script as a compute budget.
+# ---------------------------------------------------------------------------
+
+# Define a function to run a pipeline of stages
+def run_pipeline(stages, state_file, log_folder, max_workers=2, dry_run=False, force_stages=None, cores=None,
+                 memory_mb=None):
+    """
+    Description: runs the stages of a pipeline that are out of date in dependency order
+    Inputs: 'stages' -- a list of stages defined by define_pipeline_stage
+            'state_file' -- a json file in which to store the script, parameter, and input hashes of completed stages
+            'log_folder' -- a folder in which to store a log file for each stage
+            'max_workers' -- the maximum number of stages to run concurrently
+            'dry_run' -- boolean input to control if the function only prints the plan without running any stage
+            'force_stages' -- an optional list of stage names to rerun regardless of their state
+            'cores' -- an optional number of cores to divide among running stages; defaults to the compute budget of the runner
+            'memory_mb' -- an optional memory in megabytes to divide among running stages; defaults to the compute budget of the runner
+    Returned Value: Returns a dictionary of the status of each stage ('run', 'skip', 'failed', or 'blocked'; or 'run' and 'skip' for a dry run)
+    Preconditions: stages must be defined by define_pipeline_stage; the outputs of a stage that is out of date are removed before the stage is rerun; cores released by a finished stage are allocated to the next stages that start, not to stages that are already running, and stages are delayed while no core is free; stages that declare memory are started only when it is not reserved by other running stages that declare memory, and a stage that declares more than the whole budget runs alone with no other stage started until it finishes; the reasons to rerun a stage are determined once when its upstream stages have finished
+    """
+
+    # Import packages
+    import concurrent.futures
+    import datetime
+    import glob
+    import hashlib
+    import json
+    import os
+    import shutil
+    import time
+    from package_GeospatialProcessing import hash_dataset
+    from package_Pipeline import execute_pipeline_stage
+    from package_Pipeline import read_compute_budget
+
+    # Define a function to test if a path is equal to or contained in another path
+    def is_within(path, container):
+        path = os.path.normcase(os.path.abspath(path))
+        container = os.path.normcase(os.path.abspath(container))
+        return path == container or path.startswith(container.rstrip(os.sep) + os.sep)
+
+    # Define a function to hash the parameters of a stage
+    def hash_parameters(parameters):
+        return hashlib.sha256(json.dumps(parameters, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    # Define a function to remove outputs of a stage before it is rerun
+    def remove_outputs(stage):
+        for output_data in stage['outputs']:
+            if os.path.isdir(output_data):
+                shutil.rmtree(output_data)
+            else:
+                # Remove files and sidecar files (e.g., .aux.xml, .ovr, and shapefile components)
+                removal_list = glob.glob(glob.escape(output_data)) + glob.glob(glob.escape(output_data) + '.*')
+                if output_data.lower().endswith('.shp'):
+                    removal_list = removal_list + glob.glob(glob.escape(os.path.splitext(output_data)[0]) + '.*')
+                for removal_file in set(removal_list):
+                    if os.path.isfile(removal_file):
+                        os.remove(removal_file)
+        for pattern in stage['intermediates']:
+            for removal_file in glob.glob(pattern):
+                if os.path.isdir(removal_file):
+                    shutil.rmtree(removal_file)
+                else:
+                    os.remove(removal_file)
+
+    # Define a function to write the pipeline state
+    def write_state(state):
+        temporary_file = state_file + '.tmp'
+        with open(temporary_file, 'w', encoding='utf-8') as state_writer:
+            json.dump(state, state_writer, indent=2, sort_keys=True)
+        os.replace(temporary_file, state_file)
+
+    # Check that stage names are unique and that each output is written by a single stage
+    stage_dictionary = {}
+    output_owners = {}
+    for stage in stages:
+        if stage['name'] in stage_dictionary:
+            raise ValueError(f'Stage name {stage["name"]} is defined more than once.')
+        stage_dictionary[stage['name']] = stage
+        for output_data in stage['outputs']:
+            for owner_name, owner_outputs in output_owners.items():
+                for owner_output in owner_outputs:
+                    if is_within(output_data, owner_output) or is_within(owner_output, output_data):
+                        raise ValueError(f'Output {output_data} of stage {stage["name"]} overlaps an output of stage {owner_name}.')
+        output_owners[stage['name']] = stage['outputs']
+
+    # Identify the upstream stages of each stage from the overlap of inputs and outputs
+    upstream = {}
+    for stage in stages:
+        upstream[stage['name']] = set()
+        for input_data in stage['inputs']:
+            for owner_name, owner_outputs in output_owners.items():
+                if owner_name == stage['name']:
+                    continue
+                for owner_output in owner_outputs:
+                    if is_within(input_data, owner_output) or is_within(owner_output, input_data):
+                        upstream[stage['name']].add(owner_name)
+
+    # Order stages into levels in which all upstream stages belong to previous levels
+    levels = []
+    placed = set()
+    while len(placed) < len(stages):
+        level = [stage['name'] for stage in stages
+                 if stage['name'] not in placed and upstream[stage['name']].issubset(placed)]
+        if len(level) == 0:
+            cycle_names = ', '.join(stage['name'] for stage in stages if stage['name'] not in placed)
+            raise ValueError(f'Stages contain a dependency cycle: {cycle_names}')
+        levels.append(level)
+        placed.update(level)
+
+    # Read the previous pipeline state if it exists
+    if os.path.exists(state_file):
+        with open(state_file, 'r', encoding='utf-8') as state_reader:
+            state = json.load(state_reader)
+    else:
+        state = {'stages': {}, 'hash_cache': {}}
+    hash_cache = state['hash_cache']
+    force_stages = set(force_stages) if force_stages is not None else set()
+
+    # Define a function to determine the reasons that a stage must be rerun
+    def determine_reasons(stage, upstream_runs):
+        reasons = []
+        record = state['stages'].get(stage['name'])
+        input_hashes = {input_data: hash_dataset(input_data, hash_cache) for input_data in stage['inputs']}
+        if stage['name'] in force_stages:
+            reasons.append('forced')
+        if record is None:
+            reasons.append('no previous run')
+        else:
+            if record['script_hash'] != hash_dataset(stage['script'], hash_cache):
+                reasons.append('script changed')
+            if record['parameter_hash'] != hash_parameters(stage['parameters']):
+                reasons.append('parameters changed')
+            if record['interpreter'] != stage['interpreter']:
+                reasons.append('interpreter changed')
+            changed_inputs = [input_data for input_data in stage['inputs']
+                              if record['input_hashes'].get(input_data) != input_hashes[input_data]]
+            if len(changed_inputs) > 0:
+                reasons.append(f'{len(changed_inputs)} input(s) changed')
+        missing_outputs = [output_data for output_data in stage['outputs'] if not os.path.exists(output_data)]
+        if len(missing_outputs) > 0:
+            reasons.append(f'{len(missing_outputs)} output(s) missing')
+        if len(upstream_runs) > 0:
+            reasons.append('upstream ' + ', '.join(sorted(upstream_runs)) + ' will run')
+        missing_inputs = [input_data for input_data in stage['inputs']
+                          if input_hashes[input_data] is None
+                          and not any(is_within(input_data, output_data) or is_within(output_data, input_data)
+                                      for name in upstream[stage['name']]
+                                      for output_data in stage_dictionary[name]['outputs'])]
+        return reasons, input_hashes, missing_inputs
+
+    # Print plan without running stages if dry run is selected
+    status = {}
+    if dry_run:
+        print('Pipeline plan:')
+        for level_number, level in enumerate(levels, start=1):
+            print(f'\tLevel {level_number}:')
+            for name in level:
+                upstream_runs = [upstream_name for upstream_name in upstream[name] if status[upstream_name] == 'run']
+                reasons, input_hashes, missing_inputs = determine_reasons(stage_dictionary[name], upstream_runs)
+                status[name] = 'run' if len(reasons) > 0 else 'skip'
+                if len(reasons) > 0:
+                    print(f'\t\tRUN  {name} ({"; ".join(reasons)})')
+                else:
+                    print(f'\t\tSKIP {name}')
+                if len(missing_inputs) > 0:
+                    print(f'\t\t\t{len(missing_inputs)} input(s) do not exist and are not produced by an upstream stage (e.g., {missing_inputs[0]})')
+        print('----------')
+        return status
+
+    # Create log folder if it does not already exist
+    if not os.path.exists(log_folder):
+        os.makedirs(log_folder)
+
+    # Define the cores and memory to divide among running stages
+    runner_budget = read_compute_budget()
+    total_cores = cores if cores is not None else runner_budget['cores']
+    total_memory = memory_mb if memory_mb is not None else runner_budget['memory_mb']
+    memory_text = f'{total_memory} MB' if total_memory is not None else 'unknown memory'
+    print(f'Compute governor: dividing {total_cores} core(s) and {memory_text} among up to {max_workers} concurrent stage(s).')
+    print('----------')
+
+    # Run stages as their upstream stages complete
+    pipeline_start = time.time()
+    running = {}
+    budgets = {}
+    submitted_hashes = {}
+    ready_reasons = {}
+    alone_name = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while len(status) < len(stages):
+            # Identify stages for which all upstream stages have finished
+            ready = [name for level in levels for name in level
+                     if name not in status
+                     and name not in running.values()
+                     and all(upstream_name in status for upstream_name in upstream[name])]
+            launch = []
+            launch_reasons = {}
+            for name in ready:
+                stage = stage_dictionary[name]
+                # Delay stages while all workers are busy or that share a resource with a running stage
+                if len(running) + len(launch) >= max_workers:
+                    break
+                held_resources = set(resource for running_name in list(running.values()) + launch
+                                     for resource in stage_dictionary[running_name]['resources'])
+                if len(held_resources.intersection(stage['resources'])) > 0:
+                    continue
+                # Block stages for which an upstream stage did not complete
+                if any(status[upstream_name] in ('failed', 'blocked') for upstream_name in upstream[name]):
+                    print(f'Stage {name} is blocked by a failed upstream stage.')
+                    print('----------')
+                    status[name] = 'blocked'
+                    continue
+                # Skip stages that are up to date, reusing the reasons of stages that were delayed in a previous loop
+                if name not in ready_reasons:
+                    ready_reasons[name] = determine_reasons(stage, [])
+                reasons, input_hashes, missing_inputs = ready_reasons[name]
+                if len(reasons) == 0:
+                    print(f'Stage {name} is up to date.')
+                    print('----------')
+                    status[name] = 'skip'
+                    continue
+                # Delay all other stages while a stage that exceeds the memory budget runs alone
+                if alone_name in running.values():
+                    continue
+                # Delay stages while no core is free for them
+                free_cores = total_cores - sum(budget['cores'] for budget in budgets.values()) - len(launch)
+                if free_cores < 1 and len(running) + len(launch) > 0:
+                    continue
+                # Delay stages whose declared memory exceeds the memory that is not reserved by running stages
+                oversized = False
+                if stage['memory_mb'] is not None and total_memory is not None:
+                    reserved_memory = sum(stage_dictionary[running_name]['memory_mb'] or 0
+                                          for running_name in list(running.values()) + launch)
+                    if stage['memory_mb'] > total_memory - reserved_memory:
+                        if len(running) + len(launch) > 0:
+                            continue
+                        print(f'Stage {name} declares {stage["memory_mb"]} MB, which exceeds the memory budget of '
+                              f'{total_memory} MB; running it alone.')
+                        oversized = True
+                        alone_name = name
+                launch.append(name)
+                launch_reasons[name] = reasons
+                submitted_hashes[name] = input_hashes
+                if oversized:
+                    break
+
+            # Divide the free cores and memory evenly among the stages that start together
+            for launch_number, name in enumerate(launch):
+                stage = stage_dictionary[name]
+                free_cores = total_cores - sum(budget['cores'] for budget in budgets.values())
+                stage_cores = max(1, free_cores // (len(launch) - launch_number))
+                # Stages that declare memory receive it; other stages share the memory that is not reserved
+                if stage['memory_mb'] is not None:
+                    stage_memory = stage['memory_mb']
+                elif total_memory is not None:
+                    reserved_memory = sum(stage_dictionary[reserved_name]['memory_mb'] or 0
+                                          for reserved_name in set(list(budgets) + launch))
+                    stage_memory = int(max(total_memory - reserved_memory, 0) * stage_cores / total_cores)
+                else:
+                    stage_memory = None
+                budgets[name] = {'cores': stage_cores, 'memory_mb': stage_memory}
+                # Remove stale outputs so that output checks in the script do not skip work and submit the stage
+                print(f'Running stage {name} ({"; ".join(launch_reasons[name])})...')
+                stage_memory_text = f'{stage_memory} MB' if stage_memory is not None else 'unknown memory'
+                print(f'\tAllocated {stage_cores} core(s) and {stage_memory_text} '
+                      f'({max(free_cores, 0)} of {total_cores} core(s) free; {len(running)} stage(s) running)')
+                print('----------')
+                remove_outputs(stage)
+                future = executor.submit(execute_pipeline_stage, stage, os.path.join(log_folder, name + '.log'),
+                                         budgets[name])
+                running[future] = name
+
+            # Wait for a running stage to finish
+            if len(running) == 0:
+                continue
+            finished, not_finished = concurrent.futures.wait(list(running.keys()),
+                                                             return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                budgets.pop(name)
+                stage = stage_dictionary[name]
+                try:
+                    return_code, elapsed_time = future.result()
+                except Exception as error:
+                    print(f'Stage {name} could not be started: {error}')
+                    return_code, elapsed_time = -1, 0
+                missing_outputs = [output_data for output_data in stage['outputs'] if not os.path.exists(output_data)]
+                success_time = datetime.datetime.now()
+                if return_code == 0 and len(missing_outputs) == 0:
+                    # Record the state of the completed stage
+                    state['stages'][name] = {'script_hash': hash_dataset(stage['script'], hash_cache),
+                                             'parameter_hash': hash_parameters(stage['parameters']),
+                                             'interpreter': stage['interpreter'],
+                                             'input_hashes': submitted_hashes[name],
+                                             'completed': success_time.strftime('%Y-%m-%d %H:%M')}
+                    write_state(state)
+                    status[name] = 'run'
+                    print(f'Stage {name} completed at {success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=int(elapsed_time))})')
+                else:
+                    # Remove the state of the failed stage so that it is rerun
+                    state['stages'].pop(name, None)
+                    write_state(state)
+                    status[name] = 'failed'
+                    print(f'Stage {name} failed with exit code {return_code} and {len(missing_outputs)} missing output(s). See {os.path.join(log_folder, name + ".log")}.')
+                print('----------')
+
+    # Store hash cache for the next run
+    write_state(state)
+
+    # Report pipeline results
+    pipeline_elapsed = int(time.time() - pipeline_start)
+    status_counts = {value: list(status.values()).count(value) for value in ('run', 'skip', 'failed', 'blocked')}
+    print(f'Pipeline finished in {datetime.timedelta(seconds=pipeline_elapsed)}: '
+          f'{status_counts["run"]} run, {status_counts["skip"]} skipped, '
+          f'{status_counts["failed"]} failed, {status_counts["blocked"]} blocked.')
+    print('----------')
+
+    return status
@@ -2,22 +2,58 @@
 # ---------------------------------------------------------------------------
 # Initialization for Statistics Module
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-19
+# Last Updated: 2026-10-19
 # Usage: Individual functions have varying requirements. All functions that use arcpy must be executed in an Anaconda Python 3.8+ distribution.
-# Description: This initialization file imports modules in the package so that the contents are accessible.
+# Description: This initialization file imports each module in the package the first time one of its functions is accessed so that the contents are accessible without loading unused modules and their dependencies.
 # ---------------------------------------------------------------------------
 
-# Import functions from modules
-from package_Statistics.combineRandomForests import combine_random_forests
-from package_Statistics.computePredictionStatistics import compute_prediction_statistics
-from package_Statistics.convertToSelection import convert_to_selection
-from package_Statistics.determineOptimalThreshold import determine_optimal_threshold
-from package_Statistics.determineOptimalThreshold import test_presence_threshold
-from package_Statistics.innerCrossValidation import inner_cross_validation
-from package_Statistics.modelTrainTest import model_train_test
-from package_Statistics.outerCrossValidation import outer_cross_validation
-from package_Statistics.plotImportancesMDI import plot_importances_mdi
-from package_Statistics.predictHabitatSelection import predict_habitat_selection
-from package_Statistics.readTextValue import read_text_value
-from package_Statistics.trainExportClassifier import train_export_classifier
-from package_Statistics.writeModelReport import write_model_report
+# Import packages
+import importlib
+import sys
+
+# Define the module that contains each function
+function_modules = {'combine_random_forests': 'combineRandomForests',
+                    'predict_meta_forest': 'combineRandomForests',
+                    'read_meta_forest': 'combineRandomForests',
+                    'write_meta_forest': 'combineRandomForests',
+                    'compute_prediction_statistics': 'computePredictionStatistics',
+                    'convert_to_selection': 'convertToSelection',
+                    'determine_optimal_threshold': 'determineOptimalThreshold',
+                    'test_presence_threshold': 'determineOptimalThreshold',
+                    'evaluate_tree_sensitivity': 'evaluateTreeSensitivity',
+                    'inner_cross_validation': 'innerCrossValidation',
+                    'model_train_test': 'modelTrainTest',
+                    'outer_cross_validation': 'outerCrossValidation',
+                    'plot_importances_mdi': 'plotImportancesMDI',
+                    'plot_tree_sensitivity': 'plotTreeSensitivity',
+                    'predict_habitat_selection': 'predictHabitatSelection',
+                    'convert_selection_values': 'predictSelectionTiles',
+                    'predict_selection_tile': 'predictSelectionTiles',
+                    'predict_selection_tiles': 'predictSelectionTiles',
+                    'summarize_selection_tile': 'predictSelectionTiles',
+                    'summarize_selection_values': 'predictSelectionTiles',
+                    'read_text_value': 'readTextValue',
+                    'define_result_schema': 'resultStore',
+                    'read_result_store': 'resultStore',
+                    'write_result_partition': 'resultStore',
+                    'score_tree_subsets': 'scoreTreeSubsets',
+                    'train_export_classifier': 'trainExportClassifier',
+                    'write_model_report': 'writeModelReport'}
+__all__ = list(function_modules)
+
+# Import the module of a function when the function is first accessed
+def __getattr__(name):
+    if name not in function_modules:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    function = getattr(importlib.import_module(f'{__name__}.{function_modules[name]}'), name)
+    globals()[name] = function
+    return function
+
+# List all functions, including functions whose modules have not been imported
+def __dir__():
+    return sorted(set(globals()).union(function_modules))
+
+# Import all modules in Python 3.6, which does not support module attribute functions
+if sys.version_info < (3, 7):
+    for function_name in function_modules:
+        __getattr__(function_name)
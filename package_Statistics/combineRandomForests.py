@@ -2,39 +2,160 @@
 # ---------------------------------------------------------------------------
 # Combine Random Forests
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-18
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.8+ distribution.
-# Description: "Combine Random Forests" is a function that combines multiple independently trained random forest models with the same response and covariates into a single meta model.
+# Description: "Combine Random Forests" is a set of functions that combine multiple independently trained random forest models with the same response and covariates into a meta forest. The meta forest references the member models without copying their trees, predicts the tree-weighted mean of the member probabilities, which equals the probability of a single forest of all member trees, and is stored as a manifest of the member classifier files rather than as a joblib file of all trees.
 # ---------------------------------------------------------------------------
 
 # Create a function to combine random forest models
-def combine_random_forests(classifier_list):
+def combine_random_forests(classifier_list, classifier_files=None):
     """
-    Description: combines estimators from a list of random forest models
+    Description: combines a list of random forest models into a meta forest that references the member models
     Inputs: 'classifier_list' -- a list of trained random forest models
-    Returned Value: Returns a meta random forest model
-    Preconditions: requires a set of trained random forest models
+            'classifier_files' -- an optional list of the joblib files of the models in the order of the list, which is required to write the meta forest
+    Returned Value: Returns a meta forest dictionary of the member models ('members'), their files ('files'), their tree counts ('tree_counts'), the total tree count ('n_estimators'), the classes ('classes'), and the covariate names ('features')
+    Preconditions: requires a set of trained random forest models with the same classes and covariates; the member models are not copied, so changes to a member change the meta forest
     """
 
     # Import packages
-    import copy
+    import numpy as np
 
-    # Create a meta model
-    meta_classifier = copy.deepcopy(classifier_list[0])
+    # Check that the members can be combined
+    if len(classifier_list) == 0:
+        raise ValueError('At least one random forest model is required.')
+    if classifier_files is not None and len(classifier_files) != len(classifier_list):
+        raise ValueError('A classifier file is required for each random forest model.')
+    classes = classifier_list[0].classes_
+    features = getattr(classifier_list[0], 'feature_names_in_', None)
     count = 1
-    print(f'\t\tRandom forest model {str(count)} contains {str(classifier_list[count - 1].n_estimators)}.')
-    count += 1
-
-    # Loop through classifiers and add them to initial classifier
-    length = len(classifier_list)
-    while count <= length:
-        print(f'\t\tRandom forest model {str(count)} contains {str(classifier_list[count-1].n_estimators)}.')
-        meta_classifier.estimators_ += classifier_list[count-1].estimators_
-        meta_classifier.n_estimators = len(meta_classifier.estimators_)
+    for classifier in classifier_list:
+        if not np.array_equal(classifier.classes_, classes):
+            raise ValueError(f'Random forest model {count} does not have the classes of the first model.')
+        if classifier.n_features_in_ != classifier_list[0].n_features_in_:
+            raise ValueError(f'Random forest model {count} does not have the covariates of the first model.')
+        if features is not None and not np.array_equal(getattr(classifier, 'feature_names_in_', features), features):
+            raise ValueError(f'Random forest model {count} does not have the covariates of the first model.')
+        print(f'\t\tRandom forest model {str(count)} contains {str(len(classifier.estimators_))}.')
         count += 1
 
+    # Reference the member models without copying their trees
+    tree_counts = [len(classifier.estimators_) for classifier in classifier_list]
+    meta_forest = {'members': list(classifier_list),
+                   'files': list(classifier_files) if classifier_files is not None else None,
+                   'tree_counts': tree_counts,
+                   'n_estimators': sum(tree_counts),
+                   'classes': classes,
+                   'features': features}
+
     # Print number of estimators
-    print(f'\t\tRandom forest meta model contains {str(meta_classifier.n_estimators)} estimators.')
+    print(f'\t\tRandom forest meta model contains {str(meta_forest["n_estimators"])} estimators.')
+
+    # Return meta forest
+    return meta_forest
+
+# Create a function to predict class probabilities with a meta forest
+def predict_meta_forest(meta_forest, X_data, return_members=False):
+    """
+    Description: predicts class probabilities as the tree-weighted mean of the probabilities of the member models
+    Inputs: 'meta_forest' -- a meta forest from combine_random_forests or read_meta_forest
+            'X_data' -- a data frame or array of covariates in the order used to train the member models
+            'return_members' -- a boolean that selects whether the probabilities of each member are also returned
+    Returned Value: Returns an array of class probabilities with one row per observation and one column per class and, if return_members is True, an array of member probabilities with shape (member, observation, class)
+    Preconditions: the meta probabilities equal the probabilities of a single forest of all member trees within floating point rounding; member probabilities are only stored when requested
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Accumulate the tree-weighted member probabilities
+    meta_probability = None
+    member_probabilities = [] if return_members else None
+    for classifier, tree_count in zip(meta_forest['members'], meta_forest['tree_counts']):
+        member_probability = classifier.predict_proba(X_data)
+        if meta_probability is None:
+            meta_probability = member_probability * tree_count
+        else:
+            meta_probability += member_probability * tree_count
+        if return_members:
+            member_probabilities.append(member_probability)
+    meta_probability /= meta_forest['n_estimators']
+
+    if return_members:
+        return meta_probability, np.stack(member_probabilities)
+    return meta_probability
+
+# Create a function to write a meta forest manifest
+def write_meta_forest(meta_forest, output_manifest):
+    """
+    Description: writes a meta forest as a json manifest of its member classifier files
+    Inputs: 'meta_forest' -- a meta forest from combine_random_forests with classifier files
+            'output_manifest' -- a json file to store the manifest (e.g., 'meta_classifier.json')
+    Returned Value: Returns the manifest dictionary and stores the manifest on disk
+    Preconditions: the member models must already be stored in their classifier files; the size and modification time of each file are recorded so that changed members are detected when the manifest is read
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Check that the member files are known
+    if meta_forest['files'] is None:
+        raise ValueError('Classifier files are required to write a meta forest.')
+
+    # Describe each member file
+    members = []
+    for classifier_file, tree_count in zip(meta_forest['files'], meta_forest['tree_counts']):
+        file_stat = os.stat(classifier_file)
+        members.append({'file': os.path.abspath(classifier_file),
+                        'tree_count': tree_count,
+                        'size': file_stat.st_size,
+                        'mtime_ns': file_stat.st_mtime_ns})
+    manifest = {'n_estimators': meta_forest['n_estimators'],
+                'classes': [class_value.item() if hasattr(class_value, 'item') else class_value
+                            for class_value in meta_forest['classes']],
+                'features': list(meta_forest['features']) if meta_forest['features'] is not None else None,
+                'members': members}
+
+    # Write the manifest to a temporary file and move it into place so that interrupted writes do not leave partial manifests
+    with open(output_manifest + '.tmp', 'w') as manifest_writer:
+        json.dump(manifest, manifest_writer, indent=2)
+    os.replace(output_manifest + '.tmp', output_manifest)
+
+    return manifest
+
+# Create a function to read a meta forest manifest
+def read_meta_forest(input_manifest, n_jobs=None):
+    """
+    Description: reads a meta forest from a json manifest by loading each member classifier file once
+    Inputs: 'input_manifest' -- a json file written by write_meta_forest
+            'n_jobs' -- an optional number of jobs to assign to each member model for prediction
+    Returned Value: Returns a meta forest dictionary as from combine_random_forests
+    Preconditions: raises a ValueError if a member file changed since the manifest was written; members that share a file are loaded once and referenced by each entry
+    """
+
+    # Import packages
+    import joblib
+    import json
+    import os
+
+    # Read the manifest
+    with open(input_manifest, 'r') as manifest_reader:
+        manifest = json.load(manifest_reader)
+
+    # Load each member file once
+    loaded_members = {}
+    classifier_list = []
+    classifier_files = []
+    for member in manifest['members']:
+        file_stat = os.stat(member['file'])
+        if file_stat.st_size != member['size'] or file_stat.st_mtime_ns != member['mtime_ns']:
+            raise ValueError(f'{member["file"]} changed after the meta forest manifest was written.')
+        if member['file'] not in loaded_members:
+            classifier = joblib.load(member['file'])
+            if n_jobs is not None:
+                classifier.n_jobs = n_jobs
+            loaded_members[member['file']] = classifier
+        classifier_list.append(loaded_members[member['file']])
+        classifier_files.append(member['file'])
 
-    # Return combined estimators
-    return meta_classifier
+    return combine_random_forests(classifier_list, classifier_files)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Evaluate Tree Sensitivity
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution.
+# Description: "Evaluate Tree Sensitivity" is a function that calculates the AUC, accuracy, and optimal threshold of nested subsets of trees from the outer cross validation predictions of a single model fit and measures the corresponding prediction time of a trained classifier.
+# ---------------------------------------------------------------------------
+
+# Create a function to evaluate model performance and prediction time by number of trees
+def evaluate_tree_sensitivity(outer_results, classifier, tree_counts, predictor_all):
+    """
+    Description: calculates performance metrics and prediction time for nested subsets of trees
+    Inputs: 'outer_results' -- a data frame of outer cross validation results for a single iteration containing the response and a 'presence_n' column for each tree count
+            'classifier' -- a trained random forest classifier for the same iteration
+            'tree_counts' -- a list of tree counts that define the nested subsets of trees
+            'predictor_all' -- a list of the covariate names used by the classifier
+    Returned Value: Returns a data frame with one row per tree count containing the optimal threshold, sensitivity, specificity, auc, accuracy, prediction time, and prediction time relative to the measured prediction time of all trees of the classifier
+    Preconditions: requires outer cross validation results produced with tree_counts and a classifier that contains at least as many trees as the largest tree count
+    """
+
+    # Import packages
+    import pandas as pd
+
+    # Import functions from repository statistics package
+    from package_Statistics import determine_optimal_threshold
+    from package_Statistics import score_tree_subsets
+
+    # Measure prediction time of the trained classifier for each subset of trees and for all of its trees
+    tree_counts = sorted(set(tree_counts))
+    X_data = outer_results[predictor_all].astype(float)
+    _, time_subsets = score_tree_subsets(classifier, X_data, tree_counts + [len(classifier.estimators_)])
+    full_time = time_subsets[-1]
+
+    # Calculate performance metrics from the outer cross validation probabilities for each subset of trees
+    sensitivity_rows = []
+    count = 0
+    for tree_count in tree_counts:
+        threshold, sensitivity, specificity, auc, accuracy = determine_optimal_threshold(
+            outer_results[f'presence_{tree_count}'],
+            outer_results['response'])
+        sensitivity_rows.append({'tree_count': tree_count,
+                                 'threshold': threshold,
+                                 'sensitivity': sensitivity,
+                                 'specificity': specificity,
+                                 'auc': auc,
+                                 'accuracy': accuracy,
+                                 'predict_seconds': time_subsets[count],
+                                 'predict_fraction': time_subsets[count] / full_time})
+        count += 1
+
+    # Create a data frame of results
+    sensitivity_table = pd.DataFrame(sensitivity_rows)
+
+    return sensitivity_table
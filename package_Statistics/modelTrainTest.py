@@ -2,13 +2,14 @@
 # ---------------------------------------------------------------------------
 # Model Train and Test
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-18
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.8+ distribution.
 # Description: "Model Train and Test" is a function that contains a model train and test routine for a classification model with threshold optimization and cross validation.
 # ---------------------------------------------------------------------------
 
 # Create a function to train and test a classification model
-def model_train_test(classifier_params, iteration_data, outer_cv_splits, inner_cv_splits, rstate, threshold_file, output_classifier):
+def model_train_test(classifier_params, iteration_data, outer_cv_splits, inner_cv_splits, rstate, threshold_file, output_classifier,
+                     tree_counts=None):
     """
     Description: trains and tests a classification model
     Inputs: 'classifier_params' -- a set of parameters for a random forest classifier specified according to the sklearn API
@@ -16,6 +17,7 @@ def model_train_test(classifier_params, iteration_data, outer_cv_splits, inner_c
             'outer_cv_splits' -- a splitting method for the outer cross validation specified according to the sklearn API
             'inner_cv_splits' -- a splitting method for the inner cross validation specified according to the sklearn API
             'rstate' -- a random state value
+            'tree_counts' -- an optional list of tree counts for which to store outer test probabilities of nested subsets of trees
     Returned Value: Returns a trained classifier on disk, a threshold value on disk, a data frame of predictions, an AUC value, and an accuracy percentage
     Preconditions: requires a data frame of covariates and responses
     """
@@ -38,7 +40,8 @@ def model_train_test(classifier_params, iteration_data, outer_cv_splits, inner_c
     outer_results = outer_cross_validation(classifier_params,
                                            iteration_data,
                                            outer_cv_splits,
-                                           inner_cv_splits)
+                                           inner_cv_splits,
+                                           tree_counts)
 
     # Partition output results to presence-absence observed and predicted
     y_classify_observed = outer_results['response']
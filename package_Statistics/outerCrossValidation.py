@@ -2,18 +2,19 @@
 # ---------------------------------------------------------------------------
 # Classification Outer Cross Validation
 # Author: Timm Nawrocki
-# Last Updated: 2021-08-18
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.8+ distribution.
 # Description: "Classification Outer Cross Validation" is a function that conducts the outer cross validation routine for all partitions of a pre-defined outer cross validation set.
 # ---------------------------------------------------------------------------
 
-def outer_cross_validation(classifier_params, iteration_data, outer_cv_splits, inner_cv_splits):
+def outer_cross_validation(classifier_params, iteration_data, outer_cv_splits, inner_cv_splits, tree_counts=None):
     """
     Description: conducts outer cross validation iterations for a classification model
     Inputs: 'classifier_params' -- a set of parameters for a random forest classifier specified according to the sklearn API
             'train_iteration' -- a data frame of the inner cross validation partition
             'outer_cv_splits' -- a splitting method for the outer cross validation specified according to the sklearn API
             'inner_cv_splits' -- a splitting method for the inner cross validation specified according to the sklearn API
+            'tree_counts' -- an optional list of tree counts for which to store the outer test probabilities of nested subsets of trees as 'presence_n' columns
     Returned Value: Returns a plot on disk
     Preconditions: requires a classifier specification, a data frame of covariates and responses for a single iteration, an inner cross validation specification, and an outer cross validation specification
     """
@@ -29,6 +30,7 @@ def outer_cross_validation(classifier_params, iteration_data, outer_cv_splits, i
     from package_Statistics import inner_cross_validation
     from package_Statistics import determine_optimal_threshold
     from package_Statistics import convert_to_selection
+    from package_Statistics import score_tree_subsets
 
     # Define variable sets
     predictor_all = ['elevation', 'roughness', 'forest_edge', 'tundra_edge', 'alnus', 'betshr', 'dectre',
@@ -134,6 +136,11 @@ def outer_cross_validation(classifier_params, iteration_data, outer_cv_splits, i
         test_iteration = test_iteration.assign(absence=probability_prediction[:, 0])
         test_iteration = test_iteration.assign(presence=probability_prediction[:, 1])
 
+        # Predict nested subsets of trees from the same classifier if tree counts are specified
+        if tree_counts is not None:
+            presence_subsets, _ = score_tree_subsets(outer_classifier, X_test, tree_counts)
+            test_iteration = pd.concat([test_iteration, presence_subsets], axis=1)
+
         # Convert probability to presence-absence
         presence_zeros = np.zeros(test_iteration[presence[0]].shape)
         presence_zeros[test_iteration[presence[0]] >= threshold] = 1
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Plot Tree Sensitivity
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution.
+# Description: "Plot Tree Sensitivity" is a function that produces a plot of AUC, accuracy, optimal threshold, and relative prediction time by number of trees in a random forest.
+# ---------------------------------------------------------------------------
+
+# Create a function to plot model performance by number of trees
+def plot_tree_sensitivity(sensitivity_table, x_dimension, y_dimension, output_png, output_csv):
+    """
+    Description: produces and saves a plot of performance metrics and prediction time by number of trees
+    Inputs: 'sensitivity_table' -- a table of tree sensitivity results with a column for iteration, tree_count, auc, accuracy, threshold, and predict_fraction
+            'x_dimension' -- the width of the plot
+            'y_dimension' -- the height of the plot
+            'output_png' -- a png file in which to store the output plot
+            'output_csv' -- a csv file in which to store the summarized table
+    Returned Value: Returns a plot and table on disk
+    Preconditions: requires a table of tree sensitivity results from all iterations
+    """
+
+    # Import packages
+    import matplotlib.pyplot as plot
+    import pandas as pd
+
+    # Set initial plot size
+    fig_size = plot.rcParams["figure.figsize"]
+    fig_size[0] = x_dimension
+    fig_size[1] = y_dimension
+    plot.rcParams["figure.figsize"] = fig_size
+    plot.style.use('seaborn-paper')
+
+    # Group data by tree count and summarize mean and standard deviation
+    sensitivity_summary = sensitivity_table.groupby('tree_count', as_index=False).agg(
+        auc_mean=('auc', pd.DataFrame.mean),
+        auc_std=('auc', pd.DataFrame.std),
+        accuracy_mean=('accuracy', pd.DataFrame.mean),
+        accuracy_std=('accuracy', pd.DataFrame.std),
+        threshold_mean=('threshold', pd.DataFrame.mean),
+        threshold_std=('threshold', pd.DataFrame.std),
+        predict_fraction_mean=('predict_fraction', pd.DataFrame.mean)
+    )
+
+    # Plot the metrics and error bars by tree count
+    fig, axes = plot.subplots(1, 4)
+    metrics = [('auc', 'AUC'), ('accuracy', 'Accuracy'), ('threshold', 'Optimal threshold')]
+    count = 0
+    for metric, label in metrics:
+        axes[count].errorbar(sensitivity_summary['tree_count'],
+                             sensitivity_summary[f'{metric}_mean'],
+                             yerr=sensitivity_summary[f'{metric}_std'],
+                             marker='o',
+                             capsize=2)
+        axes[count].set_ylabel(label)
+        axes[count].set_xlabel('Number of trees')
+        count += 1
+    axes[3].plot(sensitivity_summary['tree_count'], sensitivity_summary['predict_fraction_mean'], marker='o')
+    axes[3].set_ylabel('Prediction time relative to full model')
+    axes[3].set_xlabel('Number of trees')
+    fig.suptitle('Model performance and prediction time by number of trees')
+    fig.tight_layout()
+
+    # Export figure
+    fig.savefig(output_png, bbox_inches="tight", dpi=300)
+
+    # Clear plot workspace
+    plot.clf()
+    plot.close()
+
+    # Export table
+    sensitivity_summary.to_csv(output_csv, header=True, index=False, sep=',', encoding='utf-8')
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Predict Selection Tiles
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with rasterio installed.
+# Description: "Predict Selection Tiles" is a set of functions that read covariate windows from a covariate cube tile by tile, predict a set of path selection functions on the cells with data, scale the predictions of each model with its presence range over all tiles determined in a first prediction pass, summarize the selection mean, confidence interval, and significance of each cell, and write the statistics of each tile as rasters without intermediate tables.
+# ---------------------------------------------------------------------------
+
+# Create a function to convert probability arrays to selection range values
+def convert_selection_values(presence, threshold, presence_range=None):
+    """
+    Description: converts an array of probabilistic presence predictions from 0 to 1 to a range from -1 to 1 using a threshold value
+    Inputs: 'presence' -- an array of probabilistic presence predictions
+            'threshold' -- the probability value to use as the conversion threshold
+            'presence_range' -- an optional tuple of the minimum and maximum presence predictions of the model over the study area; defaults to the minimum and maximum of the array
+    Returned Value: Returns an array of selection values
+    Preconditions: the positive and negative ranges are calculated from the presence range, as in convert_to_selection, so arrays that are parts of one prediction must share the presence range of the whole prediction
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Determine positive and negative ranges
+    if presence_range is None:
+        presence_range = (presence.min(), presence.max())
+    positive_range = presence_range[1] - threshold
+    negative_range = threshold - presence_range[0]
+
+    # Convert probabilities above and below the threshold to their ranges
+    selection = np.zeros(presence.shape, dtype='float64')
+    is_positive = presence > threshold
+    is_negative = presence < threshold
+    selection[is_positive] = (presence[is_positive] - threshold) / positive_range
+    selection[is_negative] = (presence[is_negative] - threshold) / negative_range
+
+    return selection
+
+# Create a function to compute statistics on arrays of selection means and standard deviations
+def summarize_selection_values(selection_mean, selection_std, model_count):
+    """
+    Description: computes the 95% confidence interval width and binary significance of selection predictions per cell
+    Inputs: 'selection_mean' -- an array of the mean selection value of each cell
+            'selection_std' -- an array of the sample standard deviation of the selection values of each cell
+            'model_count' -- the number of models that were predicted
+    Returned Value: Returns arrays of the confidence interval width and of the significance (1 for significant, 0 for not significant, and 999 for an interval that ends at zero)
+    Preconditions: uses the interval of compute_prediction_statistics
+    """
+
+    # Import packages
+    import math
+    import numpy as np
+
+    # Calculate 95% confidence intervals
+    interval = (1.95 * selection_std) / math.sqrt(model_count)
+    upper_value = selection_mean + interval
+    lower_value = selection_mean - interval
+
+    # Calculate significance
+    significance = np.full(selection_mean.shape, 999, dtype='int16')
+    significance[(upper_value > 0) & (lower_value < 0)] = 0
+    significance[((upper_value > 0) & (lower_value > 0)) | ((upper_value < 0) & (lower_value < 0))] = 1
+
+    return upper_value - lower_value, significance
+
+# Create a function to predict the presence of a tile
+def predict_selection_tile(covariate_cube, window, model_set, predictor_all, derived_predictors=None):
+    """
+    Description: predicts the presence probabilities of a set of path selection functions on the cells of a cube window that have data for all covariates
+    Inputs: 'covariate_cube' -- a covariate cube opened with open_covariate_cube
+            'window' -- a rasterio window on the grid of the cube
+            'model_set' -- a list of classifiers loaded in memory
+            'predictor_all' -- a list of the covariates of the classifiers in model order
+            'derived_predictors' -- an optional dictionary of covariates that are the sum of cube bands (e.g., {'picea': ['picgla', 'picmar']})
+    Returned Value: Returns None if the window has no cells with data or a dictionary of a float32 array of the presence of each model and cell with data ('presence') with shape (model, cell) and a boolean array of the cells with data on the window ('mask')
+    Preconditions: the presence of all models is held in memory, which requires four bytes per model and cell with data
+    """
+
+    # Import packages
+    import numpy as np
+    import pandas as pd
+    from package_GeospatialProcessing import read_cube_window
+
+    # Define the cube bands of each covariate
+    if derived_predictors is None:
+        derived_predictors = {}
+    predictor_bands = {predictor: derived_predictors.get(predictor, [predictor]) for predictor in predictor_all}
+    band_names = list(dict.fromkeys(band for bands in predictor_bands.values() for band in bands))
+
+    # Read the covariate window and drop cells without data for all covariates
+    band_values, band_mask = read_cube_window(covariate_cube, window, band_names)
+    data_mask = band_mask.all(axis=0)
+    if not data_mask.any():
+        return None
+    cell_values = {band: band_values[number][data_mask].astype('float64') for number, band in enumerate(band_names)}
+    X_data = pd.DataFrame({predictor: sum(cell_values[band] for band in bands)
+                           for predictor, bands in predictor_bands.items()})
+
+    # Predict the presence of each model
+    presence = np.empty((len(model_set), len(X_data)), dtype='float32')
+    for model_number, classifier in enumerate(model_set):
+        presence[model_number] = classifier.predict_proba(X_data)[:, 1]
+
+    return {'presence': presence, 'mask': data_mask}
+
+# Create a function to summarize the selection statistics of a tile
+def summarize_selection_tile(tile_presence, threshold_set, presence_ranges):
+    """
+    Description: converts the presence of each model on a tile to selection values and summarizes the selection mean, confidence interval width, and significance of each cell
+    Inputs: 'tile_presence' -- a dictionary of the presence and mask of a tile from predict_selection_tile
+            'threshold_set' -- a list of conversion thresholds in the order of the classifiers
+            'presence_ranges' -- a list of tuples of the minimum and maximum presence of each model over all tiles
+    Returned Value: Returns a dictionary of arrays on the window of the selection mean ('mean'), the confidence interval width ('ci'), and the significance ('significance') and a boolean array of the cells with data ('mask')
+    Preconditions: the selection mean and standard deviation are accumulated model by model so that memory use does not grow with the number of models
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Accumulate the selection mean and sum of squared deviations of the models
+    presence = tile_presence['presence']
+    data_mask = tile_presence['mask']
+    selection_mean = np.zeros(presence.shape[1])
+    squared_deviation = np.zeros(presence.shape[1])
+    for model_number, (threshold, presence_range) in enumerate(zip(threshold_set, presence_ranges), start=1):
+        selection = convert_selection_values(presence[model_number - 1], threshold, presence_range)
+        deviation = selection - selection_mean
+        selection_mean += deviation / model_number
+        squared_deviation += deviation * (selection - selection_mean)
+    selection_std = np.sqrt(squared_deviation / (len(threshold_set) - 1))
+    ci_width, significance = summarize_selection_values(selection_mean, selection_std, len(threshold_set))
+
+    # Place the cell statistics on the window
+    tile_statistics = {'mask': data_mask}
+    for statistic, cell_statistic in [('mean', selection_mean), ('ci', ci_width), ('significance', significance)]:
+        tile_statistic = np.zeros(data_mask.shape, dtype=cell_statistic.dtype)
+        tile_statistic[data_mask] = cell_statistic
+        tile_statistics[statistic] = tile_statistic
+
+    return tile_statistics
+
+# Create a function to predict selection statistics for all tiles of a covariate cube
+def predict_selection_tiles(cube_folder, model_set, threshold_set, predictor_all, output_folder, tile_size=None,
+                            derived_predictors=None):
+    """
+    Description: predicts a set of path selection functions tile by tile from a covariate cube and writes the selection mean, confidence interval width, and significance of each tile as rasters
+    Inputs: 'cube_folder' -- a folder that contains a covariate cube built with build_covariate_cube
+            'model_set' -- a list of classifiers loaded in memory
+            'threshold_set' -- a list of conversion thresholds in the order of the classifiers
+            'predictor_all' -- a list of the covariates of the classifiers in model order
+            'output_folder' -- a folder in which to store the 'mean', 'ci', and 'significance' rasters of each tile, the presence range of each model over the study area ('presence_ranges.json'), and the presence range of each tile that has not been summarized ('tile_ranges')
+            'tile_size' -- the number of rows and columns in a tile; defaults to the tile size of the cube so that each tile is read from one contiguous tile of the cube
+            'derived_predictors' -- an optional dictionary of covariates that are the sum of cube bands (e.g., {'picea': ['picgla', 'picmar']})
+    Returned Value: Returns a data frame with the tile name, number of predicted cells, and status of each tile
+    Preconditions: every tile is predicted once to determine the presence range of each model over the whole study area and predicted again to be summarized so that the selection values of all tiles share one scale and tiles do not have seams; only the minimum and maximum presence of each model are stored between the passes, so disk use does not grow with the number of cells at the cost of predicting each tile twice; an interrupted run resumes from the stored tile ranges and skips tiles whose range was removed after their rasters were written
+    """
+
+    # Import packages
+    import datetime
+    import json
+    import numpy as np
+    import os
+    import pandas as pd
+    import time
+    from rasterio.crs import CRS
+    from rasterio.windows import Window
+    from rasterio.windows import transform as window_transform
+    from package_GeospatialProcessing import open_covariate_cube
+    from package_GeospatialProcessing import write_raster_array
+
+    # Open covariate cube
+    covariate_cube = open_covariate_cube(cube_folder)
+    band_count, row_count, column_count = covariate_cube['shape']
+    if tile_size is None:
+        tile_size = covariate_cube['tile_size']
+    cube_crs = CRS.from_wkt(covariate_cube['index']['crs']) if covariate_cube['index']['crs'] is not None else None
+
+    # Define output rasters
+    output_types = {'mean': ('float32', -9999),
+                    'ci': ('float32', -9999),
+                    'significance': ('int16', -32768)}
+    for statistic in output_types:
+        os.makedirs(os.path.join(output_folder, statistic), exist_ok=True)
+
+    # Define the tiles of the cube
+    windows = [Window(column, row, min(tile_size, column_count - column), min(tile_size, row_count - row))
+               for row in range(0, row_count, tile_size)
+               for column in range(0, column_count, tile_size)]
+    tile_names = [f'Tile_{int(window.row_off // tile_size) + 1:03d}_{int(window.col_off // tile_size) + 1:03d}'
+                  for window in windows]
+    range_folder = os.path.join(output_folder, 'tile_ranges')
+    range_files = [os.path.join(range_folder, f'{tile_name}_range.json') for tile_name in tile_names]
+    ranges_file = os.path.join(output_folder, 'presence_ranges.json')
+
+    # Predict each tile and store only the presence range of each model so that the range over all tiles is known
+    if not os.path.exists(ranges_file):
+        os.makedirs(range_folder, exist_ok=True)
+        presence_minimum = np.full(len(model_set), np.inf)
+        presence_maximum = np.full(len(model_set), -np.inf)
+        count = 1
+        for window, range_file in zip(windows, range_files):
+            if os.path.exists(range_file):
+                with open(range_file, 'r') as range_reader:
+                    tile_range = json.load(range_reader)
+                if tile_range['cells'] > 0:
+                    presence_minimum = np.minimum(presence_minimum, tile_range['minimum'])
+                    presence_maximum = np.maximum(presence_maximum, tile_range['maximum'])
+                print(f'\tPresence range of tile {count} of {len(windows)} already determined.')
+                count += 1
+                continue
+
+            # Predict the tile
+            iteration_start = time.time()
+            tile_presence = predict_selection_tile(covariate_cube, window, model_set, predictor_all,
+                                                   derived_predictors)
+            if tile_presence is None:
+                tile_range = {'cells': 0, 'minimum': None, 'maximum': None}
+            else:
+                tile_range = {'cells': int(tile_presence['mask'].sum()),
+                              'minimum': tile_presence['presence'].min(axis=1).tolist(),
+                              'maximum': tile_presence['presence'].max(axis=1).tolist()}
+                presence_minimum = np.minimum(presence_minimum, tile_range['minimum'])
+                presence_maximum = np.maximum(presence_maximum, tile_range['maximum'])
+            tile_presence = None
+
+            # Store the range of the tile in a temporary file so that interrupted writes do not leave partial ranges
+            with open(range_file + '.temporary', 'w') as range_writer:
+                json.dump(tile_range, range_writer)
+            os.replace(range_file + '.temporary', range_file)
+            # Report success
+            iteration_end = time.time()
+            iteration_elapsed = int(iteration_end - iteration_start)
+            iteration_success_time = datetime.datetime.now()
+            print(f'\tPredicted presence range of {tile_range["cells"]} cells of tile {count} of {len(windows)} at '
+                  f'{iteration_success_time.strftime("%Y-%m-%d %H:%M")} '
+                  f'(Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+            count += 1
+
+        # Store the presence ranges once all tiles are predicted
+        with open(ranges_file + '.temporary', 'w') as ranges_writer:
+            json.dump({'minimum': presence_minimum.tolist(), 'maximum': presence_maximum.tolist()}, ranges_writer,
+                      indent=2)
+        os.replace(ranges_file + '.temporary', ranges_file)
+
+    # Read the presence ranges
+    with open(ranges_file, 'r') as ranges_reader:
+        presence_ranges = json.load(ranges_reader)
+    presence_ranges = list(zip(presence_ranges['minimum'], presence_ranges['maximum']))
+    if len(presence_ranges) != len(model_set):
+        raise ValueError(f'{ranges_file} does not describe the presence of {len(model_set)} models.')
+
+    # Predict and summarize each tile that has a stored range
+    tile_results = []
+    count = 1
+    for window, tile_name, range_file in zip(windows, tile_names, range_files):
+        output_rasters = {statistic: os.path.join(output_folder, statistic, f'{tile_name}_{statistic}.tif')
+                          for statistic in output_types}
+        if not os.path.exists(range_file):
+            print(f'\tTile {count} of {len(windows)} already summarized.')
+            tile_results.append([tile_name, np.nan, 'skipped'])
+            count += 1
+            continue
+
+        # Skip tiles without data
+        iteration_start = time.time()
+        with open(range_file, 'r') as range_reader:
+            cell_count = json.load(range_reader)['cells']
+        if cell_count == 0:
+            os.remove(range_file)
+            tile_results.append([tile_name, 0, 'no data'])
+            count += 1
+            continue
+
+        # Predict the tile again and summarize it with the presence ranges of all tiles
+        tile_presence = predict_selection_tile(covariate_cube, window, model_set, predictor_all, derived_predictors)
+        tile_statistics = summarize_selection_tile(tile_presence, threshold_set, presence_ranges)
+        tile_presence = None
+
+        # Write the statistics of the tile and remove its range so that it marks a complete tile
+        tile_profile = {'driver': 'GTiff',
+                        'crs': cube_crs,
+                        'transform': window_transform(window, covariate_cube['transform']),
+                        'height': int(window.height),
+                        'width': int(window.width)}
+        for statistic, (value_type, no_data) in output_types.items():
+            output_array = np.where(tile_statistics['mask'], tile_statistics[statistic], no_data)
+            write_raster_array(output_rasters[statistic], output_array, tile_profile, value_type, no_data)
+        os.remove(range_file)
+        tile_results.append([tile_name, cell_count, 'predicted'])
+        # Report success
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        print(f'\tSummarized {cell_count} cells of tile {count} of {len(windows)} at '
+              f'{iteration_success_time.strftime("%Y-%m-%d %H:%M")} '
+              f'(Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        count += 1
+    if os.path.isdir(range_folder) and len(os.listdir(range_folder)) == 0:
+        os.rmdir(range_folder)
+
+    return pd.DataFrame(tile_results, columns=['tile', 'cells', 'status'])
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Result Store
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution with pyarrow installed.
+# Description: "Result Store" is a set of functions that write model train and test results as parquet partitions with one explicit schema per table keyed by calf status and iteration and read slices of the partitioned results.
+# ---------------------------------------------------------------------------
+
+# Create a function to define the schema of a result store table
+def define_result_schema(table_name, columns):
+    """
+    Description: defines the explicit column types of a result store table so that all partitions share one schema
+    Inputs: 'table_name' -- the name of the result table ('outer_results' or 'importances')
+            'columns' -- the columns of a data frame of results, which determine the 'presence_n' tree subset columns of the outer results
+    Returned Value: Returns a pyarrow schema of the stored columns in table order
+    Preconditions: raises a ValueError for unknown tables; identifiers are stored as strings, counts and classes as int64, and covariates and probabilities as float64
+    """
+
+    # Import packages
+    import pyarrow as pa
+    import re
+
+    # Define the columns of each table
+    predictor_all = ['elevation', 'roughness', 'forest_edge', 'tundra_edge', 'alnus', 'betshr', 'dectre',
+                     'empnig', 'erivag', 'picea', 'rhoshr', 'salshr', 'sphagn', 'vaculi', 'vacvit', 'wetsed']
+    if table_name == 'outer_results':
+        fields = [('mooseYear_id', pa.string()),
+                  ('fullPath_id', pa.string()),
+                  ('calfStatus', pa.int64()),
+                  ('iteration_id', pa.int64()),
+                  ('outer_cv_split_n', pa.int64()),
+                  ('response', pa.int64())]
+        fields += [(predictor, pa.float64()) for predictor in predictor_all]
+        fields += [(column, pa.float64()) for column in ['absence', 'presence', 'prediction', 'selection']]
+        # Add the probabilities of nested subsets of trees in order of tree count
+        tree_columns = sorted((column for column in columns if re.fullmatch(r'presence_[0-9]+', str(column))),
+                              key=lambda column: int(column.split('_')[1]))
+        fields += [(column, pa.float64()) for column in tree_columns]
+    elif table_name == 'importances':
+        fields = [('covariate', pa.string()),
+                  ('importance', pa.float64())]
+    else:
+        raise ValueError(f'{table_name} is not a result store table.')
+
+    return pa.schema(fields)
+
+# Create a function to write a data frame to a result store partition
+def write_result_partition(store_folder, table_name, input_data, calf_status, iteration):
+    """
+    Description: writes a data frame as a typed parquet partition of a result store table
+    Inputs: 'store_folder' -- a folder that contains the result store
+            'table_name' -- the name of the result table (e.g., 'outer_results' or 'importances')
+            'input_data' -- a data frame of results for a single calf status and iteration
+            'calf_status' -- the calf status of the results
+            'iteration' -- the iteration number of the results
+    Returned Value: Returns the path to the parquet partition on disk
+    Preconditions: requires a data frame with the columns of the table schema from define_result_schema; other columns are not stored, missing values are stored as nulls of the column type, values that cannot be cast to the schema without loss raise an error, and existing partitions for the same calf status and iteration are replaced
+    """
+
+    # Import packages
+    import os
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Define partition folder using hive-style keys so that partitions can be filtered by folder name
+    partition_folder = os.path.join(store_folder,
+                                    table_name,
+                                    f'calf_status={int(calf_status)}',
+                                    f'iteration={int(iteration)}')
+    if not os.path.exists(partition_folder):
+        os.makedirs(partition_folder)
+    output_file = os.path.join(partition_folder, 'part-0.parquet')
+    temporary_file = output_file + '.tmp'
+
+    # Select the columns of the table schema; partition keys are stored in the folder names
+    schema = define_result_schema(table_name, input_data.columns)
+    missing_columns = [column for column in schema.names if column not in input_data.columns]
+    if len(missing_columns) > 0:
+        raise ValueError(f'Results for {table_name} do not contain {", ".join(missing_columns)}.')
+    output_data = input_data[schema.names].reset_index(drop=True)
+
+    # Convert values to the types of the schema
+    for field in schema:
+        if pa.types.is_string(field.type):
+            output_data[field.name] = output_data[field.name].astype(str)
+        else:
+            output_data[field.name] = pd.to_numeric(output_data[field.name])
+    output_table = pa.Table.from_pandas(output_data, schema=schema, preserve_index=False)
+
+    # Write partition to a temporary file and move it into place so that interrupted writes do not leave partial partitions
+    pq.write_table(output_table, temporary_file)
+    os.replace(temporary_file, output_file)
+
+    return output_file
+
+# Create a function to read a slice of a result store table
+def read_result_store(store_folder, table_name, calf_status=None, iterations=None, columns=None):
+    """
+    Description: reads a slice of a result store table filtered by calf status and iteration
+    Inputs: 'store_folder' -- a folder that contains the result store
+            'table_name' -- the name of the result table (e.g., 'outer_results' or 'importances')
+            'calf_status' -- an optional calf status to select
+            'iterations' -- an optional list of iteration numbers to select
+            'columns' -- an optional list of columns to read (partition keys 'calf_status' and 'iteration' may be included)
+    Returned Value: Returns a data frame of the selected results
+    Preconditions: requires a result store table written by write_result_partition
+    """
+
+    # Import packages
+    import os
+    import pyarrow.dataset as ds
+
+    # Open the partitioned table without reading data
+    dataset = ds.dataset(os.path.join(store_folder, table_name), format='parquet', partitioning='hive')
+
+    # Build a filter on the partition keys so that only matching partitions are read
+    row_filter = None
+    if calf_status is not None:
+        row_filter = ds.field('calf_status') == int(calf_status)
+    if iterations is not None:
+        iteration_filter = ds.field('iteration').isin([int(iteration) for iteration in iterations])
+        if row_filter is None:
+            row_filter = iteration_filter
+        else:
+            row_filter = row_filter & iteration_filter
+
+    # Read the selected columns and partitions
+    output_data = dataset.to_table(columns=columns, filter=row_filter).to_pandas()
+
+    return output_data
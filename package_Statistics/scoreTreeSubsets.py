@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Score Tree Subsets
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.8+ distribution.
+# Description: "Score Tree Subsets" is a function that predicts presence probabilities for nested subsets of trees (e.g., the first 10, 50, 100... trees) from a single trained random forest in one pass over the trees.
+# ---------------------------------------------------------------------------
+
+# Create a function to predict nested subsets of trees from a random forest
+def score_tree_subsets(classifier, X_data, tree_counts):
+    """
+    Description: predicts presence probabilities and prediction times for nested subsets of trees from a trained random forest
+    Inputs: 'classifier' -- a trained random forest classifier
+            'X_data' -- a data frame of covariates to predict
+            'tree_counts' -- a list of tree counts that define the nested subsets of trees (each subset contains the first n trees)
+    Returned Value: Returns a data frame of presence probabilities with one column per tree count and a list of cumulative prediction times in seconds for each tree count
+    Preconditions: requires a trained binary random forest classifier that contains at least as many trees as the largest tree count
+    """
+
+    # Import packages
+    import numpy as np
+    import pandas as pd
+    import time
+
+    # Sort tree counts and check that the classifier contains enough trees
+    tree_counts = sorted(set(tree_counts))
+    if tree_counts[-1] > len(classifier.estimators_):
+        raise ValueError(f'Classifier contains {len(classifier.estimators_)} trees but {tree_counts[-1]} were requested.')
+
+    # Convert covariates to the data type used internally by the trees
+    X_array = np.ascontiguousarray(np.asarray(X_data, dtype=np.float32))
+
+    # Accumulate tree predictions so that each subset is the mean of the first n trees
+    presence_sum = np.zeros(X_array.shape[0], dtype=np.float64)
+    presence_subsets = {}
+    time_subsets = []
+    elapsed_time = 0
+    tree_number = 1
+    for tree in classifier.estimators_[:tree_counts[-1]]:
+        tree_start = time.perf_counter()
+        presence_sum += tree.predict_proba(X_array, check_input=False)[:, 1]
+        elapsed_time += time.perf_counter() - tree_start
+        if tree_number in tree_counts:
+            presence_subsets[f'presence_{tree_number}'] = presence_sum / tree_number
+            time_subsets.append(elapsed_time)
+        tree_number += 1
+
+    # Create a data frame of subset probabilities
+    presence_data = pd.DataFrame(presence_subsets, index=getattr(X_data, 'index', None))
+
+    return presence_data, time_subsets